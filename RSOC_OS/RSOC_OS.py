@@ -1,28 +1,23 @@
 import sys
 import os
+import time
 import configparser
 import getpass
 import threading
 import keyboard
 from functools import partial
 
+STARTUP_BEGIN = time.perf_counter()
+
 from PySide6.QtWidgets import (
-    QApplication, QGraphicsOpacityEffect, QGridLayout, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton,
-    QHeaderView, QMenu, QMessageBox, QDialog, QFormLayout, QLineEdit, QDialogButtonBox
+    QApplication, QGraphicsOpacityEffect, QGridLayout, QStackedWidget, QWidget, QVBoxLayout, QHBoxLayout, QPushButton
 )
-from PySide6.QtGui import QAction
 from PySide6.QtCore import QEvent, Qt, QSize, QPropertyAnimation, QRect, QEasingCurve, QTimer
 
 from lib.utils import QIcon, QPixmap, tint_icon
 import lib.settings_window as settings_window
-from lib import sitreps_menu, websites
-from lib.bulletin_form import BulletinForm # type: ignore
-from lib.elt_details import get_elt_details_widget # type: ignore
-from lib.contact_directory import get_contact_directory_widget # type: ignore
-from lib.bolo_generator import get_bolo_generator_widget # type: ignore
-from lib.documents_widget import get_documents_widget # type: ignore
-from lib.folders_widget import FoldersWidget #type: ignore
-from lib.email_formats_widget import EmailFormatsWidget #type: ignore
+from lib import module_registry
+from lib.view_manager import ViewManager, DEFAULT_MAX_VIEWS, DEFAULT_MAX_MEMORY_MB
 
 CUSTOM_EXIT_EVENT = QEvent.Type(QEvent.registerEventType())
 
@@ -37,14 +32,9 @@ class RSOC_Dashboard(QWidget):
         self.config = configparser.ConfigParser()
         self.config.read('./config/settings.ini')
 
-        self.buttons_info = [
-            ("home.png", "Home"),
-            ("clipboard.png", "Clipboard"),
-            ("notes.png", "QuickNotes"),
-            ("alert.png", "Alerts"),
-            ("question.png", "UserGuide"),
-            ("settings.png", "Settings")
-        ]
+        self.buttons_info = module_registry.sidebar_modules()
+        self.resize_anim = QPropertyAnimation(self, b"geometry", self)
+        self.fade_anim = None
 
         self.load_theme()
         self.setup_ui()
@@ -66,22 +56,14 @@ class RSOC_Dashboard(QWidget):
         theme = self.config.get(self.current_user, 'theme', fallback='dark')
         icon_color = "#FFFFFF" if theme == "dark" else "#000000"
 
-        tooltip_names = {
-            "Home": "Dashboard",
-            "QuickNotes": "Quick Notes",
-            "Alerts": "Alerts Center",
-            "UserGuide": "User Guide",
-            "Settings": "Settings"
-        }
-
-        for icon_file, action_name in self.buttons_info:
+        for spec in self.buttons_info:
             btn = QPushButton()
-            btn.setIcon(tint_icon(f'images/{icon_file}', icon_color))
+            btn.setIcon(tint_icon(f'images/{spec.icon}', icon_color))
             btn.setIconSize(QSize(32, 32))
             btn.setFixedSize(50, 50)
             btn.setStyleSheet("border: none;")
-            btn.setToolTip(tooltip_names.get(action_name, action_name))
-            btn.clicked.connect(partial(self.handle_button_action, action_name))
+            btn.setToolTip(spec.label)
+            btn.clicked.connect(partial(self.handle_button_action, spec.key))
             self.sidebar_layout.addWidget(btn)
             self.sidebar_buttons.append(btn)
 
@@ -113,19 +95,7 @@ class RSOC_Dashboard(QWidget):
         title_widget.setFixedHeight(60)   # Lock TitleBox Height
 
         # ===== Grid Content =====
-        grid_layout = QGridLayout()
-        self.grid_buttons_info = [
-        ("Cameras", "OpenCameras"),
-        ("Sitreps", "OpenSitreps"),
-        ("Bulletin", "OpenBulletin"),
-        ("BOLO", "OpenBOLO"),
-        ("Folders", "OpenFolders"),
-        ("Documents", "OpenDocuments"),
-        ("Contact Directory", "OpenContacts"),
-        ("Email Formats", "OpenEmailFormats"),
-        ("Websites", "OpenWebsites"),
-        ("ELT Details", "OpenELTDetails")
-    ]
+        self.grid_buttons_info = module_registry.grid_modules()
 
         # ===== Outer vertical layout (Title + Main Content) =====
         outer_layout = QVBoxLayout()
@@ -137,12 +107,18 @@ class RSOC_Dashboard(QWidget):
         main_content_layout = QHBoxLayout()
         main_content_layout.addWidget(sidebar_widget)
 
-        # Create a container for dynamic content (grid + future features)
-        self.dynamic_content = QWidget()
-        self.dynamic_layout = QGridLayout()
-        self.dynamic_content.setLayout(self.dynamic_layout)
+        # Stack of tool views; recently used views stay alive for instant switching
+        self.dynamic_content = QStackedWidget()
+        self.view_manager = ViewManager(
+            self.dynamic_content,
+            max_views=self.config.getint(self.current_user, 'max_cached_views', fallback=DEFAULT_MAX_VIEWS),
+            max_memory_mb=self.config.getint(self.current_user, 'max_cached_view_mb', fallback=DEFAULT_MAX_MEMORY_MB)
+        )
 
+        self.home_view = QWidget()
+        self.dynamic_layout = QGridLayout(self.home_view)
         self.build_grid_buttons()
+        self.view_manager.show("Home", lambda: self.home_view, pinned=True)
 
         main_content_layout.addWidget(self.dynamic_content)
 
@@ -160,191 +136,69 @@ class RSOC_Dashboard(QWidget):
         theme = self.config.get(self.current_user, 'theme', fallback='dark')
         icon_color = "#FFFFFF" if theme == "dark" else "#000000"
 
-        for btn, (icon_file, _) in zip(self.sidebar_buttons, self.buttons_info):
-            btn.setIcon(tint_icon(f'images/{icon_file}', icon_color))
+        for btn, spec in zip(self.sidebar_buttons, self.buttons_info):
+            btn.setIcon(tint_icon(f'images/{spec.icon}', icon_color))
 
     # ==== BUTTON HANDLER ====
     def handle_button_action(self, action_name):
-        if action_name == "Settings":
-            settings_window.open_settings(self)
-        elif action_name == "Home":
+        if action_name == "Home":
             self.load_dashboard()
-        elif action_name == "QuickNotes":
-            self.load_quick_notes()
-        elif action_name == "Clipboard":
-            self.load_clipboard()
-        elif action_name == "Alerts":
-            self.load_alerts_center()
-        elif action_name == "OpenCameras":
-            self.load_camera_selector()
-        elif action_name == "OpenSitreps":
-            self.load_sitreps_menu()
-        elif action_name == "OpenBulletin":
-            self.show_bulletin_form()
-        elif action_name == "OpenWebsites":
-            self.load_websites()
-        elif action_name == "OpenELTDetails":
-            self.load_elt_details()
-        elif action_name == "OpenContacts":
-            self.load_contact_directory()
-        elif action_name == "OpenBOLO":
-            self.load_bolo_generator()
-        elif action_name == "OpenDocuments":
-            self.load_documents()
-        elif action_name == "OpenFolders":
-            self.load_folders()
-        elif action_name == "OpenEmailFormats":
-            self.load_email_formats()
-        else:
-            print(f"Action triggered: {action_name}")
-
-    # Add new Load Module functions below this line 
-     
-    def load_email_formats(self):
-        self.clear_content_area()
-        widget = EmailFormatsWidget()  
-        self.dynamic_layout.addWidget(widget)
-        self.animate_window_resize(QSize(400, 400))
-        self.animate_fade_in(widget)
+            return
 
-    def load_folders(self):
-        self.clear_content_area()
-        widget = FoldersWidget()
-        self.dynamic_layout.addWidget(widget)
-        self.animate_window_resize(QSize(740, 500))
-        self.animate_fade_in(widget)
-
-    def load_documents(self):
-        self.clear_content_area()
-        widget = get_documents_widget()
-        self.dynamic_layout.addWidget(widget)
-        self.animate_window_resize(QSize(600, 400))
-        self.animate_fade_in(widget)
-
-    def load_bolo_generator(self):
-        self.clear_content_area()
-        widget = get_bolo_generator_widget()
-        self.dynamic_layout.addWidget(widget)
-        self.animate_window_resize(QSize(900, 500))
-        self.animate_fade_in(widget)
-
-    def load_contact_directory(self):
-        self.clear_content_area()
-        widget = get_contact_directory_widget()
-        self.dynamic_layout.addWidget(widget)
-        self.animate_window_resize(QSize(1400, 500))  # adjust if needed
-        self.animate_fade_in(widget)
+        spec = module_registry.MODULES_BY_KEY.get(action_name)
+        if spec is None or not spec.loader:
+            print(f"Action triggered: {action_name}")
+            return
 
-    def load_elt_details(self):
-        self.clear_content_area()
-        from lib.elt_details import get_elt_details_widget  # type: ignore
-        widget = get_elt_details_widget(parent=self)
-        self.dynamic_layout.addWidget(widget)
-        self.animate_window_resize(QSize(1470, 800))
-        self.animate_fade_in(widget)
+        if spec.kind == "action":
+            module_registry.open_module(spec, self)
+        else:
+            self.load_module(spec)
 
-    def show_bulletin_form(self):
-        self.clear_content_area()
-        from lib.bulletin_form import get_bulletin_form_widget  # type: ignore
-        widget = get_bulletin_form_widget()
-        self.dynamic_layout.addWidget(widget)
-        self.animate_window_resize(QSize(400, 300))   # tweak size as you like
-        self.animate_fade_in(widget)
+    # New tools are added to MODULE_MANIFEST in lib/module_registry.py
+    def load_module(self, spec):
+        self.show_view(
+            spec.key, partial(module_registry.open_module, spec, self), spec.size,
+            cache=spec.cache, memory_mb=spec.memory_mb, reset=spec.reset_on_open
+        )
 
-    def load_camera_selector(self):
-        self.clear_content_area()
-        from lib.milestone_launcher import get_milestone_launcher_widget # type: ignore
-        widget = get_milestone_launcher_widget()
-        self.dynamic_layout.addWidget(widget)
-        self.animate_window_resize(QSize(400, 400))
+    def show_view(self, key, factory, size, cache=True, memory_mb=None, reset=False):
+        widget = self.view_manager.show(key, factory, cache=cache, memory_mb=memory_mb, reset=reset)
+        self.animate_window_resize(QSize(*size))
         self.animate_fade_in(widget)
+        return widget
 
     def load_websites(self):
-        self.clear_content_area()
-        selector = websites.get_website_selector_widget(parent=self)
-        self.dynamic_layout.addWidget(selector)
-        self.animate_window_resize(QSize(400, 400))
-        self.animate_fade_in(selector)
+        self.handle_button_action("OpenWebsites")
 
     def load_embedded_browser(self, url):
-        self.clear_content_area()
-        browser_widget = websites.get_webview_widget(url, back_callback=self.load_websites)
-        self.dynamic_layout.addWidget(browser_widget)
-        self.animate_window_resize(QSize(1600, 900))
-        self.animate_fade_in(browser_widget)
-
-
-    def load_sitreps_menu(self):
-        self.clear_content_area()
-        from lib import sitreps_menu
-        sitreps_widget = sitreps_menu.get_sitreps_menu_widget(self)
-        self.dynamic_layout.addWidget(sitreps_widget)
-        self.resize_with_animation(400, 400)
-        self.animate_fade_in(sitreps_widget)
-
-    def resize_with_animation(self, target_width, target_height):
-        from PySide6.QtCore import QPropertyAnimation, QRect, QEasingCurve
-
-        current_geometry = self.geometry()
-        target_geometry = QRect(
-            current_geometry.x(),
-            current_geometry.y(),
-            target_width,
-            target_height
+        from lib import websites
+        self.show_view(
+            f"Browser:{url}",
+            lambda: websites.get_webview_widget(url, back_callback=self.load_websites),
+            (1600, 900),
+            memory_mb=150
         )
 
-        self.resize_anim = QPropertyAnimation(self, b"geometry")
-        self.resize_anim.setDuration(500)
-        self.resize_anim.setStartValue(current_geometry)
-        self.resize_anim.setEndValue(target_geometry)
-        self.resize_anim.setEasingCurve(QEasingCurve.OutCubic)
-        self.resize_anim.start()
-
-
-    def load_alerts_center(self):
-        self.clear_content_area()
-        from lib import alerts_center
-        alerts_widget = alerts_center.get_alerts_widget(self)
-        self.dynamic_layout.addWidget(alerts_widget)
-        self.animate_window_resize(QSize(950, 600))
-        self.animate_fade_in(alerts_widget)
-
-    def load_clipboard(self):
-        self.clear_content_area()
-        from lib import clipboard_manager
-        clipboard_widget = clipboard_manager.get_clipboard_widget(self)
-        self.dynamic_layout.addWidget(clipboard_widget)
-        self.animate_window_resize(QSize(950, 600))
-        self.animate_fade_in(clipboard_widget)
-
-    def load_quick_notes(self):
-        self.clear_content_area()
-        from lib import quick_notes
-        notes_widget = quick_notes.get_quick_notes_widget(self)
-        self.dynamic_layout.addWidget(notes_widget)
-        self.animate_window_resize(QSize(900, 600))
-        self.animate_fade_in(notes_widget)
+    def resize_with_animation(self, target_width, target_height):
+        self.animate_window_resize(QSize(target_width, target_height))
 
     def animate_fade_in(self, widget, duration=500):
-        from PySide6.QtWidgets import QGraphicsOpacityEffect
-        from PySide6.QtCore import QPropertyAnimation
-
-        effect = QGraphicsOpacityEffect()
+        # The animation is owned by the effect, which the widget replaces (and deletes) on the next fade
+        effect = QGraphicsOpacityEffect(widget)
         widget.setGraphicsEffect(effect)
 
-        self.fade_anim = QPropertyAnimation(effect, b"opacity")
+        self.fade_anim = QPropertyAnimation(effect, b"opacity", effect)
         self.fade_anim.setDuration(duration)
         self.fade_anim.setStartValue(0)
         self.fade_anim.setEndValue(1)
-        self.resize_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self.fade_anim.setEasingCurve(QEasingCurve.OutCubic)
         self.fade_anim.start()
 
     def animate_window_resize(self, target_size, duration=500):
-        from PySide6.QtCore import QRect, QEasingCurve, QPropertyAnimation
-
         current_geometry = self.geometry()
 
-        self.resize_anim = QPropertyAnimation(self, b"geometry")
+        self.resize_anim.stop()
         self.resize_anim.setDuration(duration)
         self.resize_anim.setStartValue(current_geometry)
         self.resize_anim.setEndValue(QRect(
@@ -358,49 +212,22 @@ class RSOC_Dashboard(QWidget):
 
     def animate_dashboard_transition(self):
         # --- Fade-in Effect for Content Area ---
-        effect = QGraphicsOpacityEffect()
-        self.dynamic_content.setGraphicsEffect(effect)
-
-        self.fade_anim = QPropertyAnimation(effect, b"opacity")
-        self.fade_anim.setDuration(500)
-        self.fade_anim.setStartValue(0)
-        self.fade_anim.setEndValue(1)
-        self.fade_anim.start()
+        self.animate_fade_in(self.home_view)
 
         # --- Smooth Window Resize ---
-        current_geometry = self.geometry()
         self.layout().activate()
-        target_size = self.dynamic_content.sizeHint()
-
-        self.resize_anim = QPropertyAnimation(self, b"geometry")
-        self.resize_anim.setDuration(500)
-        self.resize_anim.setStartValue(current_geometry)
-        self.resize_anim.setEndValue(QRect(
-            current_geometry.x(),
-            current_geometry.y(),
-            target_size.width(),
-            target_size.height()
-        ))
-        self.resize_anim.setEasingCurve(QEasingCurve.OutCubic)
-        self.resize_anim.start()
+        self.animate_window_resize(self.home_view.sizeHint())
 
     def load_dashboard(self):
-        self.clear_content_area()
-        self.build_grid_buttons()
+        self.view_manager.show("Home", lambda: self.home_view)
         self.animate_dashboard_transition()
 
-    def clear_content_area(self):
-        for i in reversed(range(self.dynamic_layout.count())):
-            widget_to_remove = self.dynamic_layout.itemAt(i).widget()
-            if widget_to_remove:
-                widget_to_remove.setParent(None)
-
     def build_grid_buttons(self):
         positions = [(i,j) for i in range(4) for j in range(3)]
-        for position, (label, action_name) in zip(positions, self.grid_buttons_info):
-            btn = QPushButton(label)
+        for position, spec in zip(positions, self.grid_buttons_info):
+            btn = QPushButton(spec.label)
             btn.setFixedSize(150, 80)
-            btn.clicked.connect(partial(self.handle_button_action, action_name))
+            btn.clicked.connect(partial(self.handle_button_action, spec.key))
             self.dynamic_layout.addWidget(btn, *position)
 
     def toggle_window(self):
@@ -431,6 +258,31 @@ if __name__ == "__main__":
     window = RSOC_Dashboard()
     window.hide()  # Start hidden on launch
 
+    for line in module_registry.startup_report((time.perf_counter() - STARTUP_BEGIN) * 1000):
+        print(line)
+
+    # Background services are started once the event loop is running, so their
+    # imports (alert store, clipboard index, ...) don't delay the dashboard
+    def start_background_services():
+        from lib import alerts_engine
+        alerts_engine.start_alert_engine(window)
+
+        if window.config.getboolean(window.current_user, 'clipboard_history', fallback=False):
+            from lib.clipboard_history import set_clipboard_history_enabled
+            set_clipboard_history_enabled(True)
+
+        if window.config.getboolean(window.current_user, 'snippet_expansion', fallback=False):
+            from lib.text_expansion import set_snippet_expansion_enabled
+            set_snippet_expansion_enabled(True)
+
+    QTimer.singleShot(0, start_background_services)
+
+    def print_import_report():
+        for line in module_registry.import_report():
+            print(line)
+
+    app.aboutToQuit.connect(print_import_report)
+
     def handle_f7():
         app = QApplication.instance()
         if app:
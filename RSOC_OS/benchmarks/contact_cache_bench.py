@@ -0,0 +1,160 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+"""Contact directory load time: cold Excel parse vs warm binary cache.
+
+Also times how soon the first rows of a streamed load arrive, which is when
+the directory can first paint. Builds synthetic workbooks in a temp folder
+(needs openpyxl):
+
+    python benchmarks/contact_cache_bench.py
+"""
+
+import os
+import sys
+import time
+import random
+import string
+import tempfile
+from itertools import islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lib.contact_data import CONTACT_HEADERS, load_contacts, parse_workbook, stream_contacts
+
+ROW_COUNTS = [1_000, 5_000, 20_000]
+REPEATS = 3
+FIRST_ROWS = 100
+
+
+def random_contacts(count, rng):
+    def word(low, high):
+        return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(low, high))).title()
+
+    # Names, titles and companies repeat the way they do in a real directory
+    first_names = [word(3, 8) for _ in range(2_000)]
+    last_names = [word(4, 10) for _ in range(8_000)]
+    titles = [f"{word(5, 10)} {word(6, 12)}" for _ in range(300)]
+    companies = [word(4, 9) + " Inc" for _ in range(40)]
+    sites = [word(5, 10) for _ in range(25)]
+    rows = []
+    for _ in range(count):
+        first, last = rng.choice(first_names), rng.choice(last_names)
+        rows.append([
+            first, last, rng.choice(titles), rng.choice(companies),
+            f"{first}.{last}@example.com".lower(), f"{first}{rng.randint(1, 99)}@mail.com".lower(),
+            f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(0, 9999):04d}",
+            f"{rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(0, 9999):04d}",
+            rng.choice(sites), f"19{rng.randint(50, 99)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        ])
+    return rows
+
+
+def best_of(func):
+    best = float("inf")
+    for _ in range(REPEATS):
+        began = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - began)
+    return best * 1000
+
+
+def write_workbook(path, rows):
+    from openpyxl import Workbook  # type: ignore
+    book = Workbook(write_only=True)
+    sheet = book.create_sheet()
+    sheet.append(CONTACT_HEADERS)
+    for row in rows:
+        sheet.append(row)
+    book.save(path)
+
+
+def first_rows(workbook, cache):
+    _, rows, _, _, _ = stream_contacts(workbook, cache)
+    list(islice(rows, FIRST_ROWS))
+
+
+def main():
+    rng = random.Random(5)
+    print(f"{'rows':>8} {'workbook':>10} {'cold parse':>12} {'cold first':>11} "
+          f"{'warm cache':>12} {'warm first':>11} {'touched':>10} {'speed-up':>9}")
+
+    with tempfile.TemporaryDirectory() as folder:
+        for count in ROW_COUNTS:
+            workbook = os.path.join(folder, f"contacts_{count}.xlsx")
+            cache = os.path.join(folder, f"contacts_{count}.pickle")
+            write_workbook(workbook, random_contacts(count, rng))
+
+            cold_ms = best_of(lambda: parse_workbook(workbook))
+            # No cache yet, and the partial read never gets to write one
+            cold_first_ms = best_of(lambda: first_rows(workbook, cache))
+            load_contacts(workbook, cache)
+            warm_ms = best_of(lambda: load_contacts(workbook, cache))
+            warm_first_ms = best_of(lambda: first_rows(workbook, cache))
+
+            # mtime bumped by a sync client, content unchanged: revalidated by hash
+            def touched():
+                os.utime(workbook)
+                load_contacts(workbook, cache)
+            touched_ms = best_of(touched)
+
+            size_kb = os.path.getsize(workbook) / 1024
+            print(f"{count:>8,} {size_kb:>8.0f}KB {cold_ms:>10.1f}ms {cold_first_ms:>9.1f}ms "
+                  f"{warm_ms:>10.1f}ms {warm_first_ms:>9.1f}ms {touched_ms:>8.1f}ms {cold_ms / warm_ms:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+
+"""Caller lookup (reverse phone/email) latency on a large synthetic directory.
+
+Compares lib/contact_lookup.py with scanning every row's phone and email
+cells, and times keeping the index current through single-contact edits.
+Headless:
+
+    python benchmarks/contact_lookup_bench.py
+"""
+
+import os
+import sys
+import time
+import random
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from contact_cache_bench import random_contacts
+from lib.contact_data import CONTACT_HEADERS
+from lib.contact_lookup import ContactLookup, phone_digits
+
+ROWS = 50_000
+REPEATS = 50
+
+
+def naive_identify(rows, text):
+    query = text.strip().lower()
+    if "@" in query:
+        return [i for i, row in enumerate(rows) if query in row[4].lower() or query in row[5].lower()]
+    digits = phone_digits(query)
+    return [i for i, row in enumerate(rows) if digits in phone_digits(row[6]) or digits in phone_digits(row[7])]
+
+
+def time_call(func, *args):
+    samples = []
+    for _ in range(REPEATS):
+        began = time.perf_counter()
+        result = func(*args)
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples), len(result)
+
+
+def main():
+    rng = random.Random(11)
+    rows = random_contacts(ROWS, rng)
+
+    began = time.perf_counter()
+    lookup = ContactLookup(CONTACT_HEADERS)
+    lookup.add_many(enumerate(rows, 1))
+    print(f"{ROWS:,} contacts indexed in {time.perf_counter() - began:.2f}s\n")
+
+    sample = rng.choice(rows)
+    digits = phone_digits(sample[6])
+    queries = [
+        sample[6], "+1 " + sample[6], digits[-4:], digits[-7:], f"({digits[:3]}) {digits[3:6]}",
+        sample[4], "@" + sample[4].split("@")[1], sample[5],
+    ]
+    print(f"{'query':<28} {'hits':>7} {'index median':>13} {'naive median':>13}")
+    for query in queries:
+        median, hits = time_call(lookup.identify, query, 20)
+        naive = statistics.median(
+            (lambda b: (naive_identify(rows, query), (time.perf_counter() - b) * 1000)[1])(time.perf_counter())
+            for _ in range(3))
+        print(f"{query:<28} {hits:>7,} {median:>11.3f}ms {naive:>11.1f}ms")
+
+    # Edits: one contact's number changes, is added, or is removed
+    samples = []
+    for contact_id in rng.sample(range(1, ROWS + 1), REPEATS):
+        values = list(rows[contact_id - 1])
+        values[6] = f"({rng.randrange(200, 999)}) {rng.randrange(200, 999)}-{rng.randrange(10000):04d}"
+        began = time.perf_counter()
+        lookup.update(contact_id, values)
+        samples.append((time.perf_counter() - began) * 1000)
+    print(f"\nupdate one contact: median {statistics.median(samples):.3f}ms, max {max(samples):.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+"""Contact search latency on a large synthetic directory.
+
+Compares the token index in lib/contact_search.py with the old approach
+(lowercase every row and substring-test it on each query). Headless:
+
+    python benchmarks/contact_search_bench.py
+"""
+
+import os
+import sys
+import time
+import random
+import statistics
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from contact_cache_bench import random_contacts
+from lib.contact_data import CONTACT_HEADERS
+from lib.contact_search import ContactSearchIndex
+
+ROWS = 50_000
+REPEATS = 20
+
+
+def queries_for(rows, rng):
+    sample = rng.choice(rows)
+    first, last, _, company, email, _, phone, _, site, _ = sample
+    digits = "".join(ch for ch in phone if ch.isdigit())
+    return [
+        first[:1], first[:2], first[:4], first,
+        f"{first[:3]} {last[:3]}", last,
+        f"company:{company[:4]}", f"site:{site[:5]}", f"site:{site[:5]} {first[:2]}",
+        email.split("@")[0], digits[:6], "zzzzq",
+    ]
+
+
+def naive_search(texts, query):
+    words = query.lower().split()
+    return [i for i, text in enumerate(texts) if all(word in text for word in words)]
+
+
+def time_query(func, query):
+    samples = []
+    for _ in range(REPEATS):
+        began = time.perf_counter()
+        result = func(query)
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples), max(samples), len(result or [])
+
+
+def main():
+    rng = random.Random(9)
+    rows = random_contacts(ROWS, rng)
+
+    began = time.perf_counter()
+    index = ContactSearchIndex(CONTACT_HEADERS)
+    index.add_many(enumerate(rows, 1))
+    build_s = time.perf_counter() - began
+
+    # Second build just to measure memory; tracemalloc slows allocation down
+    tracemalloc.start()
+    measured = ContactSearchIndex(CONTACT_HEADERS)
+    measured.add_many(enumerate(rows, 1))
+    index_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    del measured
+    print(f"{ROWS:,} contacts indexed in {build_s:.2f}s, ~{index_mb:.0f} MB\n")
+
+    texts = ["\t".join(row).lower() for row in rows]
+    print(f"{'query':<24} {'hits':>7} {'index median':>13} {'index max':>10} {'naive median':>13}")
+    for query in queries_for(rows, rng):
+        median, worst, hits = time_query(index.search, query)
+        naive = statistics.median(
+            (lambda b: (naive_search(texts, query), (time.perf_counter() - b) * 1000)[1])(time.perf_counter())
+            for _ in range(3))
+        print(f"{query:<24} {hits:>7,} {median:>11.2f}ms {worst:>8.2f}ms {naive:>11.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
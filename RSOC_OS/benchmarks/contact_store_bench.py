@@ -0,0 +1,152 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+"""Resident memory and import time of the contact store vs the pandas path.
+
+Each variant runs in a fresh interpreter, streams a synthetic directory out
+of the contact cache the way the app loads it, and reports how much its
+import and the held contacts add to the process RSS:
+
+    store    lib/contact_store.ContactStore (what the directory holds)
+    lists    {ID: [str, ...]}, one list of strings per contact
+    pandas   DataFrame(...).astype(str), as the directory used to hold it
+
+Needs pandas for that row, and psutil on Windows:
+
+    python benchmarks/contact_store_bench.py
+"""
+
+import os
+import gc
+import sys
+import json
+import time
+import random
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from contact_cache_bench import random_contacts
+from lib.contact_data import CONTACT_HEADERS, ContactTable, open_cache, write_cache
+
+ROWS = 50_000
+VARIANTS = ("store", "lists", "pandas")
+
+
+def rss_mb():
+    try:
+        import psutil  # type: ignore
+        return psutil.Process().memory_info().rss / 1e6
+    except ImportError:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def measure(variant, cache, workbook):
+    """Runs in the child: load the cached rows into `variant`, print what it cost."""
+    before = rss_mb()
+    began = time.perf_counter()
+    if variant == "pandas":
+        import pandas as pd  # type: ignore
+    elif variant == "store":
+        from lib.contact_store import ContactStore
+    import_ms = (time.perf_counter() - began) * 1000
+    imported = rss_mb()
+
+    columns, rows, _, _ = open_cache(cache, workbook)
+    began = time.perf_counter()
+    if variant == "pandas":
+        contacts = pd.DataFrame(list(rows), columns=columns).astype(str)
+    elif variant == "store":
+        contacts = ContactStore(columns, enumerate(rows, 1))
+    else:
+        contacts = dict(enumerate(rows, 1))
+    build_ms = (time.perf_counter() - began) * 1000
+    gc.collect()
+    print(json.dumps({"import_ms": import_ms, "import_mb": imported - before,
+                      "build_ms": build_ms, "held_mb": rss_mb() - imported, "rows": len(contacts)}))
+
+
+def main():
+    if len(sys.argv) == 4:
+        measure(*sys.argv[1:])
+        return
+
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as folder:
+        workbook = os.path.join(folder, "contacts.xlsx")
+        cache = os.path.join(folder, "contacts.pickle")
+        # The cache only checks the workbook's stamp, so a stand-in file will do
+        with open(workbook, "wb") as file:
+            file.write(os.urandom(1024))
+        write_cache(cache, workbook, ContactTable(CONTACT_HEADERS, random_contacts(ROWS, rng)))
+
+        print(f"{ROWS:,} contacts\n")
+        print(f"{'variant':<8} {'import':>9} {'import RSS':>11} {'build':>9} {'held RSS':>9}")
+        for variant in VARIANTS:
+            child = subprocess.run([sys.executable, os.path.abspath(__file__), variant, cache, workbook],
+                                   capture_output=True, text=True)
+            if child.returncode:
+                print(f"{variant:<8} failed: {child.stderr.strip().splitlines()[-1]}")
+                continue
+            result = json.loads(child.stdout)
+            print(f"{variant:<8} {result['import_ms']:>7.0f}ms {result['import_mb']:>9.1f}MB "
+                  f"{result['build_ms']:>7.0f}ms {result['held_mb']:>7.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
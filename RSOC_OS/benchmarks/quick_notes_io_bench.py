@@ -0,0 +1,156 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+"""Disk I/O per minute of typing in Quick Notes.
+
+Compares the old autosave (rewrite the whole JSON file on every keystroke)
+with the debounced delta journal in lib/notes_journal.py. Typing is
+simulated on a virtual clock, so it runs in seconds and headless:
+
+    python benchmarks/quick_notes_io_bench.py
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import string
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lib.notes_journal import NoteJournal, SAVE_DEBOUNCE_MS, MAX_SAVE_DELAY_MS
+
+MINUTES = 5
+NOTE_SIZES = [2_000, 20_000, 200_000]
+
+
+def typing_session(rng):
+    """(seconds, key) pairs: ~250 keys/min in bursts, with pauses to think."""
+    events, now = [], 0.0
+    while now < MINUTES * 60:
+        for _ in range(rng.randint(5, 40)):
+            now += rng.uniform(0.08, 0.35)
+            key = "\b" if rng.random() < 0.08 else rng.choice(string.ascii_lowercase * 5 + "   \n.")
+            events.append((now, key))
+        now += rng.uniform(0.5, 6.0)
+    return events
+
+
+def type_key(text, cursor, key):
+    if key == "\b":
+        return (text[:cursor - 1] + text[cursor:], cursor - 1) if cursor else (text, cursor)
+    return text[:cursor] + key + text[cursor:], cursor + 1
+
+
+def run_legacy(folder, initial, events, rng):
+    path = os.path.join(folder, "legacy.json")
+    text, cursor = initial, rng.randint(0, len(initial))
+    writes = written = 0
+    began = time.perf_counter()
+    for _, key in events:
+        text, cursor = type_key(text, cursor, key)
+        payload = json.dumps({"note": text})
+        with open(path, 'w') as file:
+            file.write(payload)
+        writes += 1
+        written += len(payload.encode('utf-8'))
+    return writes, written, time.perf_counter() - began
+
+
+def run_journal(folder, initial, events, rng):
+    journal = NoteJournal(os.path.join(folder, "notes.json"), os.path.join(folder, "notes.journal"))
+    journal.text = initial
+    journal.compact()
+    journal.writes = journal.bytes_written = 0
+
+    text, cursor = initial, rng.randint(0, len(initial))
+    pending_since = due = None
+    began = time.perf_counter()
+    for now, key in events:
+        # Same policy as NotesAutosaver.schedule(), on the virtual clock
+        if due is not None and now >= due:
+            journal.save(text)
+            pending_since = due = None
+        text, cursor = type_key(text, cursor, key)
+        if pending_since is None:
+            pending_since = now
+        waited = now - pending_since
+        due = now + max(0.0, min(SAVE_DEBOUNCE_MS, MAX_SAVE_DELAY_MS - waited * 1000)) / 1000
+    journal.save(text)
+    journal.compact()   # flush on hide/quit
+    return journal.writes, journal.bytes_written, time.perf_counter() - began
+
+
+def main():
+    rng = random.Random(11)
+    events = typing_session(rng)
+    print(f"{len(events):,} keystrokes over {MINUTES} simulated minutes "
+          f"({len(events) / MINUTES:.0f}/min); figures are per minute\n")
+    print(f"{'note size':>10} {'mode':>8} {'writes':>8} {'KB written':>11} {'I/O time':>10}")
+
+    with tempfile.TemporaryDirectory() as folder:
+        for size in NOTE_SIZES:
+            initial = "".join(rng.choice(string.ascii_lowercase + " \n") for _ in range(size))
+            for label, runner in (("legacy", run_legacy), ("journal", run_journal)):
+                writes, written, elapsed = runner(folder, initial, events, random.Random(size))
+                print(f"{size:>10,} {label:>8} {writes / MINUTES:>8.0f} "
+                      f"{written / 1024 / MINUTES:>11.1f} {elapsed * 1000 / MINUTES:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
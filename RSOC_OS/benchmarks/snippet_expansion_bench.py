@@ -0,0 +1,139 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+"""Per-keystroke cost of snippet trigger matching.
+
+Runs headless (no Qt, no keyboard hook):
+
+    python benchmarks/snippet_expansion_bench.py
+"""
+
+import os
+import sys
+import time
+import random
+import string
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lib.trigger_matcher import TriggerAutomaton, TriggerMatcher
+
+KEYSTROKES = 200_000
+SNIPPET_COUNTS = [10, 100, 1_000, 10_000]
+
+
+def random_triggers(count, rng):
+    triggers = set()
+    while len(triggers) < count:
+        triggers.add(";" + "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 6))))
+    return sorted(triggers)
+
+
+def typed_text(rng):
+    # Mostly prose, with the odd ';' so the automaton leaves the root state
+    alphabet = string.ascii_lowercase * 4 + "    ;"
+    return [rng.choice(alphabet) for _ in range(KEYSTROKES)]
+
+
+def time_per_key(func, keys):
+    began = time.perf_counter()
+    for ch in keys:
+        func(ch)
+    return (time.perf_counter() - began) / len(keys) * 1e9
+
+
+def naive_matcher(triggers):
+    """Reference: test every trigger against the tail of the buffer on each key."""
+    longest = max(len(t) for t in triggers)
+    state = {"buffer": ""}
+
+    def feed(ch):
+        buffer = (state["buffer"] + ch)[-longest:]
+        state["buffer"] = buffer
+        for trigger in triggers:
+            if buffer.endswith(trigger):
+                state["buffer"] = ""
+                return trigger
+        return None
+    return feed
+
+
+def main():
+    rng = random.Random(7)
+    keys = typed_text(rng)
+    baseline = time_per_key(lambda ch: None, keys)
+    print(f"{KEYSTROKES:,} keystrokes; empty callback costs {baseline:.0f} ns/key\n")
+    print(f"{'snippets':>9} {'build':>10} {'automaton':>12} {'naive scan':>12}")
+
+    for count in SNIPPET_COUNTS:
+        triggers = random_triggers(count, rng)
+
+        began = time.perf_counter()
+        automaton = TriggerAutomaton(triggers)
+        build_ms = (time.perf_counter() - began) * 1000
+
+        matcher = TriggerMatcher(automaton)
+        automaton_ns = time_per_key(matcher.feed, keys) - baseline
+
+        naive = naive_matcher(triggers)
+        naive_keys = keys[: max(KEYSTROKES // count, 2_000)]
+        naive_ns = time_per_key(naive, naive_keys) - baseline
+
+        print(f"{count:>9,} {build_ms:>8.1f}ms {automaton_ns:>9.0f} ns {naive_ns:>9.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import getpass
+import datetime
+
+from PySide6.QtWidgets import (
+    QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+)
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QPainter, QColor
+
+from lib.alert_metrics import get_alert_metrics, INTERVALS, SLO_SECONDS
+
+USERNAME = getpass.getuser()
+
+URGENCY_COLORS = {"Low": "#2980b9", "Normal": "#f39c12", "High": "#c0392b", "All": "#7f8c8d"}
+
+# Upper bounds (seconds) of the histogram buckets; the last bucket is open-ended
+HISTOGRAM_BUCKETS = [0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 30.0]
+
+
+def format_seconds(value):
+    if value is None:
+        return "—"
+    if abs(value) < 1:
+        return f"{value * 1000:.0f} ms"
+    return f"{value:.2f} s"
+
+
+def bucket_label(index):
+    if index == len(HISTOGRAM_BUCKETS):
+        return f">{format_seconds(HISTOGRAM_BUCKETS[-1])}"
+    return f"≤{format_seconds(HISTOGRAM_BUCKETS[index])}"
+
+
+# ===== Histogram =====
+class LatencyHistogram(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.color = QColor(URGENCY_COLORS["All"])
+        self.setMinimumHeight(160)
+
+    def set_values(self, values, color):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        for value in values:
+            index = 0
+            while index < len(HISTOGRAM_BUCKETS) and value > HISTOGRAM_BUCKETS[index]:
+                index += 1
+            self.counts[index] += 1
+        self.color = QColor(color)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self.rect().adjusted(8, 8, -8, -24)
+        peak = max(self.counts) or 1
+        slot = rect.width() / len(self.counts)
+        metrics = painter.fontMetrics()
+
+        for index, count in enumerate(self.counts):
+            x = rect.left() + int(index * slot)
+            width = max(int(slot) - 6, 1)
+            height = int(rect.height() * count / peak)
+            painter.fillRect(QRect(x, rect.bottom() - height, width, height), self.color)
+            if count:
+                painter.drawText(QRect(x, rect.bottom() - height - metrics.height(), width, metrics.height()),
+                                 Qt.AlignCenter, str(count))
+            painter.drawText(QRect(x - 4, rect.bottom() + 4, width + 8, metrics.height()),
+                             Qt.AlignCenter, bucket_label(index))
+
+
+# ===== Diagnostics Dialog =====
+def open_diagnostics_dialog(parent_widget):
+    metrics = get_alert_metrics()
+
+    dialog = QDialog(parent_widget)
+    dialog.setWindowTitle("Alert Timing Diagnostics")
+    dialog.setMinimumSize(640, 520)
+    layout = QVBoxLayout(dialog)
+
+    slo_label = QLabel()
+    slo_label.setStyleSheet("font-weight: bold;")
+    layout.addWidget(slo_label)
+
+    table = QTableWidget()
+    table.setColumnCount(6)
+    table.setHorizontalHeaderLabels(["Measure", "Urgency", "Samples", "p50", "p95", "p99"])
+    table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    table.verticalHeader().setVisible(False)
+    table.setEditTriggers(QTableWidget.NoEditTriggers)
+    layout.addWidget(table)
+
+    histogram_bar = QHBoxLayout()
+    histogram_bar.addWidget(QLabel("Histogram:"))
+    interval_input = QComboBox()
+    interval_input.addItems(list(INTERVALS))
+    urgency_input = QComboBox()
+    urgency_input.addItems(["All", "Low", "Normal", "High"])
+    histogram_bar.addWidget(interval_input)
+    histogram_bar.addWidget(urgency_input)
+    histogram_bar.addStretch()
+    layout.addLayout(histogram_bar)
+
+    histogram = LatencyHistogram()
+    layout.addWidget(histogram)
+
+    button_layout = QHBoxLayout()
+    refresh_btn = QPushButton("Refresh")
+    export_btn = QPushButton("Export CSV")
+    clear_btn = QPushButton("Clear")
+    close_btn = QPushButton("Close")
+    button_layout.addWidget(refresh_btn)
+    button_layout.addWidget(export_btn)
+    button_layout.addWidget(clear_btn)
+    button_layout.addStretch()
+    button_layout.addWidget(close_btn)
+    layout.addLayout(button_layout)
+
+    def refresh_histogram():
+        urgency = urgency_input.currentText()
+        values = metrics.values(interval_input.currentText(), None if urgency == "All" else urgency)
+        histogram.set_values(values, URGENCY_COLORS[urgency])
+
+    def refresh():
+        total = len(metrics.values("Fire lateness"))
+        breaches = len(metrics.slo_breaches())
+        slo_label.setText(f"{total - breaches} of {total} fires detected within "
+                          f"{format_seconds(SLO_SECONDS)} of schedule ({breaches} late)")
+
+        rows = [(interval, urgency, stats)
+                for interval, by_urgency in metrics.summary().items()
+                for urgency, stats in by_urgency.items()]
+        table.setRowCount(len(rows))
+        for row, (interval, urgency, (count, p50, p95, p99)) in enumerate(rows):
+            cells = [interval, urgency, str(count), format_seconds(p50), format_seconds(p95), format_seconds(p99)]
+            for col, text in enumerate(cells):
+                table.setItem(row, col, QTableWidgetItem(text))
+        refresh_histogram()
+
+    def export():
+        default = f"alert_timing_{USERNAME}_{datetime.datetime.now():%Y%m%d_%H%M}.csv"
+        path, _ = QFileDialog.getSaveFileName(dialog, "Export Alert Timing", default, "CSV Files (*.csv)")
+        if not path:
+            return
+        try:
+            metrics.export_csv(path)
+        except OSError as e:
+            QMessageBox.warning(dialog, "Export Failed", str(e))
+
+    def clear():
+        metrics.clear()
+        refresh()
+
+    interval_input.currentIndexChanged.connect(refresh_histogram)
+    urgency_input.currentIndexChanged.connect(refresh_histogram)
+    refresh_btn.clicked.connect(refresh)
+    export_btn.clicked.connect(export)
+    clear_btn.clicked.connect(clear)
+    close_btn.clicked.connect(dialog.close)
+
+    refresh()
+    dialog.exec()
@@ -0,0 +1,219 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import csv
+import time
+import threading
+import itertools
+from collections import deque, OrderedDict
+
+# Latency instrumentation for the alert pipeline (no Qt, no disk access
+# except export_csv). Each fire gets a sample that is stamped as it moves
+# through the pipeline:
+#
+#   scheduled -> detected (scheduler woke up) -> sound / popup -> acknowledged
+#
+# All stamps are epoch seconds so samples can be exported and compared
+# across runs.
+
+DEFAULT_CAPACITY = 2000       # fires kept for the percentile views
+SLO_SECONDS = 1.0             # target for scheduled -> detected lateness
+
+STAGES = ("detected", "sound", "popup", "acknowledged")
+URGENCIES = ("Low", "Normal", "High")
+
+# Measured intervals shown in diagnostics: name -> (from stage, to stage)
+INTERVALS = OrderedDict([
+    ("Fire lateness", ("scheduled", "detected")),
+    ("Popup delay", ("scheduled", "popup")),
+    ("Sound delay", ("scheduled", "sound")),
+    ("Acknowledge time", ("popup", "acknowledged")),
+])
+
+CSV_FIELDS = ["fire_id", "alert_id", "title", "urgency", "scheduled"] + list(STAGES)
+
+
+class FireSample:
+    __slots__ = ("fire_id", "alert_id", "title", "urgency", "scheduled",
+                 "detected", "sound", "popup", "acknowledged")
+
+    def __init__(self, fire_id, alert_id, title, urgency, scheduled, detected):
+        self.fire_id = fire_id
+        self.alert_id = alert_id
+        self.title = title
+        self.urgency = urgency
+        self.scheduled = scheduled
+        self.detected = detected
+        self.sound = None
+        self.popup = None
+        self.acknowledged = None
+
+    def interval(self, start, end):
+        a, b = getattr(self, start), getattr(self, end)
+        if a is None or b is None:
+            return None
+        return b - a
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class AlertMetrics:
+    """Bounded ring buffer of FireSamples, safe to stamp from any thread."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, clock=time.time):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=capacity)
+        self._by_id = {}
+        self._ids = itertools.count(1)
+
+    def begin(self, alert, scheduled, detected=None):
+        """Open a sample for one fire and return its fire id.
+
+        `scheduled` is a datetime or epoch seconds."""
+        if hasattr(scheduled, "timestamp"):
+            scheduled = scheduled.timestamp()
+        with self._lock:
+            fire_id = next(self._ids)
+            sample = FireSample(fire_id, alert.get("id"), alert.get("title", ""),
+                                alert.get("urgency", "Normal"), scheduled,
+                                detected if detected is not None else self.clock())
+            if len(self._samples) == self._samples.maxlen:
+                self._by_id.pop(self._samples[0].fire_id, None)
+            self._samples.append(sample)
+            self._by_id[fire_id] = sample
+            return fire_id
+
+    def mark(self, fire_id, stage, when=None):
+        """Stamp a stage; only the first stamp of each stage is kept."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage: {stage}")
+        with self._lock:
+            sample = self._by_id.get(fire_id)
+            if sample is not None and getattr(sample, stage) is None:
+                setattr(sample, stage, when if when is not None else self.clock())
+
+    def mark_all(self, fire_ids, stage, when=None):
+        when = when if when is not None else self.clock()
+        for fire_id in fire_ids:
+            self.mark(fire_id, stage, when)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._by_id.clear()
+
+    def samples(self):
+        with self._lock:
+            return list(self._samples)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._samples)
+
+    # ===== Reporting =====
+    def values(self, interval, urgency=None):
+        start, end = INTERVALS[interval]
+        values = []
+        for sample in self.samples():
+            if urgency is not None and sample.urgency != urgency:
+                continue
+            value = sample.interval(start, end)
+            if value is not None:
+                values.append(value)
+        return sorted(values)
+
+    def summary(self):
+        """{interval: {urgency or "All": (count, p50, p95, p99)}}"""
+        report = OrderedDict()
+        for interval in INTERVALS:
+            rows = OrderedDict()
+            for urgency in URGENCIES + (None,):
+                values = self.values(interval, urgency)
+                rows[urgency or "All"] = (len(values), percentile(values, 50),
+                                          percentile(values, 95), percentile(values, 99))
+            report[interval] = rows
+        return report
+
+    def slo_breaches(self, threshold=SLO_SECONDS):
+        return [s for s in self.samples()
+                if s.detected is not None and s.detected - s.scheduled > threshold]
+
+    def export_csv(self, path):
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(CSV_FIELDS)
+            for sample in self.samples():
+                writer.writerow([getattr(sample, field) for field in CSV_FIELDS])
+        return path
+
+
+# ===== Shared Instance =====
+_metrics = None
+_metrics_lock = threading.Lock()
+
+def get_alert_metrics():
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = AlertMetrics()
+        return _metrics
@@ -0,0 +1,332 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import queue
+import datetime
+import threading
+
+from PySide6.QtWidgets import (
+    QApplication, QWidget, QScrollArea, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+)
+from PySide6.QtCore import QTimer, Qt, QObject, Signal
+
+from lib.alert_metrics import get_alert_metrics
+
+URGENCY_COLORS = {"Low": "#2980b9", "Normal": "#f39c12", "High": "#c0392b"}
+URGENCY_RANK = {"Low": 0, "Normal": 1, "High": 2}
+
+COALESCE_MS = 750                                      # alerts arriving within this window share one panel update and one sound
+HIGH_URGENCY_REPEAT = datetime.timedelta(minutes=2)    # a repeating High alert sounds at most this often
+
+
+# ===== Audio Backends =====
+class NullAudioBackend:
+    """Silent backend for Linux / headless runs."""
+
+    def play(self, urgency, on_played=None):
+        if on_played is not None:
+            on_played()
+
+
+class WinsoundBackend:
+    """Plays Windows system sounds from a dedicated thread so callers never block."""
+
+    def __init__(self):
+        import winsound
+        self._winsound = winsound
+        # Resolved once up front instead of on every alert
+        self._sounds = {
+            "Low": winsound.MB_ICONASTERISK,
+            "Normal": winsound.MB_ICONEXCLAMATION,
+            "High": winsound.MB_ICONHAND,
+        }
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def play(self, urgency, on_played=None):
+        self._queue.put((urgency, on_played))
+
+    def _run(self):
+        while True:
+            urgency, on_played = self._queue.get()
+            sound = self._sounds.get(urgency)
+            try:
+                if sound is None:
+                    self._winsound.MessageBeep()
+                else:
+                    self._winsound.MessageBeep(sound)
+            except RuntimeError as e:
+                print(f"[SOUND] Could not play alert sound: {e}")
+                continue
+            if on_played is not None:
+                on_played()
+
+
+def get_audio_backend():
+    try:
+        return WinsoundBackend()
+    except ImportError:
+        return NullAudioBackend()
+
+
+# ===== Notification Center =====
+class NotificationCenter(QObject):
+    """Queues fired alerts and shows them in one non-modal stacked panel.
+
+    Alerts that arrive together (e.g. the 06:00 / 14:00 / 22:00 shift-change
+    burst) are coalesced into a single panel update with a single sound at
+    the highest urgency in the burst. An alert that fires again while its
+    previous fire is still unacknowledged is folded into the existing row,
+    and repeated High alerts only sound once per HIGH_URGENCY_REPEAT.
+    """
+
+    alert_acknowledged = Signal(dict)
+
+    def __init__(self, audio_backend=None, metrics=None, parent=None):
+        super().__init__(parent)
+        self.audio = audio_backend or get_audio_backend()
+        self.metrics = metrics or get_alert_metrics()
+        self.pending = []
+        self.last_sounded = {}   # alert id -> when it last made a sound
+        self.open_fires = {}     # alert id -> fire ids shown but not yet acknowledged
+        self.panel = None
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def enqueue(self, alert):
+        self.pending.append((alert, datetime.datetime.now()))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start(COALESCE_MS)
+
+    def flush(self):
+        burst, self.pending = self.pending, []
+        if not burst:
+            return
+
+        if self.panel is None:
+            self.panel = AlertStackPanel()
+            self.panel.acknowledged.connect(self.on_acknowledged)
+
+        loudest = None
+        shown, sounded = [], []
+        for alert, fired_at in burst:
+            is_repeat = self.panel.add_alert(alert, fired_at)
+            fire_id = alert.get("fire_id")
+            if fire_id is not None:
+                shown.append(fire_id)
+                self.open_fires.setdefault(alert.get("id"), []).append(fire_id)
+            if self.should_sound(alert, fired_at, is_repeat):
+                if fire_id is not None:
+                    sounded.append(fire_id)
+                urgency = alert.get("urgency", "Normal")
+                if loudest is None or URGENCY_RANK.get(urgency, 1) > URGENCY_RANK.get(loudest, 1):
+                    loudest = urgency
+
+        if loudest is not None:
+            self.audio.play(loudest, lambda: self.metrics.mark_all(sounded, "sound"))
+        self.panel.present()
+        self.metrics.mark_all(shown, "popup")
+
+    def on_acknowledged(self, alert):
+        self.metrics.mark_all(self.open_fires.pop(alert.get("id"), []), "acknowledged")
+        self.alert_acknowledged.emit(alert)
+
+    def should_sound(self, alert, fired_at, is_repeat):
+        alert_id = alert.get("id")
+        if alert.get("urgency") == "High" and is_repeat:
+            last = self.last_sounded.get(alert_id)
+            if last is not None and fired_at - last < HIGH_URGENCY_REPEAT:
+                return False
+        self.last_sounded[alert_id] = fired_at
+        return True
+
+
+# ===== Stacked Alert Panel =====
+class AlertStackPanel(QWidget):
+    acknowledged = Signal(dict)
+
+    def __init__(self):
+        super().__init__(None, Qt.Tool | Qt.WindowStaysOnTopHint)
+        self.setWindowTitle("RSOC-OS Alerts")
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setMinimumWidth(380)
+        self.rows = {}   # alert id -> AlertRow
+
+        layout = QVBoxLayout(self)
+
+        self.header = QLabel()
+        self.header.setAlignment(Qt.AlignCenter)
+        self.header.setStyleSheet("font-size: 16px; font-weight: bold;")
+        layout.addWidget(self.header)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setMinimumHeight(180)
+        rows_widget = QWidget()
+        self.rows_layout = QVBoxLayout(rows_widget)
+        self.rows_layout.setAlignment(Qt.AlignTop)
+        scroll_area.setWidget(rows_widget)
+        layout.addWidget(scroll_area)
+
+        ack_all_btn = QPushButton("Acknowledge All")
+        ack_all_btn.clicked.connect(self.acknowledge_all)
+        layout.addWidget(ack_all_btn)
+
+    def add_alert(self, alert, fired_at):
+        """Add a row, or bump the existing row if this alert is still unacknowledged.
+
+        Returns True when the alert was already on the panel."""
+        alert_id = alert.get("id") or id(alert)
+        row = self.rows.get(alert_id)
+        if row is not None:
+            row.bump(fired_at)
+            return True
+
+        row = AlertRow(alert, fired_at)
+        row.ack_btn.clicked.connect(lambda: self.acknowledge(alert_id))
+        self.rows[alert_id] = row
+        # Highest urgency first, then in the order they fired
+        position = sum(1 for other in self.rows.values()
+                       if other is not row and URGENCY_RANK.get(other.urgency, 1) >= URGENCY_RANK.get(row.urgency, 1))
+        self.rows_layout.insertWidget(position, row)
+        return False
+
+    def acknowledge(self, alert_id):
+        row = self.rows.pop(alert_id, None)
+        if row is None:
+            return
+        self.acknowledged.emit(row.alert)
+        self.rows_layout.removeWidget(row)
+        row.deleteLater()
+        self.update_header()
+        if not self.rows:
+            self.hide()
+
+    def acknowledge_all(self):
+        for alert_id in list(self.rows):
+            self.acknowledge(alert_id)
+
+    def present(self):
+        self.update_header()
+        self.adjustSize()
+        if not self.isVisible():
+            self.move(QApplication.primaryScreen().availableGeometry().center() - self.rect().center())
+        self.show()
+        self.raise_()
+
+    def update_header(self):
+        count = len(self.rows)
+        self.header.setText("1 Active Alert" if count == 1 else f"{count} Active Alerts")
+
+    def closeEvent(self, event):
+        # Closing the panel only hides it; alerts stay until acknowledged
+        event.ignore()
+        self.hide()
+
+
+class AlertRow(QWidget):
+    def __init__(self, alert, fired_at):
+        super().__init__()
+        self.alert = alert
+        self.urgency = alert.get("urgency", "Normal")
+        self.count = 1
+        color = URGENCY_COLORS.get(self.urgency, "#95a5a6")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 6)
+
+        title = QLabel(alert.get("title", "Alert"))
+        title.setStyleSheet(f"font-weight: bold; color: white; background-color: {color}; padding: 6px;")
+        layout.addWidget(title)
+
+        desc_label = QLabel(alert.get("description", ""))
+        desc_label.setWordWrap(True)
+        desc_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        desc_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        desc_label.setContentsMargins(5, 5, 5, 5)
+        desc_label.setVisible(bool(alert.get("description")))
+        layout.addWidget(desc_label)
+
+        footer = QHBoxLayout()
+        self.time_label = QLabel()
+        self.ack_btn = QPushButton("Acknowledge")
+        footer.addWidget(self.time_label)
+        footer.addStretch()
+        footer.addWidget(self.ack_btn)
+        layout.addLayout(footer)
+
+        self.first_fired = fired_at
+        self.bump(fired_at, initial=True)
+
+    def bump(self, fired_at, initial=False):
+        if not initial:
+            self.count += 1
+        text = f"{self.urgency} · {self.first_fired:%H:%M}"
+        if self.count > 1:
+            text += f" · fired {self.count}x, last {fired_at:%H:%M}"
+        self.time_label.setText(text)
+
+
+# ===== Shared Instance =====
+_center = None
+
+def get_notification_center():
+    global _center
+    if _center is None:
+        _center = NotificationCenter()
+    return _center
@@ -0,0 +1,248 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import json
+import bisect
+import calendar
+import datetime
+from array import array
+from functools import lru_cache
+
+# Recurrence rules for alerts, compiled once into a structure that answers
+# "next fire after t" without scanning.
+#
+# An alert without a "rule" keeps the original behaviour: daily at "time",
+# repeating every "repeat_interval" minutes until midnight. A "rule" entry
+# selects one of:
+#   {"kind": "daily",   "days": [0..6], "every": 30, "until": "18:00"}   (starts at the alert's "time")
+#   {"kind": "shift",   "days": [0..6], "shift": "Third", "every": 30}
+#   {"kind": "monthly", "nth": 1, "weekday": 0}                           (at the alert's "time")
+# Days are weekday numbers (0 = Monday). A shift belongs to the day it starts on.
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+ALL_DAYS = [0, 1, 2, 3, 4, 5, 6]
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+SHIFTS = {
+    "First": ("06:00", "14:00"),
+    "Second": ("14:00", "22:00"),
+    "Third": ("22:00", "06:00"),
+}
+
+NTH_NAMES = {1: "First", 2: "Second", 3: "Third", 4: "Fourth", -1: "Last"}
+
+
+def to_minutes(hhmm):
+    hours, minutes = map(int, hhmm.split(":"))
+    return hours * 60 + minutes
+
+
+def is_one_time(alert):
+    """Legacy alerts with no repeat fire once and then disable themselves."""
+    return "rule" not in alert and int(alert.get("repeat_interval", 0) or 0) == 0
+
+
+# ===== Compiled Rules =====
+class WeeklyRule:
+    """Fire times as a sorted array of minute-of-week offsets (Monday 00:00 = 0)."""
+
+    def __init__(self, minutes):
+        self.minutes = array("H", sorted(set(minutes)))
+
+    def next_after(self, after):
+        if not self.minutes:
+            return None
+
+        week_start = datetime.datetime.combine(after.date() - datetime.timedelta(days=after.weekday()), datetime.time())
+        offset = after.weekday() * MINUTES_PER_DAY + after.hour * 60 + after.minute
+
+        # A fire at minute `offset` is not strictly after `after`, so bisect_right
+        index = bisect.bisect_right(self.minutes, offset)
+        if index == len(self.minutes):
+            week_start += datetime.timedelta(weeks=1)
+            index = 0
+        return week_start + datetime.timedelta(minutes=self.minutes[index])
+
+
+class MonthlyRule:
+    """Fires on the nth (or last, nth = -1) given weekday of every month."""
+
+    def __init__(self, nth, weekday, minute_of_day):
+        self.nth = nth
+        self.weekday = weekday
+        self.minute_of_day = minute_of_day
+
+    def occurrence(self, year, month):
+        weeks = calendar.monthcalendar(year, month)
+        days = [week[self.weekday] for week in weeks if week[self.weekday]]
+        if self.nth == -1:
+            day = days[-1]
+        elif self.nth <= len(days):
+            day = days[self.nth - 1]
+        else:
+            return None
+        return datetime.datetime(year, month, day) + datetime.timedelta(minutes=self.minute_of_day)
+
+    def next_after(self, after):
+        year, month = after.year, after.month
+        for _ in range(13):
+            fire_at = self.occurrence(year, month)
+            if fire_at is not None and fire_at > after:
+                return fire_at
+            month += 1
+            if month > 12:
+                year, month = year + 1, 1
+        return None
+
+
+def window_minutes(days, start, end, every):
+    """Minute-of-week offsets for a window [start, end) on each selected day.
+
+    `end` <= `start` means the window runs past midnight into the next day.
+    """
+    if end <= start:
+        end += MINUTES_PER_DAY
+
+    offsets = []
+    for day in days:
+        minute = start
+        while minute < end:
+            offsets.append((day * MINUTES_PER_DAY + minute) % MINUTES_PER_WEEK)
+            if every <= 0:
+                break
+            minute += every
+    return offsets
+
+
+# ===== Compilation =====
+def rule_key(alert):
+    """Hashable description of everything that affects an alert's schedule."""
+    return json.dumps([alert.get("time", "00:00"), int(alert.get("repeat_interval", 0) or 0), alert.get("rule")],
+                      sort_keys=True)
+
+
+def compile_rule(alert):
+    return _compile(rule_key(alert))
+
+
+@lru_cache(maxsize=1024)
+def _compile(key):
+    time_str, interval, rule = json.loads(key)
+    start = to_minutes(time_str)
+
+    if not rule:
+        return WeeklyRule(window_minutes(ALL_DAYS, start, MINUTES_PER_DAY, interval))
+
+    kind = rule.get("kind", "daily")
+    days = rule.get("days") or ALL_DAYS
+    every = int(rule.get("every", interval) or 0)
+
+    if kind == "monthly":
+        return MonthlyRule(int(rule.get("nth", 1)), int(rule.get("weekday", 0)), start)
+
+    if kind == "shift":
+        shift_start, shift_end = SHIFTS[rule.get("shift", "First")]
+        return WeeklyRule(window_minutes(days, to_minutes(shift_start), to_minutes(shift_end), every))
+
+    until = to_minutes(rule["until"]) if rule.get("until") else MINUTES_PER_DAY
+    return WeeklyRule(window_minutes(days, start, until, every))
+
+
+# ===== Display =====
+def describe_rule(alert):
+    rule = alert.get("rule")
+    time_str = alert.get("time", "00:00")
+    interval = int(alert.get("repeat_interval", 0) or 0)
+
+    if not rule:
+        if interval:
+            return f"Daily from {time_str}, every {interval} min"
+        return f"Once at {time_str}"
+
+    kind = rule.get("kind", "daily")
+    every = int(rule.get("every", interval) or 0)
+    days = rule.get("days") or ALL_DAYS
+    if sorted(days) == ALL_DAYS:
+        day_text = "Daily"
+    elif sorted(days) == [0, 1, 2, 3, 4]:
+        day_text = "Weekdays"
+    elif sorted(days) == [5, 6]:
+        day_text = "Weekends"
+    else:
+        day_text = ", ".join(DAY_NAMES[d] for d in sorted(days))
+
+    if kind == "monthly":
+        nth = NTH_NAMES.get(int(rule.get("nth", 1)), "First")
+        return f"{nth} {calendar.day_name[int(rule.get('weekday', 0))]} of month at {time_str}"
+    if kind == "shift":
+        repeat = f"every {every} min during " if every else "at start of "
+        return f"{day_text}, {repeat}{rule.get('shift', 'First').lower()} shift"
+
+    text = f"{day_text} at {time_str}"
+    if every:
+        text += f", every {every} min" + (f" until {rule['until']}" if rule.get("until") else "")
+    return text
+
+
+def format_fire_time(fire_at, now):
+    if fire_at is None:
+        return "Never"
+    if fire_at.date() == now.date():
+        return f"Today {fire_at:%H:%M}"
+    if fire_at.date() == now.date() + datetime.timedelta(days=1):
+        return f"Tomorrow {fire_at:%H:%M}"
+    return f"{fire_at:%a %b %d %H:%M}"
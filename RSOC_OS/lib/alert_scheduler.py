@@ -0,0 +1,218 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import heapq
+import itertools
+import datetime
+
+from lib.alert_rules import compile_rule, is_one_time
+
+# Pure scheduling logic for the alerts engine (no Qt, no disk access).
+# alerts_engine.AlertScheduler drives SchedulerCore with a single-shot QTimer;
+# lib/alert_simulation.py drives it with a virtual clock.
+
+TIMESTAMP_FMT = "%Y-%m-%d %H:%M"                 # format of an alert's "last_triggered"
+CATCH_UP_WINDOW = datetime.timedelta(hours=1)    # missed fires older than this are skipped
+
+
+# ===== Next Fire Computation =====
+def next_fire_time(alert, after):
+    """First fire time strictly after `after`, or None if the alert never fires.
+
+    See lib/alert_rules.py for the supported recurrence rules.
+    """
+    try:
+        return compile_rule(alert).next_after(after)
+    except (ValueError, KeyError, TypeError, AttributeError):
+        print(f"[ALERTS] Invalid schedule for '{alert.get('title')}'")
+        return None
+
+
+def fire_floor(alert, now):
+    """Point after which the alert is next due: the start of the current minute,
+    or later if the alert already fired this minute."""
+    floor = now.replace(second=0, microsecond=0) - datetime.timedelta(microseconds=1)
+    last = alert.get("last_triggered", "")
+    if last:
+        try:
+            floor = max(floor, datetime.datetime.strptime(last, TIMESTAMP_FMT))
+        except ValueError:
+            pass
+    return floor
+
+
+# ===== Priority Queue =====
+class AlertQueue:
+    """Min-heap of (fire time, key) with lazy removal.
+
+    Rescheduling or removing a key only updates the lookup table; stale heap
+    entries are discarded when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._due = {}                    # key -> fire time currently scheduled
+        self._counter = itertools.count() # tie-breaker so keys never get compared
+
+    def __len__(self):
+        return len(self._due)
+
+    def __contains__(self, key):
+        return key in self._due
+
+    def schedule(self, key, fire_at):
+        if fire_at is None:
+            self.remove(key)
+            return
+        self._due[key] = fire_at
+        heapq.heappush(self._heap, (fire_at, next(self._counter), key))
+
+    def remove(self, key):
+        self._due.pop(key, None)
+
+    def clear(self):
+        self._heap.clear()
+        self._due.clear()
+
+    def fire_time(self, key):
+        return self._due.get(key)
+
+    def peek(self):
+        """Earliest scheduled fire time, or None if nothing is scheduled."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now):
+        """Remove and return [(key, fire time)] for everything due at or before `now`."""
+        due = []
+        while True:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            fire_at, _, key = heapq.heappop(self._heap)
+            del self._due[key]
+            due.append((key, fire_at))
+
+    def _discard_stale(self):
+        while self._heap:
+            fire_at, _, key = self._heap[0]
+            if self._due.get(key) == fire_at:
+                return
+            heapq.heappop(self._heap)
+
+
+# ===== Scheduler Core =====
+class SchedulerCore:
+    """Decides which alerts fire and when, independent of how time passes.
+
+    `store` needs all(), get(id) and update(id, changes); `clock` returns the
+    current datetime; `sink(alert, fire_at, now)` receives every fire. The
+    caller is responsible for calling process_due() at next_deadline().
+    """
+
+    def __init__(self, store, sink, clock=datetime.datetime.now, catch_up=CATCH_UP_WINDOW):
+        self.store = store
+        self.sink = sink
+        self.clock = clock
+        self.catch_up = catch_up
+        self.queue = AlertQueue()
+
+    def reload(self):
+        self.queue.clear()
+        now = self.clock()
+        for alert in self.store.all():
+            self.schedule_alert(alert, now)
+
+    def schedule_alert(self, alert, now=None):
+        if not alert.get("enabled", True):
+            self.queue.remove(alert["id"])
+            return
+        now = now or self.clock()
+        self.queue.schedule(alert["id"], next_fire_time(alert, fire_floor(alert, now)))
+
+    def remove(self, alert_id):
+        self.queue.remove(alert_id)
+
+    def next_deadline(self):
+        return self.queue.peek()
+
+    def process_due(self):
+        """Fire everything due by now; returns the fired alerts."""
+        now = self.clock()
+        fired = []
+
+        for alert_id, fire_at in self.queue.pop_due(now):
+            alert = self.store.get(alert_id)
+            if alert is None:
+                continue
+
+            if now - fire_at > self.catch_up:
+                print(f"[ALERTS] Skipped '{alert.get('title')}' missed at {fire_at:%H:%M}")
+                self.queue.schedule(alert_id, next_fire_time(alert, now))
+                continue
+
+            # Stamping the current minute also folds any other missed repeats into this fire
+            changes = {"last_triggered": now.strftime(TIMESTAMP_FMT)}
+            if is_one_time(alert):
+                changes["enabled"] = False
+            alert.update(changes)
+            self.store.update(alert_id, changes)
+            self.schedule_alert(alert, now)
+            fired.append((alert, fire_at))
+
+        for alert, fire_at in fired:
+            self.sink(alert, fire_at, now)
+        return [alert for alert, _ in fired]
@@ -0,0 +1,338 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import sys
+import copy
+import json
+import time
+import random
+import argparse
+import datetime
+from collections import Counter
+
+from lib.alert_rules import SHIFTS, ALL_DAYS, MINUTES_PER_DAY, to_minutes, is_one_time
+from lib.alert_scheduler import SchedulerCore, TIMESTAMP_FMT
+
+# Headless replay of the alerts engine on a virtual clock.
+#
+# The same SchedulerCore the app uses is driven from deadline to deadline,
+# so a day or a week of schedules runs in milliseconds with no Qt, display
+# or sound. Every fire is checked against a brute-force minute-by-minute
+# reference of the schedule rules to find duplicates and misses.
+#
+#   python -m lib.alert_simulation config/alerts_<user>.json --days 7
+#   python -m lib.alert_simulation --random 5000 --days 7 --no-verify
+
+
+# ===== In-Memory Store =====
+class MemoryAlertStore:
+    """Minimal stand-in for AlertStore: all(), get() and update() on plain dicts."""
+
+    def __init__(self, alerts):
+        self._alerts = {}
+        for index, alert in enumerate(copy.deepcopy(alerts)):
+            alert.setdefault("id", f"alert-{index}")
+            self._alerts[alert["id"]] = alert
+
+    def __len__(self):
+        return len(self._alerts)
+
+    def all(self):
+        return [dict(alert) for alert in self._alerts.values()]
+
+    def get(self, alert_id):
+        alert = self._alerts.get(alert_id)
+        return dict(alert) if alert is not None else None
+
+    def update(self, alert_id, changes, removed_keys=()):
+        alert = self._alerts.get(alert_id)
+        if alert is None:
+            return False
+        alert.update(changes)
+        for key in removed_keys:
+            alert.pop(key, None)
+        return True
+
+
+class VirtualClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+# ===== Reference Schedule =====
+def in_window(minute, days, start, end, every):
+    """Brute-force check of a [start, end) window that may run past midnight."""
+    length = (end - start) % MINUTES_PER_DAY or MINUTES_PER_DAY
+    for days_back in (0, 1):
+        day = minute - datetime.timedelta(days=days_back)
+        if day.weekday() not in days:
+            continue
+        delta = days_back * MINUTES_PER_DAY + minute.hour * 60 + minute.minute - start
+        if 0 <= delta < length and (delta == 0 if every <= 0 else delta % every == 0):
+            return True
+    return False
+
+
+def reference_due(alert, minute):
+    """Whether an alert is due at `minute`, evaluated directly from its definition."""
+    start = to_minutes(alert.get("time", "00:00"))
+    interval = int(alert.get("repeat_interval", 0) or 0)
+    rule = alert.get("rule")
+
+    if not rule:
+        return in_window(minute, ALL_DAYS, start, MINUTES_PER_DAY, interval)
+
+    kind = rule.get("kind", "daily")
+    days = rule.get("days") or ALL_DAYS
+    every = int(rule.get("every", interval) or 0)
+
+    if kind == "monthly":
+        if minute.weekday() != int(rule.get("weekday", 0)) or minute.hour * 60 + minute.minute != start:
+            return False
+        nth = int(rule.get("nth", 1))
+        if nth == -1:
+            return (minute + datetime.timedelta(days=7)).month != minute.month
+        return (minute.day - 1) // 7 + 1 == nth
+
+    if kind == "shift":
+        shift_start, shift_end = SHIFTS[rule.get("shift", "First")]
+        return in_window(minute, days, to_minutes(shift_start), to_minutes(shift_end), every)
+
+    until = to_minutes(rule["until"]) if rule.get("until") else MINUTES_PER_DAY
+    return in_window(minute, days, start, until, every)
+
+
+def expected_fires(alert, start, end):
+    """Minutes in [start, end) at which the alert should fire."""
+    if not alert.get("enabled", True):
+        return []
+
+    minute = start.replace(second=0, microsecond=0)
+    if minute < start:
+        minute += datetime.timedelta(minutes=1)
+    if alert.get("last_triggered"):
+        try:
+            last = datetime.datetime.strptime(alert["last_triggered"], TIMESTAMP_FMT)
+            minute = max(minute, last + datetime.timedelta(minutes=1))
+        except ValueError:
+            pass
+
+    fires = []
+    while minute < end:
+        if reference_due(alert, minute):
+            fires.append(minute)
+            if is_one_time(alert):
+                break
+        minute += datetime.timedelta(minutes=1)
+    return fires
+
+
+# ===== Simulation =====
+class SimulationReport:
+    def __init__(self, start, end, alert_count):
+        self.start = start
+        self.end = end
+        self.alert_count = alert_count
+        self.fires = []          # (alert id, title, scheduled, delivered)
+        self.expected = None     # alert id -> [minutes], None when not verified
+        self.duplicates = []     # (alert id, scheduled, times delivered)
+        self.misses = []         # (alert id, expected minute)
+        self.unexpected = []     # (alert id, scheduled)
+        self.wakeups = 0
+        self.elapsed = 0.0
+
+    @property
+    def ok(self):
+        return not (self.duplicates or self.misses or self.unexpected)
+
+    def summary(self):
+        lines = [
+            f"Simulated {self.start:%Y-%m-%d %H:%M} -> {self.end:%Y-%m-%d %H:%M} for {self.alert_count} alerts",
+            f"Fires: {len(self.fires)} in {self.wakeups} wake-ups, {self.elapsed * 1000:.1f} ms "
+            f"({len(self.fires) / self.elapsed if self.elapsed else 0:,.0f} fires/s)",
+        ]
+        if self.expected is not None:
+            lines.append(f"Expected: {sum(len(m) for m in self.expected.values())}  "
+                         f"Duplicates: {len(self.duplicates)}  Misses: {len(self.misses)}  "
+                         f"Unexpected: {len(self.unexpected)}")
+        return "\n".join(lines)
+
+    def verify(self, alerts):
+        self.expected = {alert["id"]: expected_fires(alert, self.start, self.end) for alert in alerts}
+
+        delivered = Counter((alert_id, scheduled) for alert_id, _, scheduled, _ in self.fires)
+        self.duplicates = [(alert_id, scheduled, count) for (alert_id, scheduled), count in delivered.items() if count > 1]
+
+        for alert_id, minutes in self.expected.items():
+            expected = set(minutes)
+            self.misses.extend((alert_id, minute) for minute in minutes if (alert_id, minute) not in delivered)
+            self.unexpected.extend((alert_id, scheduled) for (other_id, scheduled) in delivered
+                                   if other_id == alert_id and scheduled not in expected)
+
+
+def alerts_with_ids(alerts):
+    """The starting state of each alert with the ids MemoryAlertStore assigns."""
+    return [dict(alert, id=alert.get("id", f"alert-{index}")) for index, alert in enumerate(alerts)]
+
+
+def simulate(alerts, start, end, latency=0.0, verify=True):
+    """Replay [start, end) on a virtual clock.
+
+    `latency` (seconds) delays every wake-up to model a late timer; fires
+    more than CATCH_UP_WINDOW late are skipped exactly as in the app.
+    """
+    store = MemoryAlertStore(alerts)
+    clock = VirtualClock(start)
+    report = SimulationReport(start, end, len(store))
+    delay = datetime.timedelta(seconds=latency)
+
+    def sink(alert, fire_at, now):
+        # A late final wake-up can also pick up fires scheduled past the window
+        if fire_at < end:
+            report.fires.append((alert["id"], alert.get("title", ""), fire_at, now))
+
+    core = SchedulerCore(store, sink, clock)
+    began = time.perf_counter()
+    core.reload()
+    while True:
+        deadline = core.next_deadline()
+        if deadline is None or deadline >= end:
+            break
+        clock.now = max(clock.now, deadline + delay)
+        core.process_due()
+        report.wakeups += 1
+    report.elapsed = time.perf_counter() - began
+
+    if verify:
+        report.verify(alerts_with_ids(alerts))
+    return report
+
+
+# ===== Random Configurations =====
+def random_alerts(count, seed=0):
+    """Mixed legacy and rule-based alerts for regression runs and throughput tests."""
+    rng = random.Random(seed)
+    alerts = []
+    for index in range(count):
+        alert = {
+            "id": f"random-{index}",
+            "title": f"Random {index}",
+            "time": f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            "repeat_interval": rng.choice([0, 0, 5, 15, 30, 60, 90, 240]),
+            "urgency": rng.choice(["Low", "Normal", "High"]),
+            "enabled": True,
+        }
+        kind = rng.choice([None, None, "daily", "shift", "monthly"])
+        if kind == "daily":
+            alert["rule"] = {"kind": "daily", "days": sorted(rng.sample(ALL_DAYS, rng.randint(1, 7)))}
+            if rng.random() < 0.5:
+                alert["rule"]["until"] = f"{rng.randrange(24):02d}:00"
+        elif kind == "shift":
+            alert["rule"] = {"kind": "shift", "days": sorted(rng.sample(ALL_DAYS, rng.randint(1, 7))),
+                             "shift": rng.choice(list(SHIFTS))}
+        elif kind == "monthly":
+            alert["rule"] = {"kind": "monthly", "nth": rng.choice([1, 2, 3, 4, -1]), "weekday": rng.randrange(7)}
+        alerts.append(alert)
+    return alerts
+
+
+# ===== Command Line =====
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay the alerts engine on a virtual clock.")
+    parser.add_argument("alerts_file", nargs="?", help="alerts JSON file ({\"alerts\": [...]})")
+    parser.add_argument("--random", type=int, default=0, help="simulate N random alerts instead of a file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", help="YYYY-MM-DD HH:MM (default: today 00:00)")
+    parser.add_argument("--days", type=float, default=1.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds every wake-up is late")
+    parser.add_argument("--no-verify", action="store_true", help="skip the reference check (throughput only)")
+    parser.add_argument("--list", action="store_true", help="print every fire")
+    args = parser.parse_args(argv)
+
+    if args.random:
+        alerts = random_alerts(args.random, args.seed)
+    elif args.alerts_file:
+        with open(args.alerts_file, 'r') as file:
+            alerts = json.load(file).get("alerts", [])
+    else:
+        parser.error("give an alerts file or --random N")
+
+    if args.start:
+        start = datetime.datetime.strptime(args.start, TIMESTAMP_FMT)
+    else:
+        start = datetime.datetime.combine(datetime.date.today(), datetime.time())
+    end = start + datetime.timedelta(days=args.days)
+
+    report = simulate(alerts, start, end, latency=args.latency, verify=not args.no_verify)
+
+    if args.list:
+        for alert_id, title, scheduled, delivered in report.fires:
+            print(f"{scheduled:%a %Y-%m-%d %H:%M}  +{(delivered - scheduled).total_seconds():6.1f}s  {title} [{alert_id}]")
+    for alert_id, scheduled, count in report.duplicates:
+        print(f"[DUPLICATE] {alert_id} at {scheduled:%Y-%m-%d %H:%M} delivered {count}x")
+    for alert_id, minute in report.misses:
+        print(f"[MISS] {alert_id} at {minute:%Y-%m-%d %H:%M}")
+    for alert_id, scheduled in report.unexpected:
+        print(f"[UNEXPECTED] {alert_id} at {scheduled:%Y-%m-%d %H:%M}")
+    print(report.summary())
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
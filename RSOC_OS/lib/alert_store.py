@@ -0,0 +1,252 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import os
+import json
+import uuid
+import getpass
+import datetime
+import threading
+
+from PySide6.QtCore import QObject, QTimer, Signal, Qt
+
+from lib.utils import atomic_write_json
+
+# ===== User-specific alert files =====
+USERNAME = getpass.getuser()
+ALERTS_FILE = f'./config/alerts_{USERNAME}.json'
+JOURNAL_FILE = f'./config/alerts_{USERNAME}.journal'
+
+SAVE_DELAY_MS = 1500   # edits within this window are written as one snapshot
+
+
+def new_alert_id():
+    return uuid.uuid4().hex[:12]
+
+
+class AlertStore(QObject):
+    """Single in-memory owner of the operator's alerts.
+
+    Alerts Center and the alerts engine both read and edit alerts through this
+    object by stable alert ID. Every change is appended to a small journal
+    immediately, and the full alerts file is rewritten atomically once edits
+    settle (SAVE_DELAY_MS). On load the journal is replayed over the last
+    snapshot, so nothing is lost if the app dies between the two.
+
+    Signals are emitted after the lock is released; listeners on other threads
+    receive them queued.
+    """
+
+    alert_added = Signal(str)
+    alert_updated = Signal(str)
+    alert_removed = Signal(str)
+    store_reset = Signal()
+    _save_requested = Signal()
+
+    def __init__(self, path=ALERTS_FILE, journal_path=JOURNAL_FILE, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.journal_path = journal_path
+        self._lock = threading.RLock()
+        self._alerts = {}    # id -> alert dict
+        self._order = []     # ids in display order (newest first)
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+        self._save_requested.connect(self._save_timer.start, Qt.QueuedConnection)
+        self._dirty = False
+
+        self.load()
+
+    # ===== Reading =====
+    def ids(self):
+        with self._lock:
+            return list(self._order)
+
+    def get(self, alert_id):
+        with self._lock:
+            alert = self._alerts.get(alert_id)
+            return dict(alert) if alert is not None else None
+
+    def all(self):
+        with self._lock:
+            return [dict(self._alerts[alert_id]) for alert_id in self._order]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._order)
+
+    # ===== Editing =====
+    def add(self, alert, index=0):
+        with self._lock:
+            alert = dict(alert)
+            alert_id = alert.get("id") or new_alert_id()
+            alert["id"] = alert_id
+            self._alerts[alert_id] = alert
+            self._order.insert(index, alert_id)
+            self._journal({"op": "add", "id": alert_id, "index": index, "alert": alert})
+        self.alert_added.emit(alert_id)
+        return alert_id
+
+    def update(self, alert_id, changes, removed_keys=()):
+        with self._lock:
+            alert = self._alerts.get(alert_id)
+            if alert is None:
+                return False
+            alert.update(changes)
+            for key in removed_keys:
+                alert.pop(key, None)
+            self._journal({"op": "update", "id": alert_id, "changes": changes, "removed": list(removed_keys)})
+        self.alert_updated.emit(alert_id)
+        return True
+
+    def remove(self, alert_id):
+        with self._lock:
+            if self._alerts.pop(alert_id, None) is None:
+                return False
+            self._order.remove(alert_id)
+            self._journal({"op": "remove", "id": alert_id})
+        self.alert_removed.emit(alert_id)
+        return True
+
+    # ===== Persistence =====
+    def load(self):
+        with self._lock:
+            self._alerts.clear()
+            self._order.clear()
+            missing_ids = False
+
+            if self.path and os.path.exists(self.path):
+                with open(self.path, 'r') as file:
+                    alerts = json.load(file).get("alerts", [])
+                for alert in alerts:
+                    # Patch old-format timestamps
+                    lt = alert.get("last_triggered", "")
+                    if lt and len(lt) == 5:
+                        alert["last_triggered"] = ""
+                    if not alert.get("id"):
+                        alert["id"] = new_alert_id()
+                        missing_ids = True
+                    self._alerts[alert["id"]] = alert
+                    self._order.append(alert["id"])
+
+            replayed = self._replay_journal()
+            self._dirty = bool(replayed) or missing_ids
+
+        # Persist newly assigned IDs and fold any replayed journal into the snapshot
+        self.flush()
+        self.store_reset.emit()
+
+    def flush(self):
+        """Write the snapshot now (if anything changed) and start a fresh journal."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_json(self.path, {"alerts": [self._alerts[i] for i in self._order]})
+            if os.path.exists(self.journal_path):
+                open(self.journal_path, 'w').close()
+            self._dirty = False
+
+    def _journal(self, entry):
+        self._dirty = True
+        if not self.path:
+            return
+        entry["ts"] = datetime.datetime.now().isoformat(timespec="seconds")
+        with open(self.journal_path, 'a') as journal:
+            journal.write(json.dumps(entry) + "\n")
+        self._save_requested.emit()
+
+    def _replay_journal(self):
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return 0
+
+        replayed = 0
+        with open(self.journal_path, 'r') as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break   # torn final line from a crash mid-append
+                alert_id = entry.get("id")
+                op = entry.get("op")
+                if op == "add" and alert_id not in self._alerts:
+                    self._alerts[alert_id] = entry["alert"]
+                    self._order.insert(min(entry.get("index", 0), len(self._order)), alert_id)
+                elif op == "update" and alert_id in self._alerts:
+                    self._alerts[alert_id].update(entry.get("changes", {}))
+                    for key in entry.get("removed", []):
+                        self._alerts[alert_id].pop(key, None)
+                elif op == "remove" and alert_id in self._alerts:
+                    del self._alerts[alert_id]
+                    self._order.remove(alert_id)
+                replayed += 1
+        return replayed
+
+
+# ===== Shared Instance =====
+_store = None
+_store_lock = threading.Lock()
+
+def get_alert_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = AlertStore()
+        return _store
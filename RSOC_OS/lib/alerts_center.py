@@ -54,19 +54,37 @@
 # Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
 # ==============================================================================
 
-import os
-import json
 import getpass
+import datetime
 from PySide6.QtWidgets import (
-    QMessageBox, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QGridLayout, QCheckBox, QSizePolicy, QDialog,
+    QApplication, QMessageBox, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QCheckBox, QSizePolicy, QDialog, QListView, QStyledItemDelegate, QStyle, QStyleOptionButton,
     QLineEdit, QTextEdit, QTimeEdit, QSpinBox, QComboBox
 )
-from PySide6.QtCore import Qt, QSize, QTime
+from PySide6.QtCore import (
+    Qt, QSize, QTime, QTimer, QRect, QEvent, Signal,
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtGui import QPainter, QPen, QColor, QFont, QFontMetrics, QPalette
+
+from lib.alert_rules import SHIFTS, NTH_NAMES, DAY_NAMES, ALL_DAYS, describe_rule, format_fire_time
+from lib.alert_scheduler import next_fire_time, fire_floor
+from lib.alert_store import get_alert_store
+from lib.clipboard_store import get_clipboard_store
+from lib.alert_diagnostics import open_diagnostics_dialog
 
-# ===== User-specific alerts file =====
 USERNAME = getpass.getuser()
-ALERTS_FILE = f'./config/alerts_{USERNAME}.json'
+
+
+URGENCY_COLORS = {"Low": "#2980b9", "Normal": "#f39c12", "High": "#c0392b"}
+CARD_SIZE = QSize(250, 150)
+
+AlertIdRole = Qt.UserRole + 1
+AlertRole = Qt.UserRole + 2
+NextFireRole = Qt.UserRole + 3
+EnabledRole = Qt.UserRole + 4
+UrgencyRole = Qt.UserRole + 5
+OrderRole = Qt.UserRole + 6
 
 
 def get_alerts_widget(parent=None):
@@ -80,84 +98,328 @@ def get_alerts_widget(parent=None):
     title.setObjectName("AlertsTitle")
     title.setAlignment(Qt.AlignCenter)
 
+    urgency_filter = QComboBox()
+    urgency_filter.addItems(["All Urgencies", "Low", "Normal", "High"])
+    state_filter = QComboBox()
+    state_filter.addItems(["All Alerts", "Enabled", "Disabled"])
+
     add_button = QPushButton("New Alert")
     add_button.clicked.connect(lambda: open_new_alert_dialog(widget))
 
+    diagnostics_button = QPushButton("Diagnostics")
+    diagnostics_button.clicked.connect(lambda: open_diagnostics_dialog(widget))
+
     left_spacer = QWidget()
     left_spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
     right_spacer = QWidget()
     right_spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
+    top_bar.addWidget(urgency_filter)
+    top_bar.addWidget(state_filter)
     top_bar.addWidget(left_spacer)
     top_bar.addWidget(title)
     top_bar.addWidget(right_spacer)
+    top_bar.addWidget(diagnostics_button)
     top_bar.addWidget(add_button)
 
     layout.addLayout(top_bar)
 
-    # ===== Scrollable Grid =====
-    scroll_area = QScrollArea()
-    scroll_area.setWidgetResizable(True)
-
-    content_widget = QWidget()
-    grid_layout = QGridLayout()
-    content_widget.setLayout(grid_layout)
-
-    scroll_area.setWidget(content_widget)
-    layout.addWidget(scroll_area)
+    # ===== Card View =====
+    model = AlertListModel(get_alert_store(), widget)
+    proxy = AlertFilterProxy(widget)
+    proxy.setSourceModel(model)
+    proxy.sort(0)
+
+    delegate = AlertCardDelegate(widget)
+    delegate.toggle_requested.connect(lambda alert_id: toggle_alert(alert_id, not get_alert_store().get(alert_id).get("enabled", True)))
+    delegate.edit_requested.connect(lambda alert_id: open_edit_alert_dialog(alert_id, widget))
+    delegate.delete_requested.connect(lambda alert_id: delete_alert(alert_id, widget))
+
+    view = QListView()
+    view.setObjectName("AlertCardView")
+    view.setModel(proxy)
+    view.setItemDelegate(delegate)
+    view.setFlow(QListView.LeftToRight)
+    view.setWrapping(True)
+    view.setResizeMode(QListView.Adjust)
+    view.setUniformItemSizes(True)
+    view.setSpacing(6)
+    view.setSelectionMode(QListView.NoSelection)
+    view.setVerticalScrollMode(QListView.ScrollPerPixel)
+    layout.addWidget(view)
+
+    urgency_filter.currentTextChanged.connect(
+        lambda text: proxy.set_urgency(None if text == "All Urgencies" else text))
+    state_filter.currentTextChanged.connect(
+        lambda text: proxy.set_enabled({"Enabled": True, "Disabled": False}.get(text)))
+
+    # One shared timer drives every countdown; views only repaint visible rows
+    countdown_timer = QTimer(widget)
+    countdown_timer.timeout.connect(model.tick)
+    countdown_timer.start(1000)
 
     widget.setLayout(layout)
-
-    load_alerts(grid_layout, widget)
-
     return widget
 
 
-# ===== Load Alerts =====
-def load_alerts(grid_layout, parent_widget):
-    alerts = read_alerts_data()
-    alerts = sorted(alerts, key=lambda x: x.get("enabled", True), reverse=True)
-
-    for i in reversed(range(grid_layout.count())):
-        grid_layout.itemAt(i).widget().setParent(None)
-
-    col_count = 3
-    for index, alert in enumerate(alerts):
-        row = index // col_count
-        col = index % col_count
-        grid_layout.addWidget(create_alert_card(alert, parent_widget, index), row, col)
-
-
-# ===== Create Alert Card =====
-def create_alert_card(alert, parent_widget, index):
-    card = QWidget()
-    card.setObjectName("AlertCard")
-    layout = QVBoxLayout()
-
-    urgency = alert.get("urgency", "Normal")
-    title = QLabel(f"{alert.get('title', 'Untitled')} [{urgency}]")
-    title.setStyleSheet("font-weight: bold;")
-    layout.addWidget(title)
+# ===== Alert Model =====
+class AlertListModel(QAbstractListModel):
+    """List model over the AlertStore, updated row by row from its change signals."""
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._ids = []
+        self._rows = {}
+        self._alerts = {}
+        self._next_fire = {}
+        self._countdowns = {}   # alert ID -> countdown text as last painted
+
+        # Bound to this model, so Qt drops the connections when the view is deleted
+        store.alert_added.connect(self.on_alert_added)
+        store.alert_updated.connect(self.on_alert_updated)
+        store.alert_removed.connect(self.on_alert_removed)
+        store.store_reset.connect(self.reload)
+
+        self.reload()
+
+    # ===== Qt Model API =====
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        alert_id = self._ids[index.row()]
+        alert = self._alerts[alert_id]
+
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return alert.get("title", "Untitled")
+        if role == AlertIdRole:
+            return alert_id
+        if role == AlertRole:
+            return alert
+        if role == NextFireRole:
+            return self._next_fire.get(alert_id)
+        if role == EnabledRole:
+            return alert.get("enabled", True)
+        if role == UrgencyRole:
+            return alert.get("urgency", "Normal")
+        if role == OrderRole:
+            return index.row()
+        return None
+
+    # ===== Store Updates =====
+    def reload(self):
+        self.beginResetModel()
+        alerts = self.store.all()
+        self._ids = [alert["id"] for alert in alerts]
+        self._alerts = {alert["id"]: alert for alert in alerts}
+        self._next_fire = {alert["id"]: compute_next_fire(alert) for alert in alerts}
+        self._countdowns = {}
+        self._reindex()
+        self.endResetModel()
+
+    def on_alert_added(self, alert_id):
+        alert = self.store.get(alert_id)
+        if alert is None or alert_id in self._rows:
+            return
+        row = min(self.store.ids().index(alert_id), len(self._ids))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.insert(row, alert_id)
+        self._alerts[alert_id] = alert
+        self._next_fire[alert_id] = compute_next_fire(alert)
+        self._reindex()
+        self.endInsertRows()
+
+    def on_alert_updated(self, alert_id):
+        alert = self.store.get(alert_id)
+        row = self._rows.get(alert_id)
+        if alert is None or row is None:
+            return
+        self._alerts[alert_id] = alert
+        self._next_fire[alert_id] = compute_next_fire(alert)
+        self._countdowns.pop(alert_id, None)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def on_alert_removed(self, alert_id):
+        row = self._rows.get(alert_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        self._alerts.pop(alert_id, None)
+        self._next_fire.pop(alert_id, None)
+        self._countdowns.pop(alert_id, None)
+        self._reindex()
+        self.endRemoveRows()
+
+    def tick(self):
+        # Only rows whose countdown text moved on; hour and day countdowns change rarely
+        changed = []
+        for row, alert_id in enumerate(self._ids):
+            text = next_fire_text(self._next_fire.get(alert_id), self._alerts[alert_id].get("enabled", True))
+            if self._countdowns.get(alert_id) != text:
+                self._countdowns[alert_id] = text
+                changed.append(row)
+
+        # One signal per run of adjacent rows
+        start = 0
+        for at in range(1, len(changed) + 1):
+            if at == len(changed) or changed[at] != changed[at - 1] + 1:
+                self.dataChanged.emit(self.index(changed[start]), self.index(changed[at - 1]), [NextFireRole])
+                start = at
+
+    def _reindex(self):
+        self._rows = {alert_id: row for row, alert_id in enumerate(self._ids)}
+
+
+def compute_next_fire(alert):
+    if not alert.get("enabled", True):
+        return None
+    return next_fire_time(alert, fire_floor(alert, datetime.datetime.now()))
+
+
+class AlertFilterProxy(QSortFilterProxyModel):
+    """Filters by urgency / enabled state and lists enabled alerts first."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.urgency = None
+        self.enabled = None
+        self.setDynamicSortFilter(True)
+
+    def set_urgency(self, urgency):
+        self.urgency = urgency
+        self.invalidateFilter()
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        if self.urgency is not None and index.data(UrgencyRole) != self.urgency:
+            return False
+        if self.enabled is not None and index.data(EnabledRole) != self.enabled:
+            return False
+        return True
+
+    def lessThan(self, left, right):
+        left_key = (not left.data(EnabledRole), left.data(OrderRole))
+        right_key = (not right.data(EnabledRole), right.data(OrderRole))
+        return left_key < right_key
+
+
+# ===== Alert Card Delegate =====
+class AlertCardDelegate(QStyledItemDelegate):
+    """Paints alert cards directly instead of creating widgets per alert."""
+
+    toggle_requested = Signal(str)
+    edit_requested = Signal(str)
+    delete_requested = Signal(str)
+
+    def sizeHint(self, option, index):
+        return CARD_SIZE
+
+    def card_rects(self, rect):
+        card = rect.adjusted(2, 2, -2, -2)
+        inner = card.adjusted(10, 6, -10, -8)
+        button_width = (inner.width() - 8) // 2
+        return {
+            "card": card,
+            "title": QRect(inner.left(), inner.top(), inner.width(), 22),
+            "schedule": QRect(inner.left(), inner.top() + 24, inner.width(), 34),
+            "next": QRect(inner.left(), inner.top() + 58, inner.width(), 20),
+            "toggle": QRect(inner.left(), inner.top() + 80, inner.width(), 20),
+            "edit": QRect(inner.left(), inner.bottom() - 26, button_width, 26),
+            "delete": QRect(inner.left() + button_width + 8, inner.bottom() - 26, button_width, 26),
+        }
 
-    layout.addWidget(QLabel(f"Next Alert: {alert.get('time', 'N/A')}"))
+    def paint(self, painter, option, index):
+        alert = index.data(AlertRole)
+        rects = self.card_rects(option.rect)
+        palette = option.palette
+        style = option.widget.style() if option.widget else QApplication.style()
+        urgency = alert.get("urgency", "Normal")
+        enabled = alert.get("enabled", True)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background with urgency stripe
+        painter.setPen(QPen(palette.mid().color()))
+        painter.setBrush(palette.base())
+        painter.drawRoundedRect(rects["card"], 6, 6)
+        stripe = QRect(rects["card"].left(), rects["card"].top(), 5, rects["card"].height())
+        painter.fillRect(stripe.adjusted(1, 6, 0, -6), QColor(URGENCY_COLORS.get(urgency, "#95a5a6")))
+
+        text_color = palette.text().color() if enabled else palette.color(QPalette.Disabled, QPalette.Text)
+        painter.setPen(text_color)
+
+        title_font = QFont(option.font)
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        title = f"{alert.get('title', 'Untitled')} [{urgency}]"
+        painter.drawText(rects["title"], Qt.AlignLeft | Qt.AlignVCenter,
+                         QFontMetrics(title_font).elidedText(title, Qt.ElideRight, rects["title"].width()))
+
+        painter.setFont(option.font)
+        painter.drawText(rects["schedule"], Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, describe_rule(alert))
+        painter.drawText(rects["next"], Qt.AlignLeft | Qt.AlignVCenter, next_fire_text(index.data(NextFireRole), enabled))
+        painter.restore()
+
+        # Enabled checkbox and buttons, drawn with the widget style so themes apply
+        check = QStyleOptionButton()
+        check.rect = rects["toggle"]
+        check.text = "Enabled"
+        check.state = QStyle.State_Enabled | (QStyle.State_On if enabled else QStyle.State_Off)
+        style.drawControl(QStyle.CE_CheckBox, check, painter, option.widget)
+
+        for key, label in (("edit", "Edit"), ("delete", "Delete")):
+            button = QStyleOptionButton()
+            button.rect = rects[key]
+            button.text = label
+            button.state = QStyle.State_Enabled | QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+
+        rects = self.card_rects(option.rect)
+        pos = event.position().toPoint()
+        alert_id = index.data(AlertIdRole)
+
+        if rects["toggle"].contains(pos):
+            self.toggle_requested.emit(alert_id)
+        elif rects["edit"].contains(pos):
+            self.edit_requested.emit(alert_id)
+        elif rects["delete"].contains(pos):
+            self.delete_requested.emit(alert_id)
+        else:
+            return False
+        return True
 
-    toggle = QCheckBox("Enabled")
-    toggle.setChecked(alert.get("enabled", True))
-    toggle.stateChanged.connect(lambda state: toggle_alert(index, state, parent_widget))
-    layout.addWidget(toggle)
 
-    btn_layout = QHBoxLayout()
-    edit_btn = QPushButton("Edit")
-    edit_btn.clicked.connect(lambda: open_edit_alert_dialog(index, parent_widget))
-    delete_btn = QPushButton("Delete")
-    delete_btn.clicked.connect(lambda: delete_alert(index, parent_widget))
-    btn_layout.addWidget(edit_btn)
-    btn_layout.addWidget(delete_btn)
-    layout.addLayout(btn_layout)
+def next_fire_text(fire_at, enabled):
+    if not enabled:
+        return "Next Alert: Disabled"
+    now = datetime.datetime.now()
+    if fire_at is None:
+        return "Next Alert: Never"
 
-    card.setLayout(layout)
-    card.setFixedSize(QSize(250, 120))
-    return card
+    remaining = max(int((fire_at - now).total_seconds()), 0)
+    hours, rest = divmod(remaining, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours >= 24:
+        countdown = f"{hours // 24}d {hours % 24}h"
+    elif hours:
+        countdown = f"{hours}h {minutes:02d}m"
+    else:
+        countdown = f"{minutes}m {seconds:02d}s"
+    return f"Next Alert: {format_fire_time(fire_at, now)} (in {countdown})"
 
 
 # ===== New Alert Dialog =====
@@ -178,8 +440,7 @@ def open_new_alert_dialog(parent_widget):
     urgency_input = QComboBox()
     urgency_input.addItems(["Low", "Normal", "High"])
     clipboard_input = QComboBox()
-    clipboard_input.addItem("None")
-    clipboard_input.addItems(get_clipboard_titles())
+    populate_clip_combo(clipboard_input)
     enable_toggle = QCheckBox("Enable this alert")
     enable_toggle.setChecked(True)
 
@@ -187,6 +448,7 @@ def open_new_alert_dialog(parent_widget):
     layout.addWidget(QLabel("Description:")); layout.addWidget(description_input)
     layout.addWidget(QLabel("Alert Time:")); layout.addWidget(time_input)
     layout.addWidget(QLabel("Repeat Interval (minutes, 0 = No Repeat):")); layout.addWidget(repeat_input)
+    get_rule = add_rule_builder(layout)
     layout.addWidget(QLabel("Urgency Level:")); layout.addWidget(urgency_input)
     layout.addWidget(QLabel("Link Clipboard Entry:")); layout.addWidget(clipboard_input)
     layout.addWidget(enable_toggle)
@@ -210,13 +472,13 @@ def open_new_alert_dialog(parent_widget):
             "urgency": urgency_input.currentText(),
             "enabled": enable_toggle.isChecked()
         }
-        if clipboard_input.currentText() != "None":
-            alert_entry["linked_clipboard"] = clipboard_input.currentText()
+        if clipboard_input.currentData():
+            alert_entry["linked_clip_id"] = clipboard_input.currentData()
+        rule = get_rule()
+        if rule:
+            alert_entry["rule"] = rule
 
-        alerts = read_alerts_data()
-        alerts.insert(0, alert_entry)
-        write_alerts_data(alerts)
-        load_alerts(parent_widget.findChild(QScrollArea).widget().layout(), parent_widget)
+        get_alert_store().add(alert_entry)
         dialog.close()
 
     save_btn.clicked.connect(save_alert)
@@ -224,9 +486,10 @@ def open_new_alert_dialog(parent_widget):
 
 
 # ===== Edit Alert Dialog =====
-def open_edit_alert_dialog(alert_index, parent_widget):
-    alerts = read_alerts_data()
-    alert = alerts[alert_index]
+def open_edit_alert_dialog(alert_id, parent_widget):
+    alert = get_alert_store().get(alert_id)
+    if alert is None:
+        return
 
     dialog = QDialog(parent_widget)
     dialog.setWindowTitle(f"Edit Alert: {alert.get('title', 'Untitled')}")
@@ -242,15 +505,15 @@ def open_edit_alert_dialog(alert_index, parent_widget):
     repeat_input = QSpinBox(); repeat_input.setRange(0, 1440); repeat_input.setValue(alert.get("repeat_interval", 0))
     urgency_input = QComboBox(); urgency_input.addItems(["Low", "Normal", "High"])
     urgency_input.setCurrentIndex(urgency_input.findText(alert.get("urgency", "Normal")))
-    clipboard_input = QComboBox(); clipboard_input.addItem("None"); clipboard_input.addItems(get_clipboard_titles())
-    clip_index = clipboard_input.findText(alert.get("linked_clipboard", "None"))
-    clipboard_input.setCurrentIndex(clip_index if clip_index >= 0 else 0)
+    clipboard_input = QComboBox()
+    populate_clip_combo(clipboard_input, get_clipboard_store().resolve(alert.get("linked_clip_id"), alert.get("linked_clipboard")))
     enable_toggle = QCheckBox("Enable this alert"); enable_toggle.setChecked(alert.get("enabled", True))
 
     layout.addWidget(QLabel("Alert Title:")); layout.addWidget(title_input)
     layout.addWidget(QLabel("Description:")); layout.addWidget(description_input)
     layout.addWidget(QLabel("Alert Time:")); layout.addWidget(time_input)
     layout.addWidget(QLabel("Repeat Interval (minutes, 0 = No Repeat):")); layout.addWidget(repeat_input)
+    get_rule = add_rule_builder(layout, alert.get("rule"))
     layout.addWidget(QLabel("Urgency Level:")); layout.addWidget(urgency_input)
     layout.addWidget(QLabel("Link Clipboard Entry:")); layout.addWidget(clipboard_input)
     layout.addWidget(enable_toggle)
@@ -265,77 +528,156 @@ def open_edit_alert_dialog(alert_index, parent_widget):
     dialog.setLayout(layout)
 
     def save_edited_alert():
-        alert["title"] = title_input.text().strip() or "Untitled Alert"
-        alert["description"] = description_input.toPlainText().strip()
-        alert["time"] = time_input.time().toString("HH:mm")
-        alert["repeat_interval"] = repeat_input.value()
-        alert["urgency"] = urgency_input.currentText()
-        alert["enabled"] = enable_toggle.isChecked()
-        selected_clip = clipboard_input.currentText()
-        if selected_clip != "None":
-            alert["linked_clipboard"] = selected_clip
+        changes = {
+            "title": title_input.text().strip() or "Untitled Alert",
+            "description": description_input.toPlainText().strip(),
+            "time": time_input.time().toString("HH:mm"),
+            "repeat_interval": repeat_input.value(),
+            "urgency": urgency_input.currentText(),
+            "enabled": enable_toggle.isChecked()
+        }
+        removed = ["linked_clipboard"]
+        selected_clip = clipboard_input.currentData()
+        if selected_clip:
+            changes["linked_clip_id"] = selected_clip
+        else:
+            removed.append("linked_clip_id")
+        rule = get_rule()
+        if rule:
+            changes["rule"] = rule
         else:
-            alert.pop("linked_clipboard", None)
+            removed.append("rule")
 
-        write_alerts_data(alerts)
-        load_alerts(parent_widget.findChild(QScrollArea).widget().layout(), parent_widget)
+        get_alert_store().update(alert_id, changes, removed)
         dialog.close()
 
     save_btn.clicked.connect(save_edited_alert)
     dialog.exec()
 
 
-# ===== Toggle Enable/Disable =====
-def toggle_alert(alert_index, state, parent_widget):
-    alerts = read_alerts_data()
-    alerts[alert_index]["enabled"] = bool(state)
-    write_alerts_data(alerts)
-    load_alerts(parent_widget.findChild(QScrollArea).widget().layout(), parent_widget)
-
-
-# ===== Data Handling =====
-def read_alerts_data():
-    if not os.path.exists(ALERTS_FILE):
-        return []
-    with open(ALERTS_FILE, 'r') as file:
-        return json.load(file).get("alerts", [])
+# ===== Schedule Rule Builder =====
+SCHEDULE_KINDS = [
+    ("Standard (once, or daily with repeat)", None),
+    ("Days of Week", "daily"),
+    ("During Shift", "shift"),
+    ("Monthly", "monthly"),
+]
+
+def add_rule_builder(layout, rule=None):
+    """Add the schedule controls to a dialog layout.
+
+    Returns a function that reads the rule back (None for a standard alert).
+    The repeat interval spin box doubles as the rule's "every" interval.
+    """
+    rule = rule or {}
+
+    kind_input = QComboBox()
+    for label, _ in SCHEDULE_KINDS:
+        kind_input.addItem(label)
+    kinds = [kind for _, kind in SCHEDULE_KINDS]
+    kind_input.setCurrentIndex(kinds.index(rule.get("kind")) if rule.get("kind") in kinds else 0)
+
+    # Days of week (daily / shift)
+    days_row = QWidget()
+    days_layout = QHBoxLayout(days_row)
+    days_layout.setContentsMargins(0, 0, 0, 0)
+    day_boxes = []
+    for day, name in enumerate(DAY_NAMES):
+        box = QCheckBox(name)
+        box.setChecked(day in (rule.get("days") or ALL_DAYS))
+        days_layout.addWidget(box)
+        day_boxes.append(box)
+
+    # Repeat-until (daily)
+    until_row = QWidget()
+    until_layout = QHBoxLayout(until_row)
+    until_layout.setContentsMargins(0, 0, 0, 0)
+    until_toggle = QCheckBox("Stop repeating at")
+    until_input = QTimeEdit(); until_input.setDisplayFormat("HH:mm")
+    if rule.get("until"):
+        until_toggle.setChecked(True)
+        hours, minutes = map(int, rule["until"].split(":"))
+        until_input.setTime(QTime(hours, minutes))
+    until_layout.addWidget(until_toggle); until_layout.addWidget(until_input); until_layout.addStretch()
+
+    # Shift
+    shift_input = QComboBox()
+    for name, (start, end) in SHIFTS.items():
+        shift_input.addItem(f"{name} ({start}-{end})", name)
+    shift_index = shift_input.findData(rule.get("shift", "First"))
+    shift_input.setCurrentIndex(shift_index if shift_index >= 0 else 0)
+
+    # Monthly
+    monthly_row = QWidget()
+    monthly_layout = QHBoxLayout(monthly_row)
+    monthly_layout.setContentsMargins(0, 0, 0, 0)
+    nth_input = QComboBox()
+    for nth, name in NTH_NAMES.items():
+        nth_input.addItem(name, nth)
+    nth_input.setCurrentIndex(max(nth_input.findData(int(rule.get("nth", 1))), 0))
+    weekday_input = QComboBox()
+    weekday_input.addItems(DAY_NAMES)
+    weekday_input.setCurrentIndex(int(rule.get("weekday", 0)))
+    monthly_layout.addWidget(nth_input); monthly_layout.addWidget(weekday_input)
+    monthly_layout.addWidget(QLabel("of the month")); monthly_layout.addStretch()
+
+    layout.addWidget(QLabel("Schedule:")); layout.addWidget(kind_input)
+    layout.addWidget(days_row)
+    layout.addWidget(until_row)
+    layout.addWidget(shift_input)
+    layout.addWidget(monthly_row)
+
+    def update_visibility():
+        kind = kinds[kind_input.currentIndex()]
+        days_row.setVisible(kind in ("daily", "shift"))
+        until_row.setVisible(kind == "daily")
+        shift_input.setVisible(kind == "shift")
+        monthly_row.setVisible(kind == "monthly")
+
+    kind_input.currentIndexChanged.connect(update_visibility)
+    update_visibility()
+
+    def get_rule():
+        kind = kinds[kind_input.currentIndex()]
+        if kind is None:
+            return None
+        if kind == "monthly":
+            return {"kind": "monthly", "nth": nth_input.currentData(), "weekday": weekday_input.currentIndex()}
+
+        new_rule = {"kind": kind, "days": [day for day, box in enumerate(day_boxes) if box.isChecked()] or ALL_DAYS}
+        if kind == "shift":
+            new_rule["shift"] = shift_input.currentData()
+        elif until_toggle.isChecked():
+            new_rule["until"] = until_input.time().toString("HH:mm")
+        return new_rule
+
+    return get_rule
 
 
-def write_alerts_data(alerts):
-    with open(ALERTS_FILE, 'w') as file:
-        json.dump({"alerts": alerts}, file, indent=4)
+# ===== Toggle Enable/Disable =====
+def toggle_alert(alert_id, state):
+    get_alert_store().update(alert_id, {"enabled": bool(state)})
 
 
 # ===== Clipboard Helper =====
-def get_clipboard_titles():
-    clipboard_file = f'./config/clipboard_{USERNAME}.json'
-    if not os.path.exists(clipboard_file):
-        return []
-
-    with open(clipboard_file, 'r') as file:
-        data = json.load(file).get("clips", [])
-
-    titles = []
-    for clip in data:
-        if "title" in clip:
-            titles.append(clip["title"])
-        else:
-            preview = clip["content"][:30] + ("..." if len(clip["content"]) > 30 else "")
-            titles.append(preview)
-    return titles
-
-def delete_alert(alert_index, parent_widget):
-    alerts = read_alerts_data()
+def populate_clip_combo(combo, selected_id=None):
+    combo.addItem("None", None)
+    for label, clip_id in get_clipboard_store().labels():
+        combo.addItem(label, clip_id)
+    index = combo.findData(selected_id) if selected_id else 0
+    combo.setCurrentIndex(max(index, 0))
+
+def delete_alert(alert_id, parent_widget):
+    alert = get_alert_store().get(alert_id)
+    if alert is None:
+        return
 
     confirm = QMessageBox.question(
         parent_widget,
         "Delete Alert",
-        f"Are you sure you want to delete '{alerts[alert_index]['title']}'?",
+        f"Are you sure you want to delete '{alert.get('title', 'Untitled')}'?",
         QMessageBox.Yes | QMessageBox.No
     )
 
     if confirm == QMessageBox.Yes:
-        if 0 <= alert_index < len(alerts):
-            alerts.pop(alert_index)
-            write_alerts_data(alerts)
-            load_alerts(parent_widget.findChild(QScrollArea).widget().layout(), parent_widget)
\ No newline at end of file
+        get_alert_store().remove(alert_id)
@@ -54,24 +54,24 @@
 # Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
 # ==============================================================================
 
-import threading
-import time
 import datetime
-import os
-import json
 import getpass
-import winsound
 
-from PySide6.QtWidgets import (
-    QApplication, QDialog, QScrollArea, QSizePolicy, QVBoxLayout, QLabel, QPushButton
-)
+from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import (
-    QTimer, Qt, QSize, QObject, Signal
+    QTimer, Qt, QObject, Signal
 )
 
+from lib.alert_scheduler import SchedulerCore
+from lib.alert_store import get_alert_store
+from lib.alert_notifications import get_notification_center
+from lib.alert_metrics import get_alert_metrics
+from lib.clipboard_store import get_clipboard_store
+
 # ===== User Info =====
 USERNAME = getpass.getuser()
-ALERTS_FILE = f'./config/alerts_{USERNAME}.json'
+
+MAX_SLEEP_MS = 60 * 1000    # re-check the wall clock at least once a minute
 
 # ===== Qt Signal Handler =====
 class AlertSignalHandler(QObject):
@@ -84,180 +84,121 @@ signal_handler = AlertSignalHandler()
 def trigger_alert(alert):
     urgency = alert.get("urgency", "Normal")
     print(f"[ALERT TRIGGERED] {alert.get('title')} - Urgency: {urgency}")
-    play_sound(urgency)
 
+    # Sound and popup are handled by the notification center, which coalesces bursts
     signal_handler.show_alert_signal.emit(alert)
 
-    clipboard_entry = alert.get("linked_clipboard")
-    if clipboard_entry:
-        print(f"[CLIPBOARD] Attempting to copy linked entry: {clipboard_entry}")
-        signal_handler.copy_clipboard_signal.emit(clipboard_entry)
-
-def play_sound(urgency):
-    if urgency == "Low":
-        winsound.MessageBeep(winsound.MB_ICONASTERISK)
-    elif urgency == "Normal":
-        winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
-    elif urgency == "High":
-        winsound.MessageBeep(winsound.MB_ICONHAND)
-    else:
-        winsound.MessageBeep()
-
-# ===== Background Monitoring =====
-def alert_monitor_loop():
-    while True:
-        check_alerts()
-        time.sleep(10)  # Every 10 seconds
+    clip_id = alert.get("linked_clip_id")
+    if clip_id:
+        print(f"[CLIPBOARD] Attempting to copy linked entry: {clip_id}")
+        signal_handler.copy_clipboard_signal.emit(clip_id)
+
+# ===== Scheduler =====
+class AlertScheduler(QObject):
+    """Fires alerts from a priority queue of precomputed fire times.
+
+    Sleeps on a single-shot QTimer until the earliest deadline and only
+    recomputes an alert's fire time when the AlertStore reports it changed.
+    Fires missed while the machine slept are delivered once (up to
+    CATCH_UP_WINDOW late). The decisions themselves live in SchedulerCore;
+    `clock` and `sink` can be swapped for testing.
+    """
+
+    def __init__(self, store, parent=None, clock=datetime.datetime.now, sink=None):
+        super().__init__(parent)
+        self.store = store
+        self.clock = clock
+        self.metrics = get_alert_metrics()
+        self.core = SchedulerCore(store, sink or self.deliver, clock)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.process_due)
+
+        store.alert_added.connect(self.on_alert_changed)
+        store.alert_updated.connect(self.on_alert_changed)
+        store.alert_removed.connect(self.on_alert_removed)
+        store.store_reset.connect(self.reload)
+
+    def start(self):
+        self.reload()
+
+    # ===== Loading =====
+    def reload(self):
+        self.core.reload()
+        print(f"[ALERTS] Scheduled {len(self.core.queue)} of {len(self.store)} alerts")
+        self.arm()
+
+    def on_alert_changed(self, alert_id):
+        alert = self.store.get(alert_id)
+        if alert is not None:
+            self.core.schedule_alert(alert)
+            self.arm()
+
+    def on_alert_removed(self, alert_id):
+        self.core.remove(alert_id)
+        self.arm()
+
+    # ===== Firing =====
+    def arm(self):
+        next_at = self.core.next_deadline()
+        if next_at is None:
+            self.timer.start(MAX_SLEEP_MS)
+            return
+        delay_ms = (next_at - self.clock()).total_seconds() * 1000
+        self.timer.start(int(min(max(delay_ms, 0), MAX_SLEEP_MS)))
+
+    def process_due(self):
+        self.core.process_due()
+        self.arm()
+
+    def deliver(self, alert, fire_at, now):
+        alert["fire_id"] = self.metrics.begin(alert, fire_at, now.timestamp())
+        trigger_alert(alert)
 
-def check_alerts():
-    now = datetime.datetime.now()
-    current_time_str = now.strftime("%H:%M")
-    current_timestamp_str = now.strftime("%Y-%m-%d %H:%M")
-
-    alerts = read_alerts_data()
-    updated = False
-
-    for alert in alerts:
-        if not alert.get("enabled", True):
-            continue
-
-        alert_time = alert.get("time")
-        repeat = alert.get("repeat_interval", 0)
-        last_triggered = alert.get("last_triggered", "")
-
-        # Skip if already triggered this minute
-        if last_triggered == current_timestamp_str:
-            continue
-
-        # Fire if one-time or repeatable
-        if current_time_str == alert_time or (
-            repeat > 0 and should_trigger_repeat(current_time_str, alert_time, repeat)
-        ):
-            alert["last_triggered"] = current_timestamp_str
-            trigger_alert(alert)
-
-            if repeat == 0:
-                alert["enabled"] = False
-
-            updated = True
-
-    if updated:
-        write_alerts_data(alerts)
-
-
-def should_trigger_repeat(current_time, start_time, interval):
-    fmt = "%H:%M"
-    ct = datetime.datetime.strptime(current_time, fmt)
-    st = datetime.datetime.strptime(start_time, fmt)
-
-    minutes_passed = int((ct - st).total_seconds() / 60)
-    return minutes_passed >= 0 and minutes_passed % interval == 0
 
 # ===== Start Alert Engine =====
-def start_alert_engine(parent_widget):
-    signal_handler.show_alert_signal.connect(lambda alert: show_popup(alert))
-    signal_handler.copy_clipboard_signal.connect(copy_clipboard_text)
+alert_scheduler = None
 
-    thread = threading.Thread(target=alert_monitor_loop, daemon=True)
-    thread.start()
-
-# ===== Pop-Up Dialog =====
-def show_popup(alert):
-    popup = PopUpAlertWindow(alert)
-    popup.exec()
-
-class PopUpAlertWindow(QDialog):
-    def __init__(self, alert):
-        super().__init__()
-        self.setWindowTitle("RSOC-OS Alert")
-        self.setWindowModality(Qt.ApplicationModal)
-        self.setWindowFlag(Qt.WindowStaysOnTopHint)
-        self.setFixedSize(QSize(350, 250))  # Slightly larger to fit content
-
-        urgency = alert.get("urgency", "Normal")
-        color = {
-            "Low": "#2980b9",
-            "Normal": "#f39c12",
-            "High": "#c0392b"
-        }.get(urgency, "#95a5a6")
-
-        layout = QVBoxLayout(self)
-
-        # Title
-        title = QLabel(alert.get("title", "Alert"))
-        title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: bold;
-            color: white;
-            background-color: {color};
-            padding: 10px;
-        """)
-        layout.addWidget(title)
-
-        # Scrollable Description
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFixedHeight(120)
-
-        desc_label = QLabel(alert.get("description", ""))
-        desc_label.setWordWrap(True)
-        desc_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        desc_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        desc_label.setContentsMargins(5, 5, 5, 5)
-
-        scroll_area.setWidget(desc_label)
-        layout.addWidget(scroll_area)
+def start_alert_engine(parent_widget):
+    global alert_scheduler
 
-        # Acknowledge Button
-        ack_btn = QPushButton("Acknowledge")
-        ack_btn.clicked.connect(self.accept)
-        layout.addWidget(ack_btn)
+    # Queued so alerts are delivered after the scheduler slot that fired them returns
+    notification_center = get_notification_center()
+    signal_handler.show_alert_signal.connect(notification_center.enqueue, Qt.QueuedConnection)
+    signal_handler.copy_clipboard_signal.connect(copy_clipboard_text, Qt.QueuedConnection)
 
-        # Final window positioning
-        self.adjustSize()
-        self.move(QApplication.primaryScreen().availableGeometry().center() - self.rect().center())
+    store = get_alert_store()
+    QApplication.instance().aboutToQuit.connect(store.flush)
+    migrate_clip_links(store)
 
+    alert_scheduler = AlertScheduler(store, parent_widget)
+    alert_scheduler.start()
+    return alert_scheduler
 
 # ===== Clipboard Integration =====
-def copy_clipboard_text(title):
+def migrate_clip_links(store):
+    """Convert title-based clipboard links from older alert files to clip IDs."""
+    clips = get_clipboard_store()
+    for alert_id in store.ids():
+        alert = store.get(alert_id)
+        title = alert.get("linked_clipboard") if alert else None
+        if not title:
+            continue
+        clip_id = clips.resolve(alert.get("linked_clip_id"), title)
+        if clip_id:
+            store.update(alert_id, {"linked_clip_id": clip_id}, removed_keys=("linked_clipboard",))
+        else:
+            print(f"[CLIPBOARD] No clip titled '{title}' for alert '{alert.get('title')}'")
+
+def copy_clipboard_text(clip_id):
     app = QApplication.instance()
     if app is None:
         print("[ERROR] QApplication instance not found for clipboard!")
         return
 
-    clipboard_file = f'./config/clipboard_{USERNAME}.json'
-    if not os.path.exists(clipboard_file):
-        print("[ERROR] Clipboard file not found.")
+    if not get_clipboard_store().copy_to_system_clipboard(clip_id):
+        print(f"[ERROR] Linked clipboard entry {clip_id} no longer exists.")
         return
-
-    with open(clipboard_file, 'r') as file:
-        clips = json.load(file).get("clips", [])
-
-    for clip in clips:
-        if clip.get("title") == title:
-            content = clip.get("content", "")
-            app.clipboard().setText(content)
-            app.processEvents()
-            print(f"[CLIPBOARD] Copied content: {content[:30]}...")
-            break
-
-# ===== JSON Read/Write =====
-def read_alerts_data():
-    if not os.path.exists(ALERTS_FILE):
-        return []
-
-    with open(ALERTS_FILE, 'r') as file:
-        alerts = json.load(file).get("alerts", [])
-
-    # Patch old-format timestamps
-    for alert in alerts:
-        lt = alert.get("last_triggered", "")
-        if lt and len(lt) == 5:
-            alert["last_triggered"] = ""
-
-    return alerts
-
-def write_alerts_data(alerts):
-    with open(ALERTS_FILE, 'w') as file:
-        json.dump({"alerts": alerts}, file, indent=4)
+    print(f"[CLIPBOARD] Copied linked entry {clip_id}")
@@ -0,0 +1,145 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import os
+import hashlib
+import tempfile
+
+# Content-addressed payload storage (no Qt): each blob is named by the
+# SHA-256 of its bytes, so identical payloads are stored once and a blob
+# never changes after it is written. Thumbnails for image blobs are made
+# once and cached next to them (see make_thumbnail).
+
+BLOB_DIR = './config/clipboard_blobs'
+THUMBNAIL_SIZE = (226, 86)   # fits the preview area of a clipboard card
+
+
+class BlobStore:
+    def __init__(self, root=BLOB_DIR):
+        self.root = root
+
+    def path(self, digest):
+        # Two-character fan-out keeps directories small on big libraries
+        return os.path.join(self.root, digest[:2], digest)
+
+    def thumbnail_path(self, digest):
+        return os.path.join(self.root, "thumbs", f"{digest}.png")
+
+    def put(self, data):
+        """Store `data` and return its digest; an existing copy is reused."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        return digest
+
+    def get(self, digest):
+        try:
+            with open(self.path(digest), 'rb') as file:
+                return file.read()
+        except OSError:
+            print(f"[BLOB] Missing blob {digest}")
+            return None
+
+    def __contains__(self, digest):
+        return os.path.exists(self.path(digest))
+
+    def collect(self, live_digests):
+        """Delete blobs (and thumbnails) that no clip references any more."""
+        if not os.path.isdir(self.root):
+            return 0
+        removed = 0
+        for folder in os.listdir(self.root):
+            folder_path = os.path.join(self.root, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for name in os.listdir(folder_path):
+                digest = name[:-4] if folder == "thumbs" and name.endswith(".png") else name
+                if digest in live_digests or name.startswith(".tmp_"):
+                    continue
+                os.remove(os.path.join(folder_path, name))
+                removed += folder != "thumbs"
+        return removed
+
+
+def make_thumbnail(blobs, digest):
+    """Path of the blob's thumbnail, rendering it on first use. Requires Qt."""
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QImage
+
+    path = blobs.thumbnail_path(digest)
+    if os.path.exists(path):
+        return path
+
+    image = QImage()
+    data = blobs.get(digest)
+    if data is None or not image.loadFromData(data):
+        return None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    thumbnail = image.scaled(*THUMBNAIL_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    thumbnail.save(path, "PNG")
+    return path
@@ -0,0 +1,256 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import re
+import time
+import zlib
+import sqlite3
+import getpass
+import hashlib
+import threading
+from collections import namedtuple
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QGuiApplication
+
+# ===== User-specific history database =====
+USERNAME = getpass.getuser()
+HISTORY_DB = f'./config/clipboard_history_{USERNAME}.db'
+
+MAX_HISTORY_ENTRIES = 500
+MAX_HISTORY_BYTES = 4 * 1024 * 1024    # budget for stored (compressed) payloads
+MAX_ENTRY_BYTES = 256 * 1024           # larger copies are not recorded
+COMPRESS_THRESHOLD = 512               # payloads above this are zlib-compressed
+PREVIEW_CHARS = 200
+SEARCH_CHARS = 1000
+
+# Clipboard formats set by password managers that ask not to be recorded
+SECRET_FORMAT_HINTS = ("ExcludeClipboardContentFromMonitorProcessing", "x-kde-passwordManagerHint")
+
+HistoryEntry = namedtuple("HistoryEntry", "hash preview size copy_count first_copied last_copied")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    hash TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    compressed INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    preview TEXT NOT NULL,
+    search_text TEXT NOT NULL,
+    copy_count INTEGER NOT NULL DEFAULT 1,
+    first_copied REAL NOT NULL,
+    last_copied REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_last_copied ON history (last_copied);
+"""
+
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def like_pattern(word):
+    return "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+class ClipboardHistory(QObject):
+    """Bounded, deduplicated history of text copied anywhere on the system.
+
+    Entries live only in SQLite: one row per distinct text (keyed by content
+    hash), with larger payloads compressed. Re-copying the same text just
+    moves it to the top. The oldest entries are evicted once the history
+    exceeds MAX_HISTORY_ENTRIES or MAX_HISTORY_BYTES, so memory and disk stay
+    flat however long the app runs. Used from the GUI thread only.
+    """
+
+    entry_recorded = Signal(str)
+    history_changed = Signal()
+
+    def __init__(self, path=HISTORY_DB, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.capturing = False
+        self._db = sqlite3.connect(path or ":memory:")
+        self._db.execute("PRAGMA cache_size = -512")   # KiB; keeps the page cache small
+        self._db.executescript(SCHEMA)
+        self._total_bytes = self._db.execute("SELECT COALESCE(SUM(stored_bytes), 0) FROM history").fetchone()[0]
+
+    # ===== Capture =====
+    def start_capture(self):
+        if not self.capturing:
+            QGuiApplication.clipboard().dataChanged.connect(self.on_clipboard_changed)
+            self.capturing = True
+
+    def stop_capture(self):
+        if self.capturing:
+            QGuiApplication.clipboard().dataChanged.disconnect(self.on_clipboard_changed)
+            self.capturing = False
+
+    def on_clipboard_changed(self):
+        mime = QGuiApplication.clipboard().mimeData()
+        if mime is None or not mime.hasText():
+            return
+        if any(hint in fmt for fmt in mime.formats() for hint in SECRET_FORMAT_HINTS):
+            return
+        self.record(mime.text())
+
+    # ===== Recording =====
+    def record(self, text, when=None):
+        """Store `text` (or bump its existing entry); returns its hash, or None if skipped."""
+        if not text or not text.strip():
+            return None
+        data = text.encode("utf-8")
+        if len(data) > MAX_ENTRY_BYTES:
+            return None
+
+        digest = content_hash(data)
+        when = when if when is not None else time.time()
+        with self._db:
+            bumped = self._db.execute(
+                "UPDATE history SET last_copied = ?, copy_count = copy_count + 1 WHERE hash = ?",
+                (when, digest)).rowcount
+            if not bumped:
+                compressed = len(data) > COMPRESS_THRESHOLD
+                payload = zlib.compress(data, 6) if compressed else data
+                preview = re.sub(r"\s+", " ", text[:PREVIEW_CHARS]).strip()
+                self._db.execute(
+                    "INSERT INTO history (hash, payload, compressed, stored_bytes, size, preview, search_text,"
+                    " first_copied, last_copied) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (digest, payload, int(compressed), len(payload), len(data), preview,
+                     text[:SEARCH_CHARS].lower(), when, when))
+                self._total_bytes += len(payload)
+                self._evict()
+
+        self.entry_recorded.emit(digest)
+        return digest
+
+    def _evict(self):
+        count = self._db.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+        if count <= MAX_HISTORY_ENTRIES and self._total_bytes <= MAX_HISTORY_BYTES:
+            return
+        rows = self._db.execute("SELECT hash, stored_bytes FROM history ORDER BY last_copied").fetchall()
+        doomed = []
+        for digest, stored_bytes in rows:
+            if count <= MAX_HISTORY_ENTRIES and self._total_bytes <= MAX_HISTORY_BYTES:
+                break
+            doomed.append((digest,))
+            count -= 1
+            self._total_bytes -= stored_bytes
+        self._db.executemany("DELETE FROM history WHERE hash = ?", doomed)
+
+    # ===== Reading =====
+    def search(self, query="", limit=200):
+        """Newest entries whose text contains every word of `query`."""
+        words = query.lower().split()
+        where = " AND ".join("search_text LIKE ? ESCAPE '\\'" for _ in words) or "1"
+        rows = self._db.execute(
+            f"SELECT hash, preview, size, copy_count, first_copied, last_copied FROM history"
+            f" WHERE {where} ORDER BY last_copied DESC LIMIT ?",
+            [like_pattern(word) for word in words] + [limit]).fetchall()
+        return [HistoryEntry(*row) for row in rows]
+
+    def text(self, digest):
+        row = self._db.execute("SELECT payload, compressed FROM history WHERE hash = ?", (digest,)).fetchone()
+        if row is None:
+            return None
+        payload, compressed = row
+        return (zlib.decompress(payload) if compressed else payload).decode("utf-8")
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    # ===== Editing =====
+    def remove(self, digest):
+        with self._db:
+            row = self._db.execute("SELECT stored_bytes FROM history WHERE hash = ?", (digest,)).fetchone()
+            if row is None:
+                return False
+            self._db.execute("DELETE FROM history WHERE hash = ?", (digest,))
+            self._total_bytes -= row[0]
+        self.history_changed.emit()
+        return True
+
+    def clear(self):
+        with self._db:
+            self._db.execute("DELETE FROM history")
+        self._db.execute("VACUUM")
+        self._total_bytes = 0
+        self.history_changed.emit()
+
+
+# ===== Shared Instance =====
+_history = None
+_history_lock = threading.Lock()
+
+def get_clipboard_history():
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = ClipboardHistory()
+        return _history
+
+def set_clipboard_history_enabled(enabled):
+    history = get_clipboard_history()
+    if enabled:
+        history.start_capture()
+    else:
+        history.stop_capture()
+    return history
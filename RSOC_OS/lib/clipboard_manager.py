@@ -55,26 +55,48 @@
 # ==============================================================================
 
 import os
-import json
-import getpass
+import datetime
+
 from PySide6.QtWidgets import (
-    QLineEdit, QSizePolicy, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QDialog, QScrollArea, QGridLayout
+    QApplication, QLineEdit, QSizePolicy, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QDialog,
+    QListView, QStyledItemDelegate, QStyle, QStyleOptionButton, QComboBox, QStackedWidget, QMessageBox, QFileDialog
+)
+from PySide6.QtCore import (
+    Qt, QSize, QRect, QEvent, Signal, QAbstractListModel, QModelIndex, QSortFilterProxyModel, QBuffer, QIODevice
+)
+from PySide6.QtGui import (
+    QClipboard, QGuiApplication, QIcon, QPainter, QPen, QFont, QFontMetrics, QPixmap, QPixmapCache
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QClipboard, QGuiApplication, QIcon
 
-# Define user-specific JSON path
-USERNAME = getpass.getuser()
-CLIPBOARD_FILE = f'./config/clipboard_{USERNAME}.json'
+from lib.clipboard_store import ClipRecord, new_clip_id, normalize_trigger, get_clipboard_store
+from lib.clipboard_history import get_clipboard_history
+
+CARD_SIZE = QSize(250, 150)
+PREVIEW_CHARS = 125
+
+ClipIdRole = Qt.UserRole + 1
+ClipRole = Qt.UserRole + 2
+PinnedRole = Qt.UserRole + 3
+OrderRole = Qt.UserRole + 4
+HistoryHashRole = Qt.UserRole + 5
 
 
 def get_clipboard_widget(parent=None):
     widget = QWidget()
     layout = QVBoxLayout()
+    store = get_clipboard_store()
 
-    # ===== Top Bar (Centered Title + Right-Aligned Add Button) =====
+    # ===== Top Bar (Search + Centered Title + Right-Aligned Add Button) =====
     top_bar = QHBoxLayout()
 
+    search_input = QLineEdit()
+    search_input.setPlaceholderText("Search clips...")
+    search_input.setClearButtonEnabled(True)
+    search_input.setMaximumWidth(220)
+
+    mode_input = QComboBox()
+    mode_input.addItems(["Snippets", "History"])
+
     left_spacer = QWidget()
     left_spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
@@ -88,100 +110,385 @@ def get_clipboard_widget(parent=None):
     add_button = QPushButton("Add New")
     add_button.clicked.connect(lambda: open_add_dialog(widget))
 
+    image_button = QPushButton("Add Image")
+    image_button.clicked.connect(lambda: add_image_clip(widget))
+
+    top_bar.addWidget(mode_input)
+    top_bar.addWidget(search_input)
     top_bar.addWidget(left_spacer)
     top_bar.addWidget(title)
     top_bar.addWidget(right_spacer)
+    top_bar.addWidget(image_button)
     top_bar.addWidget(add_button)
 
     layout.addLayout(top_bar)
 
-    # ===== Scrollable Grid for Clipboard Entries =====
-    scroll_area = QScrollArea()
-    scroll_area.setWidgetResizable(True)
-
-    content_widget = QWidget()
-    grid_layout = QGridLayout()
-    content_widget.setLayout(grid_layout)
-
-    scroll_area.setWidget(content_widget)
-    layout.addWidget(scroll_area)
+    # ===== Card Grid =====
+    model = ClipListModel(store, widget)
+    proxy = ClipFilterProxy(store, widget)
+    proxy.setSourceModel(model)
+    proxy.sort(0)
+
+    delegate = ClipCardDelegate(store, widget)
+    delegate.copy_requested.connect(store.copy_to_system_clipboard)
+    delegate.pin_requested.connect(toggle_pin)
+    delegate.edit_requested.connect(lambda clip_id: open_edit_dialog(widget, clip_id))
+    delegate.delete_requested.connect(delete_clip)
+
+    view = QListView()
+    view.setObjectName("ClipboardCardView")
+    view.setModel(proxy)
+    view.setItemDelegate(delegate)
+    view.setFlow(QListView.LeftToRight)
+    view.setWrapping(True)
+    view.setResizeMode(QListView.Adjust)
+    view.setUniformItemSizes(True)
+    view.setSpacing(6)
+    view.setSelectionMode(QListView.NoSelection)
+    view.setVerticalScrollMode(QListView.ScrollPerPixel)
+
+    pages = QStackedWidget()
+    pages.addWidget(view)
+    pages.addWidget(create_history_page(search_input, widget))
+    layout.addWidget(pages)
+
+    search_input.textChanged.connect(proxy.set_query)
+    mode_input.currentIndexChanged.connect(pages.setCurrentIndex)
 
     widget.setLayout(layout)
-
-    # Load and display saved clipboard entries
-    load_clips(grid_layout, widget)
-
     return widget
 
-# ===== Load Clipboard Data and Populate Grid =====
-def load_clips(grid_layout, parent_widget):
-    clips = read_clipboard_data()
 
-    clips = sorted(clips, key=lambda x: x.get("pinned", False), reverse=True)
+# ===== Clip Model =====
+class ClipListModel(QAbstractListModel):
+    """List model over the ClipboardStore, updated row by row from its change signals."""
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._ids = []
+        self._rows = {}
+        self._clips = {}
+
+        # Bound to this model, so Qt drops the connections when the view is deleted
+        store.clip_added.connect(self.on_clip_added)
+        store.clip_updated.connect(self.on_clip_updated)
+        store.clip_removed.connect(self.on_clip_removed)
+        store.store_reset.connect(self.reload)
+
+        self.reload()
+
+    # ===== Qt Model API =====
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        clip_id = self._ids[index.row()]
+        clip = self._clips[clip_id]
+
+        if role == Qt.DisplayRole:
+            return clip.title or "(No Title)"
+        if role == Qt.ToolTipRole:
+            return clip.preview_text
+        if role == ClipIdRole:
+            return clip_id
+        if role == ClipRole:
+            return clip
+        if role == PinnedRole:
+            return clip.pinned
+        if role == OrderRole:
+            return index.row()
+        return None
+
+    def clip_id(self, row):
+        return self._ids[row]
+
+    # ===== Store Updates =====
+    def reload(self):
+        self.beginResetModel()
+        clips = self.store.all()
+        self._ids = [clip.id for clip in clips]
+        self._clips = {clip.id: clip for clip in clips}
+        self._reindex()
+        self.endResetModel()
+
+    def on_clip_added(self, clip_id):
+        clip = self.store.get(clip_id)
+        if clip is None or clip_id in self._rows:
+            return
+        # New clips are always the newest, shown first
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._ids.insert(0, clip_id)
+        self._clips[clip_id] = clip
+        self._reindex()
+        self.endInsertRows()
+
+    def on_clip_updated(self, clip_id):
+        clip = self.store.get(clip_id)
+        row = self._rows.get(clip_id)
+        if clip is None or row is None:
+            return
+        self._clips[clip_id] = clip
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def on_clip_removed(self, clip_id):
+        row = self._rows.get(clip_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        self._clips.pop(clip_id, None)
+        self._reindex()
+        self.endRemoveRows()
+
+    def _reindex(self):
+        self._rows = {clip_id: row for row, clip_id in enumerate(self._ids)}
+
+
+class ClipFilterProxy(QSortFilterProxyModel):
+    """Filters by the search box through the store's prefix index and lists pinned clips first."""
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.query = ""
+        self.matches = None
+        self.setDynamicSortFilter(True)
+
+        # Re-run the query once the model has applied an edit
+        store.clip_added.connect(self.refresh_matches)
+        store.clip_updated.connect(self.refresh_matches)
+
+    def set_query(self, query):
+        self.query = query
+        self.matches = self.store.search(query)
+        self.invalidateFilter()
+
+    def refresh_matches(self, clip_id):
+        if self.matches is not None:
+            self.set_query(self.query)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.matches is None:
+            return True
+        return self.sourceModel().clip_id(source_row) in self.matches
+
+    def lessThan(self, left, right):
+        left_key = (not left.data(PinnedRole), left.data(OrderRole))
+        right_key = (not right.data(PinnedRole), right.data(OrderRole))
+        return left_key < right_key
+
+
+# ===== Clip Card Delegate =====
+class ClipCardDelegate(QStyledItemDelegate):
+    """Paints clipboard cards directly instead of creating widgets per clip."""
+
+    copy_requested = Signal(str)
+    pin_requested = Signal(str)
+    edit_requested = Signal(str)
+    delete_requested = Signal(str)
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.pin_icons = {True: QIcon('images/pin_filled.png'), False: QIcon('images/pin_hollow.png')}
+
+    def thumbnail(self, clip):
+        # Thumbnails are small files made once per image; QPixmapCache keeps
+        # only recently painted ones in memory
+        pixmap = QPixmapCache.find(clip.blob)
+        if pixmap is None or pixmap.isNull():
+            path = self.store.thumbnail(clip.id)
+            pixmap = QPixmap(path) if path else QPixmap()
+            QPixmapCache.insert(clip.blob, pixmap)
+        return pixmap
+
+    def sizeHint(self, option, index):
+        return CARD_SIZE
+
+    def card_rects(self, rect):
+        card = rect.adjusted(2, 2, -2, -2)
+        inner = card.adjusted(10, 8, -10, -8)
+        button_width = (inner.width() - 12) // 3
+        button_top = inner.bottom() - 26
+        return {
+            "card": card,
+            "title": QRect(inner.left(), inner.top(), inner.width() - 24, 20),
+            "pin": QRect(inner.right() - 19, inner.top(), 20, 20),
+            "preview": QRect(inner.left(), inner.top() + 24, inner.width(), button_top - inner.top() - 28),
+            "copy": QRect(inner.left(), button_top, button_width, 26),
+            "edit": QRect(inner.left() + button_width + 6, button_top, button_width, 26),
+            "delete": QRect(inner.left() + 2 * (button_width + 6), button_top, button_width, 26),
+        }
+
+    def paint(self, painter, option, index):
+        clip = index.data(ClipRole)
+        rects = self.card_rects(option.rect)
+        palette = option.palette
+        style = option.widget.style() if option.widget else QApplication.style()
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        painter.setPen(QPen(palette.mid().color()))
+        painter.setBrush(palette.base())
+        painter.drawRoundedRect(rects["card"], 8, 8)
+        painter.setPen(palette.text().color())
+
+        title_font = QFont(option.font)
+        title_font.setBold(bool(clip.title))
+        painter.setFont(title_font)
+        title = clip.title or "(No Title)"
+        if clip.trigger:
+            title += f"  [{clip.trigger}]"
+        painter.drawText(rects["title"], Qt.AlignLeft | Qt.AlignVCenter,
+                         QFontMetrics(title_font).elidedText(title, Qt.ElideRight, rects["title"].width()))
+        self.pin_icons[clip.pinned].paint(painter, rects["pin"])
+
+        painter.setFont(option.font)
+        if clip.kind == "image":
+            pixmap = self.thumbnail(clip)
+            target = QRect(rects["preview"].topLeft(), pixmap.size().boundedTo(rects["preview"].size()))
+            painter.drawPixmap(target, pixmap)
+        else:
+            content = clip.preview_text
+            preview = content[:PREVIEW_CHARS] + ("..." if len(content) > PREVIEW_CHARS else "")
+            painter.drawText(rects["preview"], Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, preview)
+        painter.restore()
+
+        # Buttons drawn with the widget style so themes apply
+        for key, label in (("copy", "Copy"), ("edit", "Edit"), ("delete", "Delete")):
+            button = QStyleOptionButton()
+            button.rect = rects[key]
+            button.text = label
+            button.state = QStyle.State_Enabled | QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+
+        rects = self.card_rects(option.rect)
+        pos = event.position().toPoint()
+        clip_id = index.data(ClipIdRole)
+
+        if rects["copy"].contains(pos):
+            self.copy_requested.emit(clip_id)
+        elif rects["pin"].contains(pos):
+            self.pin_requested.emit(clip_id)
+        elif rects["edit"].contains(pos):
+            self.edit_requested.emit(clip_id)
+        elif rects["delete"].contains(pos):
+            self.delete_requested.emit(clip_id)
+        else:
+            return False
+        return True
+
+
+# ===== Clipboard History =====
+def create_history_page(search_input, parent_widget):
+    history = get_clipboard_history()
+    page = QWidget()
+    layout = QVBoxLayout(page)
+    layout.setContentsMargins(0, 0, 0, 0)
+
+    status_label = QLabel()
+    layout.addWidget(status_label)
+
+    model = HistoryListModel(history, page)
+    view = QListView()
+    view.setModel(model)
+    view.setUniformItemSizes(True)
+    view.setAlternatingRowColors(True)
+    view.doubleClicked.connect(lambda index: copy_to_clipboard(history.text(index.data(HistoryHashRole)) or ""))
+    layout.addWidget(view)
 
-    # Clear existing grid
-    for i in reversed(range(grid_layout.count())):
-        grid_layout.itemAt(i).widget().setParent(None)
-
-    # Display clips in 3-column grid
-    col_count = 3
-    for index, clip in enumerate(clips):
-        row = index // col_count
-        col = index % col_count
-        grid_layout.addWidget(create_clip_card(clip, parent_widget), row, col)
-
-# ===== Create Individual Clipboard Card =====
-def create_clip_card(clip, parent_widget):
-    card = QWidget()
-    card.setObjectName("ClipboardCard")
-    card_layout = QVBoxLayout()
-
-    top_bar = QHBoxLayout()
-
-    if "title" in clip:
-        title_label = QLabel(clip["title"])
-        title_label.setStyleSheet("font-weight: bold;")
-    else:
-        title_label = QLabel("(No Title)")
-
-    pin_button = QPushButton()
-    update_pin_icon(pin_button, clip.get("pinned", False))
-    pin_button.setFixedSize(20, 20)
-    pin_button.setStyleSheet("border: none;")
-    pin_button.clicked.connect(lambda: toggle_pin(clip, parent_widget))
-
-    top_bar.addWidget(title_label)
-    top_bar.addStretch()
-    top_bar.addWidget(pin_button)
-
-    card_layout.addLayout(top_bar)
-
-    # Truncate display text
-    display_text = clip["content"][:125] + ("..." if len(clip["content"]) > 75 else "")
-    preview_label = QLabel(display_text)
-    preview_label.setWordWrap(True)
-    card_layout.addWidget(preview_label)
-
-    # Buttons: Copy, Edit, Delete
     button_layout = QHBoxLayout()
-
     copy_btn = QPushButton("Copy")
-    copy_btn.clicked.connect(lambda: copy_to_clipboard(clip["content"]))
-
-    edit_btn = QPushButton("Edit")
-    edit_btn.clicked.connect(lambda: open_edit_dialog(parent_widget, clip))
-
+    snippet_btn = QPushButton("Save as Snippet")
     delete_btn = QPushButton("Delete")
-    delete_btn.clicked.connect(lambda: delete_clip(parent_widget, clip))
-
-    for btn in [copy_btn, edit_btn, delete_btn]:
+    clear_btn = QPushButton("Clear History")
+    for btn in [copy_btn, snippet_btn, delete_btn]:
         button_layout.addWidget(btn)
-
-    card_layout.addLayout(button_layout)
-    card.setLayout(card_layout)
-    card.setFixedSize(QSize(250, 150))
-
-    return card
+    button_layout.addStretch()
+    button_layout.addWidget(clear_btn)
+    layout.addLayout(button_layout)
+
+    def selected_hash():
+        index = view.currentIndex()
+        return index.data(HistoryHashRole) if index.isValid() else None
+
+    def copy_selected():
+        digest = selected_hash()
+        if digest:
+            copy_to_clipboard(history.text(digest) or "")
+
+    def save_selected():
+        digest = selected_hash()
+        text = history.text(digest) if digest else None
+        if text:
+            get_clipboard_store().add(ClipRecord(id=new_clip_id(), content=text))
+
+    def delete_selected():
+        digest = selected_hash()
+        if digest:
+            history.remove(digest)
+
+    def update_status():
+        state = "Recording" if history.capturing else "Recording is off (enable it in Settings)"
+        status_label.setText(f"{state} · {len(history)} entries · {history.total_bytes / 1024:.0f} KB stored")
+
+    copy_btn.clicked.connect(copy_selected)
+    snippet_btn.clicked.connect(save_selected)
+    delete_btn.clicked.connect(delete_selected)
+    clear_btn.clicked.connect(history.clear)
+    search_input.textChanged.connect(model.set_query)
+    model.modelReset.connect(update_status)
+
+    update_status()
+    return page
+
+
+class HistoryListModel(QAbstractListModel):
+    """The newest matching history entries; re-queried from SQLite on every change."""
+
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.query = ""
+        self._entries = []
+
+        history.entry_recorded.connect(self.refresh)
+        history.history_changed.connect(self.refresh)
+        self.refresh()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return entry.preview
+        if role == Qt.ToolTipRole:
+            last = datetime.datetime.fromtimestamp(entry.last_copied)
+            return f"Copied {entry.copy_count}x, last {last:%b %d %H:%M} · {entry.size} bytes"
+        if role == HistoryHashRole:
+            return entry.hash
+        return None
+
+    def set_query(self, query):
+        self.query = query
+        self.refresh()
+
+    def refresh(self, *args):
+        self.beginResetModel()
+        self._entries = self.history.search(self.query)
+        self.endResetModel()
 
 
 # ===== Clipboard Functions =====
@@ -199,99 +506,113 @@ def open_add_dialog(parent_widget):
     title_input.setPlaceholderText("Enter title...")
     layout.addWidget(title_input)
 
+    trigger_input = QLineEdit()
+    trigger_input.setPlaceholderText("Optional trigger, e.g. ;ems")
+    layout.addWidget(trigger_input)
+
     text_edit = QTextEdit()
     text_edit.setPlaceholderText("Enter clipboard content...")
     layout.addWidget(text_edit)
 
     save_btn = QPushButton("Save")
-    save_btn.clicked.connect(lambda: save_new_clip(dialog, title_input.text(), text_edit.toPlainText(), parent_widget))
+    save_btn.clicked.connect(lambda: save_new_clip(dialog, title_input.text(), trigger_input.text(), text_edit.toPlainText()))
     layout.addWidget(save_btn)
 
     dialog.setLayout(layout)
     dialog.exec()
 
 
-def open_edit_dialog(parent_widget, clip):
+def open_edit_dialog(parent_widget, clip_id):
+    clip = get_clipboard_store().get(clip_id)
+    if clip is None:
+        return
+
     dialog = QDialog(parent_widget)
     dialog.setWindowTitle("Edit Clipboard Entry")
     layout = QVBoxLayout()
 
+    trigger_input = QLineEdit(clip.trigger)
+    trigger_input.setPlaceholderText("Optional trigger, e.g. ;ems")
+    layout.addWidget(trigger_input)
+
     text_edit = QTextEdit()
-    text_edit.setPlainText(clip["content"])
-    layout.addWidget(text_edit)
+    if clip.kind == "text":
+        text_edit.setPlainText(get_clipboard_store().content(clip_id))
+        layout.addWidget(text_edit)
 
     save_btn = QPushButton("Save Changes")
-    save_btn.clicked.connect(lambda: save_edited_clip(dialog, clip, text_edit.toPlainText(), parent_widget))
+    save_btn.clicked.connect(lambda: save_edited_clip(dialog, clip_id, trigger_input.text(),
+                                                      text_edit.toPlainText() if clip.kind == "text" else None))
     layout.addWidget(save_btn)
 
     dialog.setLayout(layout)
     dialog.exec()
 
 
-def save_new_clip(dialog, title, content, parent_widget):
+def save_new_clip(dialog, title, trigger, content):
     if content.strip() == "":
         dialog.close()
         return
 
-    clip_entry = {"content": content}
-    if title.strip():
-        clip_entry["title"] = title.strip()
+    trigger = normalize_trigger(trigger)
+    if not check_trigger(dialog, trigger):
+        return
 
-    clips = read_clipboard_data()
-    clips.insert(0, clip_entry)
-    write_clipboard_data(clips)
+    get_clipboard_store().add(ClipRecord(id=new_clip_id(), content=content, title=title.strip(), trigger=trigger))
     dialog.close()
 
-    refresh_display(parent_widget)
 
+def save_edited_clip(dialog, clip_id, trigger, new_content):
+    trigger = normalize_trigger(trigger)
+    if not check_trigger(dialog, trigger, clip_id):
+        return
 
-def save_edited_clip(dialog, clip, new_content, parent_widget):
-    clips = read_clipboard_data()
-    for c in clips:
-        if c == clip:
-            c["content"] = new_content
-            break
-    write_clipboard_data(clips)
+    changes = {"trigger": trigger}
+    if new_content is not None:
+        changes["content"] = new_content
+    get_clipboard_store().update(clip_id, changes)
     dialog.close()
 
-    refresh_display(parent_widget)
-
-
-def delete_clip(parent_widget, clip):
-    clips = read_clipboard_data()
-    clips = [c for c in clips if c != clip]
-    write_clipboard_data(clips)
-
-    refresh_display(parent_widget)
-
-# ===== Data Handling =====
-def read_clipboard_data():
-    if not os.path.exists(CLIPBOARD_FILE):
-        return []
-    with open(CLIPBOARD_FILE, 'r') as file:
-        return json.load(file).get("clips", [])
-
 
-def write_clipboard_data(clips):
-    with open(CLIPBOARD_FILE, 'w') as file:
-        json.dump({"clips": clips}, file, indent=4)
-
-
-def refresh_display(parent_widget):
-    grid_layout = parent_widget.findChild(QScrollArea).widget().layout()
-    load_clips(grid_layout, parent_widget)
-
-def update_pin_icon(button, pinned):
-    if pinned:
-        button.setIcon(QIcon('images/pin_filled.png'))
-    else:
-        button.setIcon(QIcon('images/pin_hollow.png'))
+def add_image_clip(parent_widget):
+    """Add the image on the system clipboard, or pick an image file if there is none."""
+    store = get_clipboard_store()
+    image = QGuiApplication.clipboard().image()
+    if not image.isNull():
+        buffer = QBuffer()
+        buffer.open(QIODevice.WriteOnly)
+        image.save(buffer, "PNG")
+        store.add_image(bytes(buffer.data()), title=f"Screenshot {datetime.datetime.now():%b %d %H:%M}")
+        return
 
-def toggle_pin(clip, parent_widget):
-    clips = read_clipboard_data()
-    for c in clips:
-        if c == clip:
-            c["pinned"] = not c.get("pinned", False)
-            break
-    write_clipboard_data(clips)
-    refresh_display(parent_widget)
\ No newline at end of file
+    path, _ = QFileDialog.getOpenFileName(parent_widget, "Add Image", "", "Images (*.png *.jpg *.jpeg *.bmp *.gif)")
+    if not path:
+        return
+    with open(path, 'rb') as file:
+        store.add_image(file.read(), title=os.path.splitext(os.path.basename(path))[0])
+
+
+def check_trigger(dialog, trigger, clip_id=None):
+    if not trigger:
+        return True
+    if len(trigger) < 2:
+        QMessageBox.warning(dialog, "Invalid Trigger", "Triggers need at least two characters.")
+        return False
+    conflict = get_clipboard_store().trigger_conflict(trigger, clip_id)
+    if conflict:
+        QMessageBox.warning(dialog, "Trigger In Use",
+                            f"'{trigger}' overlaps the existing trigger '{conflict}'. "
+                            "A trigger cannot be the start of another one.")
+        return False
+    return True
+
+
+def delete_clip(clip_id):
+    get_clipboard_store().remove(clip_id)
+
+
+def toggle_pin(clip_id):
+    store = get_clipboard_store()
+    clip = store.get(clip_id)
+    if clip is not None:
+        store.update(clip_id, {"pinned": not clip.pinned})
@@ -0,0 +1,450 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import os
+import json
+import uuid
+import getpass
+import datetime
+import threading
+from dataclasses import dataclass, field, replace
+
+from PySide6.QtCore import QObject, QTimer, QCoreApplication, Signal, Qt
+from PySide6.QtGui import QGuiApplication, QImage
+
+from lib.text_index import PrefixIndex
+from lib.blob_store import BlobStore, BLOB_DIR, make_thumbnail
+from lib.utils import atomic_write_json
+
+# ===== User-specific clipboard file =====
+USERNAME = getpass.getuser()
+CLIPBOARD_FILE = f'./config/clipboard_{USERNAME}.json'
+
+SAVE_DELAY_MS = 1500        # edits within this window are written as one snapshot
+INLINE_TEXT_LIMIT = 4096    # bytes; longer text is kept in the blob store
+PREVIEW_CHARS = 200         # text kept in the index for blob-backed clips
+
+
+def new_clip_id():
+    return uuid.uuid4().hex[:12]
+
+
+def timestamp():
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+def normalize_trigger(trigger):
+    """Triggers are matched against lower-case key names, without spaces."""
+    return "".join((trigger or "").split()).lower()
+
+
+# ===== Clip Record =====
+@dataclass
+class ClipRecord:
+    id: str
+    content: str = ""
+    title: str = ""
+    pinned: bool = False
+    trigger: str = ""       # typed anywhere to expand this clip, e.g. ";ems"
+    kind: str = "text"      # "text" or "image"
+    blob: str = ""          # digest of the payload in the blob store, if not inline
+    size: int = 0           # payload size in bytes when stored as a blob
+    preview: str = ""       # start of blob-backed text, for cards and search
+    created: str = ""
+    updated: str = ""
+    extra: dict = field(default_factory=dict)   # unknown keys from the file, written back untouched
+
+    FIELDS = ("id", "content", "title", "pinned", "trigger", "kind", "blob", "size", "preview", "created", "updated")
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {key: value for key, value in data.items() if key not in cls.FIELDS}
+        return cls(id=data.get("id") or new_clip_id(), content=data.get("content", ""),
+                   title=data.get("title", ""), pinned=bool(data.get("pinned", False)),
+                   trigger=normalize_trigger(data.get("trigger", "")), kind=data.get("kind", "text"),
+                   blob=data.get("blob", ""), size=int(data.get("size", 0)), preview=data.get("preview", ""),
+                   created=data.get("created", ""), updated=data.get("updated", ""), extra=extra)
+
+    @property
+    def preview_text(self):
+        return self.preview if self.blob else self.content
+
+    def to_dict(self):
+        data = {"id": self.id, "content": self.content}
+        if self.kind != "text":
+            data["kind"] = self.kind
+        if self.blob:
+            data["blob"] = self.blob
+            data["size"] = self.size
+        if self.preview:
+            data["preview"] = self.preview
+        if self.title:
+            data["title"] = self.title
+        if self.pinned:
+            data["pinned"] = True
+        if self.trigger:
+            data["trigger"] = self.trigger
+        if self.created:
+            data["created"] = self.created
+        if self.updated:
+            data["updated"] = self.updated
+        data.update(self.extra)
+        return data
+
+    def copy(self):
+        return replace(self, extra=dict(self.extra))
+
+
+def clip_label(clip):
+    """Title of a clip, or a short content preview for untitled clips."""
+    if clip.title:
+        return clip.title
+    if clip.kind == "image":
+        return "(Image)"
+    text = clip.preview_text
+    return text[:30] + ("..." if len(text) > 30 else "")
+
+
+def clip_search_text(clip):
+    # Blob-backed text is searched by its preview only, so the index stays small
+    return f"{clip.title} {clip.trigger} {clip.preview_text}"
+
+
+class ClipboardStore(QObject):
+    """In-memory index of the operator's clipboard snippets.
+
+    Clips are ClipRecords keyed by a stable ID, with a secondary title index
+    for legacy title-based links and a word/prefix index for search. Lookups
+    and edits are dict operations; the file is rewritten atomically once
+    edits settle (SAVE_DELAY_MS) and on quit. Images and text longer than
+    INLINE_TEXT_LIMIT live in a content-addressed BlobStore, so the file
+    (and memory) only hold their metadata and a short preview. Both clipboard_manager and the
+    alerts engine go through this object, and its change signals keep every
+    view current without re-reading the file.
+    """
+
+    clip_added = Signal(str)
+    clip_updated = Signal(str)
+    triggers_changed = Signal()
+    clip_removed = Signal(str)
+    store_reset = Signal()
+    _save_requested = Signal()
+
+    def __init__(self, path=CLIPBOARD_FILE, blob_root=BLOB_DIR, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.blobs = BlobStore(blob_root)
+        self._lock = threading.RLock()
+        self._clips = {}      # id -> ClipRecord, oldest first (shown newest first)
+        self._by_title = {}   # title -> {id: None} in insertion order
+        self._by_trigger = {} # trigger -> id
+        self._search_index = PrefixIndex()
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+        self._save_requested.connect(self._save_timer.start, Qt.QueuedConnection)
+        self._dirty = False
+
+        self.load()
+
+    # ===== Lookup =====
+    def get(self, clip_id):
+        with self._lock:
+            clip = self._clips.get(clip_id)
+            return clip.copy() if clip is not None else None
+
+    def content(self, clip_id):
+        """Full text of a text clip, reading the blob store if needed."""
+        clip = self.get(clip_id)
+        if clip is None or clip.kind != "text":
+            return None
+        if not clip.blob:
+            return clip.content
+        data = self.blobs.get(clip.blob)
+        return data.decode("utf-8") if data is not None else clip.preview
+
+    def thumbnail(self, clip_id):
+        clip = self.get(clip_id)
+        if clip is None or clip.kind != "image":
+            return None
+        return make_thumbnail(self.blobs, clip.blob)
+
+    def copy_to_system_clipboard(self, clip_id):
+        clip = self.get(clip_id)
+        if clip is None:
+            return False
+        clipboard = QGuiApplication.clipboard()
+        if clip.kind == "image":
+            data = self.blobs.get(clip.blob)
+            if data is None:
+                return False
+            clipboard.setImage(QImage.fromData(data))
+        else:
+            clipboard.setText(self.content(clip_id))
+        return True
+
+    def find_by_title(self, title):
+        """Newest clip with this title, matching the old first-in-file lookup."""
+        with self._lock:
+            ids = self._by_title.get(title)
+            return next(reversed(ids)) if ids else None
+
+    def resolve(self, clip_id=None, title=None):
+        """ID of a linked clip, falling back to the title for pre-ID links."""
+        with self._lock:
+            if clip_id and clip_id in self._clips:
+                return clip_id
+            if title:
+                return self.find_by_title(title)
+            return None
+
+    def find_by_trigger(self, trigger):
+        with self._lock:
+            return self._by_trigger.get(trigger)
+
+    def triggers(self):
+        with self._lock:
+            return list(self._by_trigger)
+
+    def trigger_conflict(self, trigger, clip_id=None):
+        """Another clip's trigger that equals, contains or starts `trigger`.
+
+        Expansion fires as soon as a trigger is typed, so one trigger that is a
+        prefix of another would make the longer one unreachable."""
+        with self._lock:
+            for other, other_id in self._by_trigger.items():
+                if other_id != clip_id and (other.startswith(trigger) or trigger.startswith(other)):
+                    return other
+            return None
+
+    def search(self, query):
+        """IDs of clips whose title or content match every word of `query`
+        as a prefix, or None when the query is empty."""
+        with self._lock:
+            return self._search_index.search(query)
+
+    def ids(self):
+        with self._lock:
+            return list(reversed(self._clips))
+
+    def all(self):
+        with self._lock:
+            return [clip.copy() for clip in reversed(self._clips.values())]
+
+    def labels(self):
+        """[(label, id)] for pickers such as the alert dialogs."""
+        with self._lock:
+            return [(clip_label(clip), clip.id) for clip in reversed(self._clips.values())]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._clips)
+
+    # ===== Editing =====
+    def add(self, clip):
+        """Add a ClipRecord or clip dict as the newest clip; returns its ID."""
+        with self._lock:
+            clip = clip.copy() if isinstance(clip, ClipRecord) else ClipRecord.from_dict(clip)
+            clip.created = clip.created or timestamp()
+            clip.updated = clip.updated or clip.created
+            clip.trigger = normalize_trigger(clip.trigger)
+            self._offload(clip)
+            replaced = self._clips.pop(clip.id, None)
+            if replaced is not None:
+                self._unindex(replaced)
+            self._clips[clip.id] = clip
+            self._index(clip)
+            self._changed()
+        self.clip_added.emit(clip.id)
+        if clip.trigger:
+            self.triggers_changed.emit()
+        return clip.id
+
+    def add_image(self, data, title=""):
+        """Add encoded image bytes (PNG, JPEG, ...) as the newest clip."""
+        clip = ClipRecord(id=new_clip_id(), title=title, kind="image", blob=self.blobs.put(data), size=len(data))
+        make_thumbnail(self.blobs, clip.blob)
+        return self.add(clip)
+
+    def update(self, clip_id, changes):
+        """Set fields (content, title, pinned) on one clip."""
+        with self._lock:
+            clip = self._clips.get(clip_id)
+            if clip is None:
+                return False
+            # Checked before touching the clip, so a bad field leaves it indexed as it was
+            for key in changes:
+                if key == "id" or key not in ClipRecord.FIELDS:
+                    raise KeyError(f"Unknown clip field: {key}")
+            old_trigger = clip.trigger
+            self._unindex(clip)
+            for key, value in changes.items():
+                setattr(clip, key, value)
+            if "content" in changes and clip.kind == "text":
+                clip.blob, clip.size, clip.preview = "", 0, ""
+                self._offload(clip)
+            clip.trigger = normalize_trigger(clip.trigger)
+            clip.updated = timestamp()
+            self._index(clip)
+            self._changed()
+        self.clip_updated.emit(clip_id)
+        if clip.trigger != old_trigger:
+            self.triggers_changed.emit()
+        return True
+
+    def remove(self, clip_id):
+        with self._lock:
+            clip = self._clips.pop(clip_id, None)
+            if clip is None:
+                return False
+            self._unindex(clip)
+            self._changed()
+        self.clip_removed.emit(clip_id)
+        if clip.trigger:
+            self.triggers_changed.emit()
+        return True
+
+    def _offload(self, clip):
+        """Move long inline text into the blob store; returns True if it moved."""
+        if clip.kind != "text" or clip.blob or not self.path:
+            return False
+        data = clip.content.encode("utf-8")
+        if len(data) <= INLINE_TEXT_LIMIT:
+            return False
+        clip.blob = self.blobs.put(data)
+        clip.size = len(data)
+        clip.preview = clip.content[:PREVIEW_CHARS]
+        clip.content = ""
+        return True
+
+    def _index(self, clip):
+        if clip.title:
+            self._by_title.setdefault(clip.title, {})[clip.id] = None
+        if clip.trigger:
+            self._by_trigger[clip.trigger] = clip.id
+        self._search_index.set(clip.id, clip_search_text(clip))
+
+    def _unindex(self, clip):
+        ids = self._by_title.get(clip.title)
+        if ids is not None:
+            ids.pop(clip.id, None)
+            if not ids:
+                del self._by_title[clip.title]
+        if self._by_trigger.get(clip.trigger) == clip.id:
+            del self._by_trigger[clip.trigger]
+        self._search_index.remove(clip.id)
+
+    # ===== Persistence =====
+    def load(self):
+        with self._lock:
+            self._clips.clear()
+            self._by_title.clear()
+            self._by_trigger.clear()
+            self._search_index.clear()
+            migrated = False
+
+            if self.path and os.path.exists(self.path):
+                with open(self.path, 'r') as file:
+                    clips = json.load(file).get("clips", [])
+                # The file lists the newest clip first
+                for data in reversed(clips):
+                    migrated = migrated or not data.get("id")
+                    clip = ClipRecord.from_dict(data)
+                    migrated = self._offload(clip) or migrated
+                    self._clips[clip.id] = clip
+                    self._index(clip)
+
+                removed = self.blobs.collect({clip.blob for clip in self._clips.values() if clip.blob})
+                if removed:
+                    print(f"[CLIPBOARD] Removed {removed} unused blobs")
+
+            self._dirty = migrated
+
+        # Persist newly assigned IDs and text moved out to the blob store
+        self.flush()
+        self.store_reset.emit()
+
+    def flush(self):
+        """Write the clipboard file now if anything changed."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_json(self.path, {"clips": [clip.to_dict() for clip in reversed(self._clips.values())]})
+            self._dirty = False
+
+    def _changed(self):
+        self._dirty = True
+        if self.path:
+            self._save_requested.emit()
+
+
+# ===== Shared Instance =====
+_store = None
+_store_lock = threading.Lock()
+
+def get_clipboard_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ClipboardStore()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(_store.flush)
+        return _store
@@ -0,0 +1,352 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import os
+import pickle
+import getpass
+import hashlib
+import tempfile
+from collections import defaultdict, deque, namedtuple
+
+# Contact workbook parsing plus a local binary cache of the parsed rows (no Qt).
+#
+# The workbook lives on Box Drive and takes seconds to parse, so the parsed
+# rows are pickled to a per-user cache next to the other config files. The
+# cache records the workbook's mtime, size and SHA-256: a matching mtime and
+# size is trusted as-is, and when only the mtime moved (sync clients touch
+# files) the hash decides whether the workbook really changed.
+
+USERNAME = getpass.getuser()
+CONTACT_CACHE = f'./config/contact_cache_{USERNAME}.pickle'
+CACHE_VERSION = 2
+CACHE_CHUNK_ROWS = 1000     # rows per pickle in the cache file
+
+CONTACT_HEADERS = [
+    "First Name", "Last Name", "Job Title", "Company",
+    "Work Email", "Personal Email", "Work Phone", "Personal Phone",
+    "Location/Site", "Birthday"
+]
+
+NAME_COLUMNS = ("First Name", "Last Name")
+
+ContactTable = namedtuple("ContactTable", "columns rows")
+FileStamp = namedtuple("FileStamp", "mtime_ns size sha256")
+# Row-level changes between two reads of the workbook: added/updated are
+# [(ID, values)], removed is [ID]
+ContactDiff = namedtuple("ContactDiff", "added updated removed")
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def stamp_file(path, sha256=None):
+    info = os.stat(path)
+    return FileStamp(info.st_mtime_ns, info.st_size, sha256 or file_hash(path))
+
+
+def same_file(path, stamp):
+    """True if `path` still has the contents recorded in `stamp` (hashing only if mtime/size moved)."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    if info.st_size != stamp.size:
+        return False
+    return info.st_mtime_ns == stamp.mtime_ns or file_hash(path) == stamp.sha256
+
+
+def cell_text(value):
+    """A workbook cell as the directory shows it: blank -> "", 5551234567.0 -> "5551234567"."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def clean_row(values, width):
+    """Cell values as strings, padded to `width` columns."""
+    values = ["" if value is None else str(value) for value in values]
+    return values + [""] * (width - len(values))
+
+
+def read_workbook(path):
+    """Stream the workbook's first sheet: (columns, row iterator, estimated row count).
+
+    Rows come out as plain strings padded to the header width, one at a time
+    as openpyxl's read-only mode parses them; blank rows are skipped. The
+    estimate comes from the sheet's declared dimensions and may be 0 if the
+    file doesn't record them.
+    """
+    from openpyxl import load_workbook  # type: ignore # only needed on a cache miss
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        cells = sheet.iter_rows(values_only=True)
+        columns = [cell_text(value).strip() for value in next(cells, ())]
+        while columns and not columns[-1]:
+            columns.pop()
+        total = max((sheet.max_row or 1) - 1, 0)
+    except BaseException:
+        workbook.close()
+        raise
+
+    def rows():
+        width = len(columns)
+        try:
+            for values in cells:
+                row = [cell_text(value) for value in values[:width]]
+                if any(row):
+                    yield row + [""] * (width - len(row))
+        finally:
+            workbook.close()
+
+    return columns, rows(), total
+
+
+def parse_workbook(path):
+    """Read the whole workbook into plain strings; blank cells become ""."""
+    columns, rows, _ = read_workbook(path)
+    return ContactTable(columns, list(rows))
+
+
+# ===== Cache =====
+def open_cache(cache_path, source_path):
+    """(columns, row iterator, row count, stamp) cached for `source_path` if still current, else None.
+
+    Rows are unpickled a chunk at a time as the iterator is consumed, so a
+    reader can show the first ones before the rest are in.
+    """
+    try:
+        file = open(cache_path, 'rb')
+    except OSError as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"[CONTACTS] Ignoring unreadable cache: {e}")
+        return None
+
+    try:
+        header = pickle.load(file)
+        if header.get("version") != CACHE_VERSION or header.get("source") != os.path.abspath(source_path):
+            file.close()
+            return None
+
+        info = os.stat(source_path)
+        cached = FileStamp(*header["stamp"])
+        fresh = None
+        if info.st_size != cached.size:
+            file.close()
+            return None
+        if info.st_mtime_ns != cached.mtime_ns:
+            # Touched but possibly unchanged: let the content decide
+            if file_hash(source_path) != cached.sha256:
+                file.close()
+                return None
+            fresh = FileStamp(info.st_mtime_ns, info.st_size, cached.sha256)
+        columns, count = header["columns"], header["rows"]
+    except (OSError, EOFError, KeyError, TypeError, pickle.UnpicklingError) as e:
+        file.close()
+        print(f"[CONTACTS] Ignoring unreadable cache: {e}")
+        return None
+
+    def rows():
+        kept = [] if fresh is not None else None
+        with file:
+            while True:
+                chunk = pickle.load(file)
+                if not chunk:
+                    break
+                if kept is not None:
+                    kept.extend(chunk)
+                yield from chunk
+        if kept is not None:
+            # Record the new mtime so the next load skips the hash
+            try:
+                write_cache(cache_path, source_path, ContactTable(columns, kept), fresh)
+            except OSError as e:
+                print(f"[CONTACTS] Could not write cache: {e}")
+
+    return columns, rows(), count, fresh or cached
+
+
+def write_cache(cache_path, source_path, table, stamp=None):
+    """Cache `table` as the parsed contents of `source_path` (stamped now unless given)."""
+    stamp = stamp or stamp_file(source_path)
+    header = {"version": CACHE_VERSION, "source": os.path.abspath(source_path), "stamp": tuple(stamp),
+              "columns": list(table.columns), "rows": len(table.rows)}
+    folder = os.path.dirname(os.path.abspath(cache_path))
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".pickle", dir=folder)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+            # In chunks, ending with an empty one, so open_cache() can stream them
+            for start in range(0, len(table.rows), CACHE_CHUNK_ROWS):
+                pickle.dump(table.rows[start:start + CACHE_CHUNK_ROWS], file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump([], file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def stream_contacts(source_path, cache_path=CONTACT_CACHE):
+    """Contacts from the cache, or streamed from the workbook if it changed.
+
+    Returns (columns, rows, total, stamp, from_cache): `rows` is an iterator,
+    `total` the (estimated) row count, and `stamp` identifies the workbook
+    contents the rows came from. After a workbook read the cache is written
+    once the rows have all been consumed.
+    """
+    cached = open_cache(cache_path, source_path)
+    if cached is not None:
+        return cached + (True,)
+
+    # Stamp before parsing so an edit landing mid-parse invalidates the cache
+    stamp = stamp_file(source_path)
+    columns, rows, total = read_workbook(source_path)
+
+    def caching():
+        parsed = []
+        for row in rows:
+            parsed.append(row)
+            yield row
+        try:
+            write_cache(cache_path, source_path, ContactTable(columns, parsed), stamp)
+        except OSError as e:
+            print(f"[CONTACTS] Could not write cache: {e}")
+
+    return columns, caching(), total, stamp, False
+
+
+def load_contacts(source_path, cache_path=CONTACT_CACHE):
+    """Parsed contacts from the cache, re-reading the workbook only if it changed.
+
+    Returns (table, stamp, from_cache); `stamp` identifies the workbook
+    contents the table came from.
+    """
+    columns, rows, _, stamp, from_cache = stream_contacts(source_path, cache_path)
+    return ContactTable(columns, list(rows)), stamp, from_cache
+
+
+# ===== Reload Diff =====
+def name_positions(columns):
+    """Positions of the first and last name columns, None for either one the workbook lacks."""
+    return tuple(columns.index(name) if name in columns else None for name in NAME_COLUMNS)
+
+
+def contact_name(values, columns):
+    """e.g. "Ann Lee", read by header so reordered workbooks still name the right person."""
+    return " ".join(values[i] for i in name_positions(columns) if i is not None and values[i])
+
+
+def contact_key(values, names):
+    """What identifies a contact across edits to their other fields: their name.
+
+    `names` comes from name_positions() for the workbook's columns.
+    """
+    return tuple(values[i].strip().lower() if i is not None else "" for i in names)
+
+
+def diff_contacts(old, rows, next_id, columns=CONTACT_HEADERS):
+    """Match a fresh read of the workbook against the contacts already loaded.
+
+    `old` is {ID: values}. Identical rows keep their ID; a row whose name
+    (contact_key) matches a contact that no longer has an identical row
+    keeps that contact's ID and counts as updated. Other rows are added
+    with IDs from `next_id` up, and contacts left unmatched are removed.
+
+    Returns (ContactDiff, {ID: values} in workbook order).
+    """
+    names = name_positions(columns)
+    by_values = defaultdict(deque)
+    for contact_id, values in old.items():
+        by_values[tuple(values)].append(contact_id)
+
+    ids = [None] * len(rows)
+    unmatched = []
+    for position, row in enumerate(rows):
+        same = by_values.get(tuple(row))
+        if same:
+            ids[position] = same.popleft()
+        else:
+            unmatched.append(position)
+
+    by_key = defaultdict(deque)
+    for same in by_values.values():
+        for contact_id in same:
+            by_key[contact_key(old[contact_id], names)].append(contact_id)
+
+    added, updated = [], []
+    for position in unmatched:
+        row = rows[position]
+        named = by_key.get(contact_key(row, names))
+        if named:
+            ids[position] = named.popleft()
+            updated.append((ids[position], row))
+        else:
+            ids[position] = next_id
+            next_id += 1
+            added.append((ids[position], row))
+
+    removed = [contact_id for named in by_key.values() for contact_id in named]
+    return ContactDiff(added, updated, removed), dict(zip(ids, rows))
+
@@ -57,26 +57,26 @@
 import os
 import json
 from PySide6.QtGui import QAction
-import pandas as pd  # type: ignore
 from PySide6.QtWidgets import (
     QDateEdit, QDialog, QFormLayout, QHBoxLayout, QLineEdit, QMenu, QPushButton, QWidget, QVBoxLayout, QLabel,
-    QFileDialog, QMessageBox, QTableWidget, QTableWidgetItem, QHeaderView
+    QFileDialog, QMessageBox, QTableView, QHeaderView, QAbstractItemView, QCompleter, QProgressBar
+)
+from PySide6.QtCore import (
+    QDate, Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QStringListModel
 )
-from PySide6.QtCore import QDate, Qt
 
-CONFIG_PATH = os.path.join("config", "contact_config.json")
+from lib.contact_data import contact_name
+from lib.contact_search import RANK_LIMIT
+from lib.contact_service import CONFIG_PATH, configured_contact_path, get_contact_service
 
 def get_contact_file_path():
     """Retrieve or prompt for the contact Excel file path."""
     if not os.path.exists(CONFIG_PATH):
         os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
 
-    if os.path.isfile(CONFIG_PATH):
-        with open(CONFIG_PATH, "r") as f:
-            config = json.load(f)
-            contact_path = config.get("contact_file_path")
-            if contact_path and os.path.isfile(contact_path):
-                return contact_path
+    contact_path = configured_contact_path()
+    if contact_path:
+        return contact_path
 
     # Prompt user for file
     file_dialog = QFileDialog()
@@ -137,6 +137,124 @@ class AddContactDialog(QDialog):
             for label, widget in self.fields.items()
         }
 
+# ===== Model =====
+ContactIdRole = Qt.UserRole + 1
+
+class ContactTableModel(QAbstractTableModel):
+    """A table over the shared contacts, one row per contact ID in workbook order.
+
+    Follows the service's signals, so edits made from any window show up
+    here; the view only asks for the cells it is painting.
+    """
+
+    def __init__(self, service, parent=None):
+        super().__init__(parent)
+        self.service = service
+        self._ids = service.contact_ids()   # model row -> contact ID
+        self._positions = None              # contact ID -> model row, rebuilt lazily after removals
+        service.reset.connect(self._on_reset)
+        service.contacts_added.connect(self._on_added)
+        service.contact_updated.connect(self._on_updated)
+        service.contact_removed.connect(self._on_removed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.service.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        contact_id = self._ids[index.row()]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self.service.cell(contact_id, index.column())
+        if role == ContactIdRole:
+            return contact_id
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        columns = self.service.columns
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(columns):
+            return columns[section]
+        return super().headerData(section, orientation, role)
+
+    def contact_id(self, row):
+        return self._ids[row]
+
+    def _row_of(self, contact_id):
+        if self._positions is None:
+            self._positions = {cid: row for row, cid in enumerate(self._ids)}
+        return self._positions[contact_id]
+
+    # ===== Service signals =====
+    def _on_reset(self):
+        self.beginResetModel()
+        self._ids = self.service.contact_ids()
+        self._positions = None
+        self.endResetModel()
+
+    def _on_added(self, contact_ids):
+        row = len(self._ids)
+        self.beginInsertRows(QModelIndex(), row, row + len(contact_ids) - 1)
+        self._ids.extend(contact_ids)
+        if self._positions is not None:
+            self._positions.update(zip(contact_ids, range(row, row + len(contact_ids))))
+        self.endInsertRows()
+
+    def _on_updated(self, contact_id):
+        row = self._row_of(contact_id)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def _on_removed(self, contact_id):
+        row = self._row_of(contact_id)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        self._positions = None
+        self.endRemoveRows()
+
+class ContactFilterProxy(QSortFilterProxyModel):
+    """Shows the search index's matches, in relevance order until a column is sorted.
+
+    Column sorts are case-insensitive. With no query (or no column chosen)
+    rows keep workbook order.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rank = None           # contact ID -> position in the ranked results
+        self._by_relevance = False
+        self.setSortCaseSensitivity(Qt.CaseInsensitive)
+
+    def set_query(self, text):
+        """Filter to the matches for `text` and order them by relevance."""
+        return self.set_ranking(self.sourceModel().service.search(text))
+
+    def set_ranking(self, ranked):
+        """Show only the contact IDs in `ranked`, in that order (None shows everything)."""
+        # Back to workbook order first, so refiltering never re-sorts with a stale ranking
+        self._by_relevance = False
+        self.sort(-1)
+        self._rank = None if ranked is None else {cid: pos for pos, cid in enumerate(ranked)}
+        self.invalidateFilter()
+        # Past RANK_LIMIT the results are already in workbook order
+        if self._rank is not None and len(self._rank) <= RANK_LIMIT:
+            self._by_relevance = True
+            self.sort(0)
+        return ranked
+
+    def sort_by_column(self, column, order):
+        self._by_relevance = False
+        self.sort(column, order)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._rank is None or self.sourceModel().contact_id(source_row) in self._rank
+
+    def lessThan(self, left, right):
+        if self._by_relevance:
+            return self._rank[left.data(ContactIdRole)] < self._rank[right.data(ContactIdRole)]
+        return super().lessThan(left, right)
+
 class ContactDirectoryWidget(QWidget):
     def __init__(self):
         super().__init__()
@@ -144,8 +262,22 @@ class ContactDirectoryWidget(QWidget):
         self.layout = QVBoxLayout(self)
 
         self.contact_path = get_contact_file_path()
-        self.contacts = pd.read_excel(self.contact_path)
-        self.contacts = self.contacts.astype(str).fillna("")
+        # Shared with the caller lookup and the sitrep forms; loads on first use
+        self.service = get_contact_service(self.contact_path)
+        # The model follows the service first, so these slots see the new rows
+        self.model = ContactTableModel(self.service, self)
+        self.service.reset.connect(self.on_contacts_reset)
+        self.service.progress.connect(self.on_load_progress)
+        self.service.load_finished.connect(self.on_load_finished)
+        self.service.refreshed.connect(self.on_contacts_refreshed)
+        self.service.load_failed.connect(self.on_load_failed)
+        self.proxy = ContactFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.writer = self.service.writer
+        self.writer.saved.connect(self.on_saved)
+        self.writer.conflicts_found.connect(self.on_conflicts)
+        self.writer.failed.connect(self.on_save_failed)
 
         # === Header Row ===
         header_layout = QHBoxLayout()
@@ -156,56 +288,164 @@ class ContactDirectoryWidget(QWidget):
 
         header_layout.addStretch(1)
 
+        self.caller_label = QLabel()
+        header_layout.addWidget(self.caller_label)
+
+        self.caller_box = QLineEdit()
+        self.caller_box.setPlaceholderText("Who is calling? Phone or email")
+        self.caller_box.setToolTip("Full or partial number (either end), email address, or @domain")
+        self.caller_box.textChanged.connect(self.identify_caller)
+        self.caller_box.setFixedWidth(200)
+        self.caller_box.setEnabled(False)
+        header_layout.addWidget(self.caller_box)
+
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search contacts...")
+        self.search_box.setToolTip("Matches word starts in any field; narrow with site:, company:, title:, "
+                                   "name:, email: or phone:")
         self.search_box.textChanged.connect(self.filter_contacts)
         self.search_box.setFixedWidth(200)
+        self.search_box.setEnabled(False)
         header_layout.addWidget(self.search_box)
 
         self.add_button = QPushButton("Add Contact")
         self.add_button.clicked.connect(self.open_add_contact_dialog)
+        self.add_button.setEnabled(False)
         header_layout.addWidget(self.add_button)
 
         self.layout.addLayout(header_layout)
 
-        # === Table Widget ===
-        self.table = QTableWidget()
+        # === Table View ===
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setWordWrap(False)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        # Sorting is driven here rather than by setSortingEnabled, so a new query
+        # can switch back to relevance order; workbook order until a header is clicked
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(False)
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        header.sectionClicked.connect(self.sort_by_column)
         self.layout.addWidget(self.table)
-        self.refresh_table()
 
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.open_context_menu)
-        self.table.setSortingEnabled(True)
+        self.table.doubleClicked.connect(lambda index: self.display_contact(index.data(ContactIdRole)))
+
+        status_layout = QHBoxLayout()
+        self.status_label = QLabel("Loading contacts...")
+        status_layout.addWidget(self.status_label, 1)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedWidth(200)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setTextVisible(False)
+        status_layout.addWidget(self.progress_bar)
+        self.layout.addLayout(status_layout)
+
+        if not self.service.loaded and not self.service.loading:
+            self.service.load()
+        # Show whatever has been loaded so far; the rest streams in
+        self.on_contacts_reset()
+        if self.service.loaded:
+            self.on_load_finished()
+
+    # ===== Loading =====
+    def on_contacts_reset(self):
+        self.apply_filter()
+        self.table.setEnabled(True)
+        self.caller_box.setEnabled(True)
+        self.search_box.setEnabled(True)
+        # Edits wait for the full contents, so they can be matched against the workbook
+        self.add_button.setEnabled(self.service.loaded)
+
+    def on_load_progress(self, loaded, total):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(loaded)
+        # Searches cover the rows loaded so far; rerun them as more arrive
+        if self.search_box.text().strip() or self.caller_box.text().strip():
+            self.apply_filter()
+        else:
+            self.update_status()
+
+    def on_load_finished(self):
+        self.progress_bar.hide()
+        self.add_button.setEnabled(True)
+        self.on_contacts_refreshed(len(self.service))
+
+    def on_contacts_refreshed(self, changed):
+        # Rows changed in place; rerun an active search so new and edited rows are ranked too
+        if changed and (self.search_box.text().strip() or self.caller_box.text().strip()):
+            self.apply_filter()
+        else:
+            self.update_status()
+
+    def on_load_failed(self, message):
+        self.status_label.setText("Could not load contacts")
+        self.progress_bar.hide()
+        self.table.setEnabled(True)
+        QMessageBox.critical(self, "Contact Directory", f"Could not read the contact file:\n{message}")
+
+    def update_status(self):
+        total, shown = self.model.rowCount(), self.proxy.rowCount()
+        count = f"{shown} of {total} contacts" if shown != total else f"{total} contacts"
+        if not self.service.loaded:
+            expected = max(self.service.expected_rows, total)
+            self.status_label.setText(f"{count} (loading {total:,} of {expected:,}...)" if total
+                                      else "Loading contacts...")
+            return
+        self.status_label.setText(f"{count} (loaded from {self.service.source_label})")
+
+    # ===== Saving =====
+    def on_saved(self, merged):
+        if self.service.loading:
+            # The workbook also holds someone else's edits: the service is reading them in
+            self.status_label.setText("Saved; picking up changes from other users...")
+        else:
+            self.update_status()
+
+    def on_conflicts(self, changes):
+        names = "\n".join(f"  {contact_name(change.base, self.service.columns)}" for change in changes)
+        QMessageBox.warning(
+            self, "Contacts Changed Elsewhere",
+            "Someone else changed or removed these contacts before your edits were saved, "
+            f"so their version was kept:\n{names}\n\nReapply your changes if they are still needed."
+        )
+
+    def on_save_failed(self, message):
+        self.status_label.setText(f"Could not save the contact file (will retry): {message}")
 
+    # ===== Actions =====
     def open_context_menu(self, position):
-        item = self.table.itemAt(position)
-        if not item:
+        index = self.table.indexAt(position)
+        if not index.isValid():
             return
 
-        row = item.row()
+        contact_id = index.data(ContactIdRole)
         menu = QMenu()
 
         display_action = QAction("Display Contact", self)
         edit_action = QAction("Edit Contact", self)
         delete_action = QAction("Delete Contact", self)
 
-        display_action.triggered.connect(lambda: self.display_contact(row))
-        edit_action.triggered.connect(lambda: self.edit_contact(row))
-        delete_action.triggered.connect(lambda: self.delete_contact(row))
+        display_action.triggered.connect(lambda: self.display_contact(contact_id))
+        edit_action.triggered.connect(lambda: self.edit_contact(contact_id))
+        delete_action.triggered.connect(lambda: self.delete_contact(contact_id))
 
         menu.addAction(display_action)
         menu.addAction(edit_action)
         menu.addAction(delete_action)
+        edit_action.setEnabled(self.service.loaded)
+        delete_action.setEnabled(self.service.loaded)
 
         menu.exec(self.table.viewport().mapToGlobal(position))
 
-    def display_contact(self, row):
-        contact_info = []
-        for col in range(self.table.columnCount()):
-            header = self.table.horizontalHeaderItem(col).text()
-            value = self.table.item(row, col).text()
-            contact_info.append(f"<b>{header}:</b> {value}")
-        
+    def display_contact(self, contact_id):
+        contact_info = [f"<b>{header}:</b> {value}" for header, value in self.service.contact(contact_id).items()]
+
         msg = QDialog(self)
         msg.setWindowTitle("Contact Details")
         layout = QVBoxLayout()
@@ -214,20 +454,13 @@ class ContactDirectoryWidget(QWidget):
         msg.setLayout(layout)
         msg.exec()
 
-    def edit_contact(self, row):
+    def edit_contact(self, contact_id):
         dialog = QDialog(self)
         dialog.setWindowTitle("Edit Contact")
         layout = QFormLayout(dialog)
 
-        fields = [
-            "First Name", "Last Name", "Job Title", "Company",
-            "Work Email", "Personal Email", "Work Phone",
-            "Personal Phone", "Location/Site", "Birthday"
-        ]
-
         edits = []
-        for col, field in enumerate(fields):
-            current_value = self.table.item(row, col).text()
+        for field, current_value in self.service.contact(contact_id).items():
             edit = QLineEdit(current_value)
             layout.addRow(QLabel(field), edit)
             edits.append(edit)
@@ -236,19 +469,15 @@ class ContactDirectoryWidget(QWidget):
         layout.addWidget(save_button)
 
         def save_changes():
-            for col, edit in enumerate(edits):
-                value = edit.text()
-                self.table.setItem(row, col, QTableWidgetItem(value))
-                self.contacts.iat[row, col] = str(value) if value else ""
-            self.contacts.to_excel(self.contact_path, index=False)
+            self.service.update(contact_id, [edit.text() for edit in edits])
             dialog.accept()
 
         save_button.clicked.connect(save_changes)
         dialog.setLayout(layout)
         dialog.exec()
 
-    def delete_contact(self, row):
-        name = f"{self.table.item(row, 0).text()} {self.table.item(row, 1).text()}"
+    def delete_contact(self, contact_id):
+        name = self.service.display_name(contact_id)
         confirm = QMessageBox.question(
             self,
             "Delete Contact",
@@ -256,63 +485,45 @@ class ContactDirectoryWidget(QWidget):
             QMessageBox.Yes | QMessageBox.No
         )
         if confirm == QMessageBox.Yes:
-            # Remove from Excel DataFrame
-            self.contacts.drop(self.contacts.index[row], inplace=True)
-            self.contacts.reset_index(drop=True, inplace=True)
-            self.contacts.to_excel(self.contact_path, index=False)
-
-            # Remove from GUI
-            self.table.removeRow(row)
+            self.service.remove(contact_id)
+            self.update_status()
 
             QMessageBox.information(self, "Deleted", f"{name} has been removed.")
 
-    def refresh_table(self, filter_text=""):
-        
-        filtered = self.contacts.copy()
-        if filter_text:
-            mask = filtered.apply(lambda row: filter_text.lower() in row.astype(str).str.lower().to_string(), axis=1)
-            filtered = filtered[mask]
-
-        self.table.clear()
-        self.table.setColumnCount(len(filtered.columns))
-        self.table.setRowCount(len(filtered))
-        headers = [
-            "First Name", "Last Name", "Job Title", "Company",
-            "Work Email", "Personal Email", "Work Phone", "Personal Phone",
-            "Location/Site", "Birthday"
-        ]
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-
-        for row_idx, (_, row) in enumerate(filtered.iterrows()):
-            for col_idx, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() ^ Qt.ItemIsEditable)
-                self.table.setItem(row_idx, col_idx, item)
-
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
     def filter_contacts(self, text):
-        text = text.strip().lower()
-        self.table.setSortingEnabled(False)  # Disable sorting while updating rows
-        self.table.setRowCount(0)
-
-        for index, row in self.contacts.iterrows():
-            full_name = f"{str(row['First Name'])} {str(row['Last Name'])}".lower()
-            if (
-                text in str(row['First Name']).lower()
-                or text in str(row['Last Name']).lower()
-                or text in full_name
-            ):
-                row_position = self.table.rowCount()
-                self.table.insertRow(row_position)
-                self.table.setVerticalHeaderItem(row_position, QTableWidgetItem(str(index + 1)))
-                for col_index, col in enumerate(self.contacts.columns):
-                    value = str(row[col]) if not pd.isna(row[col]) else ""
-                    self.table.setItem(row_position, col_index, QTableWidgetItem(value))
-
-        self.table.setSortingEnabled(True)  # Re-enable sorting after rows are added
-
+        # Searching and caller lookup are alternative filters: typing in one clears the other
+        if self.caller_box.text():
+            self.caller_box.blockSignals(True)
+            self.caller_box.clear()
+            self.caller_box.blockSignals(False)
+        self.apply_filter()
+
+    def identify_caller(self, text):
+        if self.search_box.text():
+            self.search_box.blockSignals(True)
+            self.search_box.clear()
+            self.search_box.blockSignals(False)
+        self.apply_filter()
+
+    def apply_filter(self):
+        caller = self.caller_box.text().strip()
+        if caller:
+            matches = self.service.identify(caller)
+            self.proxy.set_ranking([match.contact_id for match in matches])
+            self.caller_label.setText(describe_matches(self.service, matches))
+        else:
+            self.caller_label.clear()
+            self.proxy.set_query(self.search_box.text().strip())
+        self.table.horizontalHeader().setSortIndicatorShown(False)
+        self.update_status()
+
+    def sort_by_column(self, column):
+        header = self.table.horizontalHeader()
+        if not header.isSortIndicatorShown():
+            header.setSortIndicator(column, Qt.AscendingOrder)
+            header.setSortIndicatorShown(True)
+        # Once shown, the header has already moved/flipped its indicator for this click
+        self.proxy.sort_by_column(header.sortIndicatorSection(), header.sortIndicatorOrder())
 
     def open_add_contact_dialog(self):
         dialog = AddContactDialog(self)
@@ -323,9 +534,89 @@ class ContactDirectoryWidget(QWidget):
                 QMessageBox.warning(self, "Missing Info", "First and Last Name are required.")
                 return
 
-            self.contacts = pd.concat([self.contacts, pd.DataFrame([new_data])], ignore_index=True)
-            self.contacts.to_excel(self.contact_path, index=False)
-            self.refresh_table()
+            self.service.add(new_data)
+            self.update_status()
+
+def describe_matches(service, matches):
+    """One line naming the best caller match, e.g. "Jane Doe, Volt (Work Phone) +2 more"."""
+    if not matches:
+        return "No matching contact"
+    best = service.contact(matches[0].contact_id)
+    text = service.display_name(matches[0].contact_id)
+    if best.get("Company"):
+        text += f", {best['Company']}"
+    text += f" ({matches[0].field})"
+    if len(matches) > 1:
+        text += f" +{len(matches) - 1} more"
+    return text
+
+# ===== Completion for other forms =====
+class ContactCompleter(QCompleter):
+    """Suggests directory contacts in a name field, by name or by phone number/email.
+
+    Picking one fills in the contact's name and, if given, selects their
+    company in `company_combo`. Nothing is loaded until the operator first
+    types in the field; suggestions start once the service's load finishes.
+    """
+
+    MAX_SUGGESTIONS = 8
+
+    def __init__(self, line_edit, service, company_combo=None):
+        super().__init__(line_edit)
+        self.service = service
+        self.line_edit = line_edit
+        self.company_combo = company_combo
+        self._suggested = {}    # suggestion text -> contact ID
+        self.setModel(QStringListModel(self))
+        # The suggestions are already the matches; don't let the completer filter them again
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        line_edit.setCompleter(self)
+        line_edit.textEdited.connect(self.suggest)
+        self.activated[str].connect(self.pick)
+        service.load_finished.connect(self._on_loaded)
+
+    def _on_loaded(self):
+        if self.line_edit.hasFocus():
+            self.suggest(self.line_edit.text())
+
+    def suggest(self, text):
+        text = text.strip()
+        if not self.service.loaded:
+            if not self.service.loading:
+                self.service.load()
+            return
+        if len(text) < 2:
+            return
+        ids = [match.contact_id for match in self.service.identify(text, self.MAX_SUGGESTIONS)]
+        if not ids:
+            ids = (self.service.search(text) or [])[:self.MAX_SUGGESTIONS]
+        self._suggested = {}
+        for contact_id in ids:
+            contact = self.service.contact(contact_id)
+            label = self.service.display_name(contact_id)
+            details = ", ".join(v for v in (contact.get("Company"), contact.get("Work Phone")) if v)
+            self._suggested[f"{label} ({details})" if details else label] = contact_id
+        self.model().setStringList(list(self._suggested))
+        if self._suggested:
+            self.complete()
+
+    def pick(self, text):
+        contact_id = self._suggested.get(text)
+        if contact_id not in self.service:
+            return
+        self.line_edit.setText(self.service.display_name(contact_id))
+        company = self.service.contact(contact_id).get("Company")
+        if self.company_combo is not None and company:
+            at = self.company_combo.findText(company, Qt.MatchFixedString)
+            if at >= 0:
+                self.company_combo.setCurrentIndex(at)
+
+def attach_contact_completer(line_edit, company_combo=None):
+    """Add contact suggestions to `line_edit` if a contact workbook is configured; never prompts."""
+    service = get_contact_service(load=False)
+    if service is None:
+        return None
+    return ContactCompleter(line_edit, service, company_combo)
 
 def get_contact_directory_widget():
     return ContactDirectoryWidget()
@@ -0,0 +1,250 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import re
+from collections import namedtuple
+
+from lib.text_index import PrefixIndex
+
+# Reverse phone/email lookup for caller identification (no Qt).
+#
+# Phone numbers are normalized to E.164 (10-digit numbers are taken as
+# North American) and indexed three ways: the full number for O(1) exact
+# hits, plus sorted lists of the digits and of the reversed digits, so a
+# fragment typed from either end ("555-12", "4567") is a bisect range scan,
+# O(log n + k). Email addresses are indexed whole, by domain (and parent
+# domains), and in a sorted list for prefix matches. Each table is a
+# text_index.PrefixIndex whose masks record which column a key came from.
+
+DEFAULT_COUNTRY_CODE = "1"
+MIN_PHONE_DIGITS = 3
+PHONE_FIELDS = ("Work Phone", "Personal Phone")
+EMAIL_FIELDS = ("Work Email", "Personal Email")
+
+LookupMatch = namedtuple("LookupMatch", "contact_id field kind")   # kind: exact, suffix, prefix, domain
+
+# Only after a number: a cell holding just "x4567" is an internal extension, kept as the number
+_EXTENSION = re.compile(r"(?<=\d)\s*(?:ext\.?|x|#)\s*\d+\s*$", re.IGNORECASE)
+_NON_DIGITS = re.compile(r"\D+")
+
+
+def _split_phone(value):
+    text = _EXTENSION.sub("", value or "").strip()
+    return text, _NON_DIGITS.sub("", text)
+
+
+def _e164(text, digits):
+    if text.startswith("+"):
+        return "+" + digits if len(digits) >= 8 else None
+    if text.startswith("00") and len(digits) > 10:
+        return "+" + digits[2:]
+    if len(digits) == 10:
+        return "+" + DEFAULT_COUNTRY_CODE + digits
+    if len(digits) == 11 and digits.startswith(DEFAULT_COUNTRY_CODE):
+        return "+" + digits
+    return None
+
+
+def phone_digits(value):
+    return _split_phone(value)[1]
+
+
+def to_e164(value):
+    """"(555) 123-4567" -> "+15551234567"; None for short internal numbers."""
+    return _e164(*_split_phone(value))
+
+
+def phone_keys(value):
+    """Digit strings a number is findable by: full digits, and the national number for +1."""
+    text, digits = _split_phone(value)
+    e164 = _e164(text, digits)
+    if e164 is None:
+        return [digits] if digits else []
+    keys = [e164[1:]]
+    if e164.startswith("+" + DEFAULT_COUNTRY_CODE):
+        keys.append(e164[1 + len(DEFAULT_COUNTRY_CODE):])
+    return keys
+
+
+def email_domains(address):
+    """"a@mail.volt.com" -> ["mail.volt.com", "volt.com"] (bare TLDs are skipped)."""
+    domain = address.rpartition("@")[2]
+    parts = domain.split(".")
+    return [".".join(parts[i:]) for i in range(len(parts) - 1)] if domain else []
+
+
+class ContactLookup:
+    """Phone and email reverse index over contacts, kept current with add/update/remove."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._phone_columns = [(i, c) for i, c in enumerate(self.columns) if c in PHONE_FIELDS]
+        self._email_columns = [(i, c) for i, c in enumerate(self.columns) if c in EMAIL_FIELDS]
+        # key -> {contact ID: mask of the columns it came from}
+        self._phones = PrefixIndex()        # number digits (full and national)
+        self._reversed = PrefixIndex()      # the same, reversed, for suffix scans
+        self._emails = PrefixIndex()        # whole lowercased addresses
+        self._domains = PrefixIndex()       # domains and parent domains, looked up whole
+
+    # ===== Maintenance =====
+    def keys(self, values):
+        """[(kind, key, column mask)] for one contact: its phone digit strings, addresses and domains.
+
+        Pure, so a worker thread can work these out ahead of add().
+        """
+        keys = []
+        for column, _ in self._phone_columns:
+            value = values[column] if column < len(values) else ""
+            keys += [("phone", digits, 1 << column) for digits in phone_keys(value)]
+        for column, _ in self._email_columns:
+            address = (values[column] if column < len(values) else "").strip().lower()
+            if "@" in address:
+                keys.append(("email", address, 1 << column))
+                keys += [("domain", domain, 1 << column) for domain in email_domains(address)]
+        return keys
+
+    def add(self, contact_id, values, bulk=False, keys=None):
+        """Index one contact; `keys` may be passed in if already worked out with keys()."""
+        tables = {"phone": {}, "email": {}, "domain": {}}
+        for kind, key, mask in self.keys(values) if keys is None else keys:
+            table = tables[kind]
+            table[key] = table.get(key, 0) | mask
+        phones = tables["phone"]
+        self._phones.set_words(contact_id, phones, bulk)
+        self._reversed.set_words(contact_id, {digits[::-1]: mask for digits, mask in phones.items()}, bulk)
+        self._emails.set_words(contact_id, tables["email"], bulk)
+        # Never scanned by prefix, so its word list is never worth sorting
+        self._domains.set_words(contact_id, tables["domain"], bulk=True)
+
+    update = add
+
+    def add_many(self, items, sort=True):
+        """Bulk load (contact ID, values) pairs; `sort=False` leaves sorting to sort_keys() or the next lookup."""
+        for contact_id, values in items:
+            self.add(contact_id, values, bulk=True)
+        if sort:
+            self.sort_keys()
+
+    def sort_keys(self):
+        for table in (self._phones, self._reversed, self._emails):
+            table.sort()
+
+    def remove(self, contact_id):
+        for table in (self._phones, self._reversed, self._emails, self._domains):
+            table.remove(contact_id)
+
+    def _field(self, mask):
+        """The first column named in `mask`."""
+        return self.columns[(mask & -mask).bit_length() - 1]
+
+    # ===== Lookups =====
+    def find_phone(self, text, limit=20):
+        """Contacts whose number is `text`, ends with it, or starts with it (in that order)."""
+        text, digits = _split_phone(text)
+        if len(digits) < MIN_PHONE_DIGITS:
+            return []
+        matches = {}
+
+        def collect(ids, kind):
+            for contact_id, mask in ids.items():
+                if contact_id not in matches:
+                    matches[contact_id] = LookupMatch(contact_id, self._field(mask), kind)
+
+        e164 = _e164(text, digits)
+        if e164 is not None:
+            collect(self._phones.get(e164[1:]), "exact")
+        collect(self._phones.get(digits), "exact")
+        for source, kind in ((self._reversed.words_starting_with(digits[::-1]), "suffix"),
+                             (self._phones.words_starting_with(digits), "prefix")):
+            for _, ids in source:
+                if len(matches) >= limit:
+                    break
+                collect(ids, kind)
+        return list(matches.values())[:limit]
+
+    def find_email(self, text, limit=20):
+        """Contacts by whole address, by domain ("@volt.com" or "volt.com"), or by address prefix."""
+        query = text.strip().lower()
+        if not query:
+            return []
+        matches = {}
+
+        def collect(ids, kind):
+            for contact_id, mask in ids.items():
+                if len(matches) >= limit:
+                    return
+                if contact_id not in matches:
+                    matches[contact_id] = LookupMatch(contact_id, self._field(mask), kind)
+
+        collect(self._emails.get(query), "exact")
+        domain = query[1:] if query.startswith("@") else query
+        if "@" not in domain:
+            collect(self._domains.get(domain), "domain")
+        for _, ids in self._emails.words_starting_with(query):
+            if len(matches) >= limit:
+                break
+            collect(ids, "prefix")
+        return list(matches.values())
+
+    def identify(self, text, limit=20):
+        """Best guesses for who a phone number or email address belongs to."""
+        text = (text or "").strip()
+        if "@" in text or (any(ch.isalpha() for ch in text) and "." in text):
+            return self.find_email(text, limit)
+        number, digits = _split_phone(text)
+        if len(digits) >= MIN_PHONE_DIGITS and not any(ch.isalpha() for ch in number):
+            return self.find_phone(text, limit)
+        return []
@@ -0,0 +1,203 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import re
+import sys
+
+from lib.text_index import PrefixIndex, words
+
+# Ranked, field-scoped contact search over an in-memory token index (no Qt).
+#
+# Every field is accent-folded, lowercased and split into word tokens once,
+# when a contact is added or edited, and filed in a text_index.PrefixIndex
+# under the contact's ID with a bit mask of the columns the token appears
+# in. Queries then touch only the index:
+#   - 2 character words hit its table of token prefixes directly, and single
+#     characters union the few dozen entries of that table sharing a letter;
+#   - longer words bisect its sorted token list and union the few matching
+#     postings;
+#   - `field:word` (site:memphis, company:volt) keeps only contacts whose
+#     matching token is in that field, which is a mask test.
+# Results with whole-word matches rank first (name matches before others),
+# then prefix matches, each in workbook order. A scoped word only counts as a
+# whole-word match in its own columns.
+
+RANK_LIMIT = 2000   # larger result sets are returned in workbook order, unranked
+PAIR = 2            # length of the token prefixes indexed directly
+
+NAME_FIELDS = ("First Name", "Last Name")
+
+# Query scopes -> workbook columns
+FIELD_SCOPES = {
+    "name": NAME_FIELDS,
+    "first": ("First Name",),
+    "last": ("Last Name",),
+    "title": ("Job Title",),
+    "job": ("Job Title",),
+    "company": ("Company",),
+    "site": ("Location/Site",),
+    "location": ("Location/Site",),
+    "email": ("Work Email", "Personal Email"),
+    "phone": ("Work Phone", "Personal Phone"),
+    "birthday": ("Birthday",),
+}
+
+_SCOPED = re.compile(r"^(\w+):(.*)$")
+
+
+def field_tokens(column, value):
+    tokens = words(value)
+    if "Phone" in column:
+        # Whole number as one token too, so "5551234" finds "(555) 123-4567"
+        digits = "".join(ch for ch in value if ch.isdigit())
+        if digits and digits not in tokens:
+            tokens.append(sys.intern(digits))
+    return tokens
+
+
+def parse_query(query):
+    """[(scope or None, word), ...] for each word of `query`."""
+    terms = []
+    for part in query.split():
+        scope = None
+        scoped = _SCOPED.match(part)
+        if scoped and scoped.group(1).lower() in FIELD_SCOPES:
+            scope, part = scoped.group(1).lower(), scoped.group(2)
+        terms.extend((scope, word) for word in words(part))
+    return terms
+
+
+class ContactSearchIndex:
+    """Token/prefix index over contacts, kept current with add/update/remove."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._name_mask = sum(1 << i for i, c in enumerate(self.columns) if c in NAME_FIELDS)
+        self._index = PrefixIndex(short_prefix=PAIR)   # token -> {contact ID: column mask}
+
+    def __len__(self):
+        return len(self._index)
+
+    def scope_mask(self, scope):
+        return sum(1 << self.columns.index(c) for c in FIELD_SCOPES[scope] if c in self.columns)
+
+    # ===== Maintenance =====
+    def clear(self):
+        self._index.clear()
+
+    def add(self, contact_id, values, keys=None, bulk=False):
+        """Index one contact; `keys` may be passed in if already worked out with keys().
+
+        `bulk` leaves the new tokens unsorted until sort_tokens() or the next query.
+        """
+        self._index.set_words(contact_id, self.keys(values) if keys is None else keys, bulk)
+
+    update = add
+
+    def add_many(self, items, sort=True):
+        """Bulk load (contact ID, values) pairs; `sort=False` leaves sorting to sort_tokens() or the next query."""
+        for contact_id, values in items:
+            self.add(contact_id, values, bulk=True)
+        if sort:
+            self.sort_tokens()
+
+    def remove(self, contact_id):
+        self._index.remove(contact_id)
+
+    def keys(self, values):
+        """{token: column mask} for one contact.
+
+        Pure, so a worker thread can tokenize rows ahead of add().
+        """
+        tokens = {}
+        for column, (name, value) in enumerate(zip(self.columns, values)):
+            bit = 1 << column
+            for token in field_tokens(name, value or ""):
+                tokens[token] = tokens.get(token, 0) | bit
+        return tokens
+
+    # ===== Queries =====
+    def sort_tokens(self):
+        self._index.sort()
+
+    def search(self, query, rank_limit=RANK_LIMIT, positions=None):
+        """IDs matching every word of `query`, best first; None for an empty query.
+
+        `positions` maps contact ID -> workbook row, for ties and unranked
+        results; without it IDs are taken to be in workbook order.
+        """
+        terms = parse_query(query)
+        if not terms:
+            return None
+
+        masks = [None if scope is None else self.scope_mask(scope) for scope, _ in terms]
+        matched = [self._index.prefix_matches(word, mask) for (_, word), mask in zip(terms, masks)]
+        matched.sort(key=len)
+        results = set(matched[0]).intersection(*matched[1:])
+        position = positions.__getitem__ if positions is not None else int
+
+        if len(results) > rank_limit:
+            return sorted(results, key=position)
+
+        # Whole-word hits count only in the columns their term is scoped to
+        exact = [(self._index.get(word), ~0 if mask is None else mask)
+                 for (_, word), mask in zip(terms, masks)]
+        name_mask = self._name_mask
+
+        def score(cid):
+            whole = [ids[cid] & mask for ids, mask in exact if ids.get(cid, 0) & mask]
+            return (-len(whole), -sum(1 for columns in whole if columns & name_mask), position(cid))
+        return sorted(results, key=score)
@@ -0,0 +1,515 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import os
+import json
+import queue
+import threading
+from collections import namedtuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QThread, QTimer, Qt, Signal
+
+from lib.contact_data import CONTACT_HEADERS, clean_row, diff_contacts, load_contacts, stream_contacts
+from lib.contact_lookup import ContactLookup
+from lib.contact_search import ContactSearchIndex
+from lib.contact_store import ContactStore
+from lib.contact_writer import get_contact_writer
+
+# The contact directory's data, shared by every module that needs it.
+#
+# The directory window, the caller lookup and the sitrep forms all read the
+# same loaded rows, search index and phone/email index, and every edit goes
+# through here so the indexes never drift from the rows or from the workbook
+# writer. Windows follow along through the signals.
+#
+# The workbook is shared over Box, so the service also watches it and, when
+# someone else saves it, re-reads it in the background and applies only the
+# rows that changed.
+#
+# The first load streams: rows are read on a worker thread and indexed and
+# shown a batch per GUI tick, so the first screenful appears right away and
+# search covers whatever has arrived so far.
+
+CONFIG_PATH = os.path.join("config", "contact_config.json")
+WATCH_POLL_MS = 3000        # mtime polling, for sync clients whose writes the OS watcher misses
+WATCH_SETTLE_MS = 1500      # let a sync client finish writing before re-reading
+INCREMENTAL_LIMIT = 300     # past this many changed rows, rebuilding the indexes is cheaper
+FIRST_BATCH_ROWS = 100      # about a screenful, shown as soon as it's read
+BATCH_ROWS = 500            # rows indexed and shown per GUI tick while streaming
+FEED_INTERVAL_MS = 15
+
+
+def configured_contact_path():
+    """The contact workbook chosen earlier, or None; never prompts."""
+    try:
+        with open(CONFIG_PATH, "r") as f:
+            contact_path = json.load(f).get("contact_file_path")
+    except (OSError, ValueError):
+        return None
+    return contact_path if contact_path and os.path.isfile(contact_path) else None
+
+
+# A finished reload. With `diff`, only those rows changed and index/lookup are
+# None and `contacts` is {ID: values} in workbook order; without it, everything
+# is replaced by `contacts` (a ContactStore) and the fresh indexes.
+ContactLoad = namedtuple("ContactLoad", "columns contacts next_id diff index lookup stamp from_cache generation")
+
+
+class ContactLoadWorker(QObject):
+    """Re-reads the contacts after the first load and works out what changed."""
+
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, contact_path, previous, columns, next_id, generation):
+        super().__init__()
+        self.contact_path = contact_path
+        self.previous = previous        # ContactStore snapshot already loaded, to diff against
+        self.columns = columns
+        self.next_id = next_id
+        self.generation = generation
+
+    def run(self):
+        try:
+            table, stamp, from_cache = load_contacts(self.contact_path)
+            columns = list(table.columns) or list(CONTACT_HEADERS)
+            rows = [clean_row(row, len(columns)) for row in table.rows]
+            diff = None
+            if columns != self.columns:
+                contacts = dict(zip(range(1, len(rows) + 1), rows))
+                next_id = len(rows) + 1
+            else:
+                diff, contacts = diff_contacts(self.previous, rows, self.next_id, columns)
+                next_id = max([self.next_id] + [contact_id + 1 for contact_id, _ in diff.added])
+                if sum(map(len, diff)) > INCREMENTAL_LIMIT:
+                    diff = None
+
+            index = lookup = None
+            if diff is None:
+                # Built here too, so the GUI thread only swaps them in
+                contacts = ContactStore(columns, contacts.items())
+                index = ContactSearchIndex(columns)
+                index.add_many(contacts.items())
+                lookup = ContactLookup(columns)
+                lookup.add_many(contacts.items())
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(ContactLoad(columns, contacts, next_id, diff, index, lookup,
+                                       stamp, from_cache, self.generation))
+
+
+class ContactStreamWorker(QObject):
+    """Reads the contacts for the first load, queueing them in batches as they're parsed.
+
+    Each row is queued with its search and lookup keys already worked out,
+    so the GUI thread only has to file it.
+    """
+
+    started = Signal(object, int)   # columns, estimated row count
+    finished = Signal(object, bool) # stamp, from_cache; every batch is queued by then
+    failed = Signal(str)
+
+    def __init__(self, contact_path):
+        super().__init__()
+        self.contact_path = contact_path
+        self.batches = queue.Queue()
+
+    def run(self):
+        try:
+            columns, rows, total, stamp, from_cache = stream_contacts(self.contact_path)
+            columns = list(columns) or list(CONTACT_HEADERS)
+            self.started.emit(columns, total)
+            index, lookup = ContactSearchIndex(columns), ContactLookup(columns)
+            batch, size = [], FIRST_BATCH_ROWS
+            for row in rows:
+                row = clean_row(row, len(columns))
+                batch.append((row, index.keys(row), lookup.keys(row)))
+                if len(batch) >= size:
+                    self.batches.put(batch)
+                    batch, size = [], BATCH_ROWS
+            if batch:
+                self.batches.put(batch)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(stamp, from_cache)
+
+# Loads still running; holds their thread/worker until they finish, even if the service goes first
+_active_loads = set()
+
+
+class ContactService(QObject):
+    """Contacts keyed by a stable ID, with their search index, caller lookup and workbook writer."""
+
+    reset = Signal()                # contents replaced by a (re)load, or emptied as the first load starts
+    progress = Signal(int, int)     # first load: rows so far, estimated total
+    load_finished = Signal()        # every row is in and indexed
+    refreshed = Signal(int)         # a reload changed this many contacts in place
+    contacts_added = Signal(object)
+    contact_updated = Signal(int)
+    contact_removed = Signal(int)
+    load_failed = Signal(str)
+
+    def __init__(self, contact_path):
+        super().__init__()
+        self.contact_path = contact_path
+        self.columns = list(CONTACT_HEADERS)
+        self._ids = []          # contact IDs in workbook order
+        self._positions = None  # contact ID -> position in _ids, rebuilt on the next search after a change
+        self._rows = ContactStore(self.columns)    # contact ID -> cell values
+        self.search_index = ContactSearchIndex(self.columns)
+        self.lookup = ContactLookup(self.columns)
+        self._next_id = 1
+        self._generation = 0    # bumped by every local edit, so loads started before one are dropped
+        self.loaded = False
+        self.loading = False
+        self.expected_rows = 0
+        self._stream = None     # first-load worker whose batches are being fed in
+        self._stream_end = None # its (stamp, from_cache), once it has queued everything
+        self.source_label = "workbook"
+        self._reload_wanted = False
+        self._seen = None       # (mtime_ns, size) of the workbook as last read or written
+
+        # Edits are written to the workbook in the background
+        self.writer = get_contact_writer(contact_path)
+        self.writer.saved.connect(self._on_saved)
+
+        # Other people's saves arrive through Box; re-read once the file settles
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_file_event)
+        self.watcher.directoryChanged.connect(self._on_file_event)
+        self._settle = QTimer(self)
+        self._settle.setSingleShot(True)
+        self._settle.setInterval(WATCH_SETTLE_MS)
+        self._settle.timeout.connect(self._check_file)
+        self._poll = QTimer(self)
+        self._poll.setInterval(WATCH_POLL_MS)
+        self._poll.timeout.connect(self._check_file)
+        self._poll.start()
+        self._feed = QTimer(self)
+        self._feed.setInterval(FEED_INTERVAL_MS)
+        self._feed.timeout.connect(self._feed_batch)
+        self._watch()
+
+    # ===== Loading =====
+    def load(self):
+        """Parse (or read the cached copy of) the workbook off the GUI thread.
+
+        Once loaded, later calls re-read it and apply just the rows that changed.
+        """
+        # Our queued edits are based on the rows we have; pick up the file once they're written
+        if self.loading or self.writer.busy():
+            self._reload_wanted = True
+            return
+        self._reload_wanted = False
+        self.loading = True
+        self._seen = self._file_state()
+
+        if self.loaded:
+            worker = ContactLoadWorker(self.contact_path, self._rows.copy(), list(self.columns),
+                                       self._next_id, self._generation)
+            worker.finished.connect(self._on_loaded)
+        else:
+            worker = self._stream = ContactStreamWorker(self.contact_path)
+            self._stream_end = None
+            worker.started.connect(self._on_stream_started)
+            worker.finished.connect(self._on_stream_finished)
+        worker.failed.connect(self._on_load_failed)
+
+        thread = QThread()
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+
+        load = (thread, worker)
+        _active_loads.add(load)
+        # Queued so the references are dropped on the GUI thread, after the thread has stopped
+        thread.finished.connect(lambda: _active_loads.discard(load), Qt.QueuedConnection)
+        thread.start()
+
+    def _on_loaded(self, result):
+        self.loading = False
+        if result.generation != self._generation:
+            # Edited while this was loading: these rows predate the edit
+            self.load()
+            return
+
+        self.writer.set_base(result.columns, result.stamp)
+        self.source_label = "cache" if result.from_cache else "workbook"
+        self._ids = list(result.contacts)
+        self._positions = None
+        self._next_id = result.next_id
+        if result.diff is None:
+            self.columns = result.columns
+            self._rows = result.contacts
+            self.search_index = result.index
+            self.lookup = result.lookup
+            self.reset.emit()
+            self.load_finished.emit()
+        else:
+            self._apply_diff(result.diff)
+            self.refreshed.emit(sum(map(len, result.diff)))
+        if self._reload_wanted:
+            self.load()
+
+    def _apply_diff(self, diff):
+        for contact_id in diff.removed:
+            del self._rows[contact_id]
+            self.search_index.remove(contact_id)
+            self.lookup.remove(contact_id)
+            self.contact_removed.emit(contact_id)
+        for contact_id, values in diff.updated + diff.added:
+            self._rows[contact_id] = values
+            self.search_index.update(contact_id, values)
+            self.lookup.update(contact_id, values)
+        for contact_id, _ in diff.updated:
+            self.contact_updated.emit(contact_id)
+        if diff.added:
+            self.contacts_added.emit([contact_id for contact_id, _ in diff.added])
+        if diff.removed or diff.updated or diff.added:
+            print(f"[CONTACTS] Workbook changed: {len(diff.added)} added, "
+                  f"{len(diff.updated)} updated, {len(diff.removed)} removed")
+
+    # ===== First Load =====
+    def _on_stream_started(self, columns, total):
+        self.columns = columns
+        self._ids, self._rows = [], ContactStore(columns)
+        self._positions = None
+        self.search_index = ContactSearchIndex(columns)
+        self.lookup = ContactLookup(columns)
+        self._next_id = 1
+        self.expected_rows = total
+        self.reset.emit()
+        self._feed.start()
+
+    def _on_stream_finished(self, stamp, from_cache):
+        # The feed finishes up once it has drained the queue
+        self._stream_end = (stamp, from_cache)
+
+    def _feed_batch(self):
+        try:
+            batch = self._stream.batches.get_nowait()
+        except queue.Empty:
+            if self._stream_end is not None:
+                self._finish_stream()
+            return
+        ids = list(range(self._next_id, self._next_id + len(batch)))
+        self._next_id += len(batch)
+        self._ids.extend(ids)
+        self._positions = None
+        # Vocabulary sorting waits for the end (or a search made meanwhile)
+        for contact_id, (values, search_keys, lookup_keys) in zip(ids, batch):
+            self._rows[contact_id] = values
+            self.search_index.add(contact_id, values, search_keys, bulk=True)
+            self.lookup.add(contact_id, values, bulk=True, keys=lookup_keys)
+        self.contacts_added.emit(ids)
+        self.progress.emit(len(self._ids), max(self.expected_rows, len(self._ids)))
+
+    def _finish_stream(self):
+        self._feed.stop()
+        stamp, from_cache = self._stream_end
+        self._stream = self._stream_end = None
+        self.search_index.sort_tokens()
+        self.lookup.sort_keys()
+        self.writer.set_base(self.columns, stamp)
+        self.source_label = "cache" if from_cache else "workbook"
+        self.expected_rows = len(self._ids)
+        self.loading = False
+        self.loaded = True
+        self.load_finished.emit()
+        if self._reload_wanted:
+            self.load()
+
+    def _on_load_failed(self, message):
+        self.loading = False
+        self._feed.stop()
+        self._stream = self._stream_end = None
+        if self.loaded:
+            # Usually caught mid-sync; keep what we have and try again on the next change
+            print(f"[CONTACTS] Could not re-read workbook, keeping loaded contacts: {message}")
+            self.refreshed.emit(0)
+        else:
+            self.load_failed.emit(message)
+        if self._reload_wanted:
+            self.load()
+
+    def _on_saved(self, merged):
+        stamp = self.writer.stamp
+        if stamp is not None:
+            # Our own write; not a change to pick up
+            self._seen = (stamp.mtime_ns, stamp.size)
+        if merged or self._reload_wanted:
+            # The workbook also holds someone else's edits: pick them up
+            self.load()
+
+    # ===== Watching =====
+    def _watch(self):
+        # Saving through a temp file replaces the workbook, which drops it from the watcher
+        for path in (self.contact_path, os.path.dirname(os.path.abspath(self.contact_path))):
+            if os.path.exists(path) and path not in self.watcher.files() + self.watcher.directories():
+                self.watcher.addPath(path)
+
+    def _file_state(self):
+        try:
+            info = os.stat(self.contact_path)
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def _on_file_event(self, path):
+        self._settle.start()
+
+    def _check_file(self):
+        self._watch()
+        state = self._file_state()
+        # Missing means mid-save; wait for it to reappear
+        if not self.loaded or state is None or state == self._seen:
+            return
+        self.load()
+
+    # ===== Contacts =====
+    def contact_ids(self):
+        return list(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, contact_id):
+        return contact_id in self._rows
+
+    def values(self, contact_id):
+        return self._rows[contact_id]
+
+    def cell(self, contact_id, column):
+        return self._rows.cell(contact_id, column)
+
+    def contact(self, contact_id):
+        """{column: value} for one contact."""
+        return dict(zip(self.columns, self._rows[contact_id]))
+
+    def display_name(self, contact_id):
+        first, last = self._rows.cell(contact_id, 0), self._rows.cell(contact_id, 1)
+        return f"{first} {last}".strip()
+
+    def search(self, query):
+        """Contact IDs matching a directory search, best first; None for an empty query."""
+        if self._positions is None:
+            self._positions = {contact_id: row for row, contact_id in enumerate(self._ids)}
+        return self.search_index.search(query, positions=self._positions)
+
+    def identify(self, text, limit=20):
+        """LookupMatches for the contacts a phone number or email address belongs to."""
+        return self.lookup.identify(text, limit)
+
+    # ===== Edits =====
+    def _store(self, contact_id, values):
+        self._generation += 1
+        if contact_id not in self._rows:
+            self._ids.append(contact_id)
+            self._positions = None
+        self._rows[contact_id] = values
+        self.search_index.update(contact_id, values)
+        self.lookup.update(contact_id, values)
+
+    def add(self, fields):
+        """Add a contact from a {column: value} dict and queue it for the workbook; returns its ID."""
+        contact_id = self._next_id
+        self._next_id += 1
+        self._store(contact_id, clean_row([fields.get(column, "") for column in self.columns], len(self.columns)))
+        self.writer.add(contact_id, self.values(contact_id))
+        self.contacts_added.emit([contact_id])
+        return contact_id
+
+    def update(self, contact_id, values):
+        base = self.values(contact_id)
+        self._store(contact_id, clean_row(values, len(self.columns)))
+        self.writer.update(contact_id, base, self.values(contact_id))
+        self.contact_updated.emit(contact_id)
+
+    def remove(self, contact_id):
+        self._generation += 1
+        base = self._rows.pop(contact_id)
+        self._ids.remove(contact_id)
+        self._positions = None
+        self.search_index.remove(contact_id)
+        self.lookup.remove(contact_id)
+        self.writer.delete(contact_id, base)
+        self.contact_removed.emit(contact_id)
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+def get_contact_service(contact_path=None, load=True):
+    """The shared contacts for `contact_path` (default: the configured workbook).
+
+    The first call starts loading them unless `load` is False, in which case
+    the service stays empty until someone calls load(). Returns None when no
+    workbook has been chosen yet.
+    """
+    contact_path = contact_path or configured_contact_path()
+    if not contact_path:
+        return None
+    key = os.path.abspath(contact_path)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = ContactService(contact_path)
+            if load:
+                service.load()
+        return service
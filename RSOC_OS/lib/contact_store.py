@@ -0,0 +1,196 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import sys
+from array import array
+from collections.abc import MutableMapping
+
+# Compact in-memory contact cells, stored by column (no Qt).
+#
+# A directory is mostly repeats: thousands of contacts share a handful of
+# companies and sites and a few hundred first names and titles. Cells are
+# kept column by column instead of as a list per contact, and a contact's
+# position in every column is its ID (IDs are handed out densely from 1, so
+# the few gaps left by removals cost a blank cell each):
+#   - company and site are dictionary-encoded: an array of 4-byte codes
+#     into the column's distinct values;
+#   - names, titles and the like are lists of interned strings, so repeated
+#     values are one object however many contacts carry them;
+#   - emails and phone numbers are nearly all distinct, so interning them
+#     would only add table entries; they are kept as they are.
+
+ENCODED_COLUMNS = ("Company", "Location/Site")
+DISTINCT_COLUMNS = ("Work Email", "Personal Email", "Work Phone", "Personal Phone")
+
+
+class EncodedColumn:
+    """A column stored as codes into its distinct values; list-like by position."""
+
+    __slots__ = ("codes", "values", "_codes")
+
+    def __init__(self):
+        self.codes = array("I")
+        self.values = [""]          # code -> value; never shrinks, the set stays small
+        self._codes = {"": 0}       # value -> code
+
+    def _code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value):
+        self.codes.append(self._code(value))
+
+    def extend(self, values):
+        self.codes.extend(map(self._code, values))
+
+    def __getitem__(self, position):
+        return self.values[self.codes[position]]
+
+    def __setitem__(self, position, value):
+        self.codes[position] = self._code(value)
+
+    def copy(self):
+        column = EncodedColumn()
+        column.codes = array("I", self.codes)
+        column.values = list(self.values)
+        column._codes = dict(self._codes)
+        return column
+
+
+class ContactStore(MutableMapping):
+    """{contact ID: cell values} for one workbook's columns, stored compactly.
+
+    Reads return fresh lists, so callers may keep or change them; writes
+    take a full row (already clean_row()-ed to the column count). IDs are
+    positive ints, expected to be dense.
+    """
+
+    def __init__(self, columns, items=()):
+        self.columns = list(columns)
+        # Position 0 is a placeholder, so positions line up with IDs
+        self._columns = [EncodedColumn() if column in ENCODED_COLUMNS else [] for column in self.columns]
+        for column in self._columns:
+            column.append("")
+        # How each column stores a value
+        self._store_as = [None if column in ENCODED_COLUMNS or column in DISTINCT_COLUMNS else sys.intern
+                          for column in self.columns]
+        self._present = bytearray(1)    # ID -> 1 if that contact exists; ID 0 never does
+        self._count = 0
+        for contact_id, values in items:
+            self[contact_id] = values
+
+    def __getitem__(self, contact_id):
+        if not self.__contains__(contact_id):
+            raise KeyError(contact_id)
+        return [column[contact_id] for column in self._columns]
+
+    def __setitem__(self, contact_id, values):
+        if contact_id == len(self._present):
+            # The usual case: the next ID, appended
+            for column, store_as, value in zip(self._columns, self._store_as, values):
+                column.append(store_as(value) if store_as else value)
+            self._present.append(1)
+            self._count += 1
+            return
+        if contact_id > len(self._present):
+            gap = contact_id - len(self._present)
+            for column in self._columns:
+                column.extend([""] * gap)
+            self._present.extend(bytes(gap))
+            return self.__setitem__(contact_id, values)
+        if contact_id < 1:
+            raise KeyError(contact_id)
+        for column, store_as, value in zip(self._columns, self._store_as, values):
+            column[contact_id] = store_as(value) if store_as else value
+        if not self._present[contact_id]:
+            self._present[contact_id] = 1
+            self._count += 1
+
+    def __delitem__(self, contact_id):
+        if not self.__contains__(contact_id):
+            raise KeyError(contact_id)
+        # Blank the cells so their strings can be freed
+        for column in self._columns:
+            column[contact_id] = ""
+        self._present[contact_id] = 0
+        self._count -= 1
+
+    def __iter__(self):
+        present = self._present
+        return (contact_id for contact_id in range(1, len(present)) if present[contact_id])
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, contact_id):
+        return isinstance(contact_id, int) and 0 < contact_id < len(self._present) and self._present[contact_id] == 1
+
+    def cell(self, contact_id, column):
+        """One value by column position, without building the row."""
+        if not self.__contains__(contact_id):
+            raise KeyError(contact_id)
+        return self._columns[column][contact_id]
+
+    def copy(self):
+        """A snapshot another thread can read while this one keeps changing."""
+        store = ContactStore(self.columns)
+        store._columns = [column.copy() for column in self._columns]
+        store._present = bytearray(self._present)
+        store._count = self._count
+        return store
@@ -0,0 +1,281 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import os
+import time
+import tempfile
+import threading
+from collections import namedtuple
+
+from PySide6.QtCore import QObject, Signal, QCoreApplication
+
+from lib.contact_data import CONTACT_CACHE, CONTACT_HEADERS, ContactTable, cell_text, same_file, stamp_file, write_cache
+
+WRITE_DELAY = 2.0      # seconds without edits before pending changes are written
+RETRY_DELAY = 15.0     # after a failed write, e.g. while the workbook is open in Excel
+FLUSH_TIMEOUT = 10.0
+
+# One contact's pending change: base is the row as last read (None if added),
+# values the row to write (None if deleted)
+ContactChange = namedtuple("ContactChange", "base values")
+
+
+def merge_change(older, newer):
+    """Coalesce two changes to the same contact; None if they cancel out."""
+    if older is None:
+        return newer
+    if older.base is None and newer.values is None:
+        return None     # added and deleted before it was ever written
+    return ContactChange(older.base, newer.values)
+
+
+def apply_changes(path, columns, changes):
+    """Patch `changes` into the workbook and atomically replace it.
+
+    Rows are found by their base contents rather than position, so rows
+    added, removed or reordered by someone else since we read the file are
+    left as they are; only the cells we changed are written. A change whose
+    base row no longer exists (someone else edited or removed it) is not
+    applied and is returned as a conflict. Returns (table, conflicts), where
+    `table` is the workbook's contents after the write.
+    """
+    from openpyxl import load_workbook  # type: ignore
+    workbook = load_workbook(path)
+    sheet = workbook.active
+
+    header = [cell_text(cell.value) for cell in sheet[1]]
+    positions = {name: i + 1 for i, name in enumerate(header) if name}
+    for name in columns:
+        if name not in positions:
+            header.append(name)
+            positions[name] = len(header)
+            sheet.cell(1, positions[name], name)
+
+    def row_values(row):
+        return tuple(cell_text(sheet.cell(row, positions[name]).value) for name in columns)
+
+    rows_by_content = {}
+    for row in range(2, sheet.max_row + 1):
+        rows_by_content.setdefault(row_values(row), []).append(row)
+
+    conflicts, doomed, added = [], [], []
+    for change in changes:
+        if change.base is None:
+            added.append(change.values)
+            continue
+        matches = rows_by_content.get(tuple(change.base))
+        if not matches:
+            conflicts.append(change)
+            continue
+        row = matches.pop(0)
+        if change.values is None:
+            doomed.append(row)
+            continue
+        for name, old, new in zip(columns, change.base, change.values):
+            if old != new:
+                sheet.cell(row, positions[name], new)
+
+    for row in sorted(doomed, reverse=True):
+        sheet.delete_rows(row)
+    for values in added:
+        new_row = sheet.max_row + 1
+        for name, value in zip(columns, values):
+            sheet.cell(new_row, positions[name], value)
+
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".xlsx", dir=folder)
+    os.close(fd)
+    try:
+        workbook.save(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    rows = []
+    for cells in sheet.iter_rows(min_row=2, max_col=len(header), values_only=True):
+        values = [cell_text(value) for value in cells]
+        if any(values):
+            rows.append(values)
+    return ContactTable(header, rows), conflicts
+
+
+class ContactWriter(QObject):
+    """Writes contact edits to the workbook from a background thread.
+
+    Edits are queued per contact and coalesced, then written WRITE_DELAY
+    after the last one with apply_changes(). If the workbook changed since we
+    read it, other people's edits are kept and `saved` reports it so the
+    directory can reload; edits that collide with theirs are reported through
+    `conflicts_found` instead of overwriting them. Failed writes are retried.
+    """
+
+    saved = Signal(bool)            # True if the workbook held edits from someone else
+    conflicts_found = Signal(list)  # ContactChanges that were not applied
+    failed = Signal(str)
+
+    def __init__(self, path, cache_path=CONTACT_CACHE):
+        super().__init__()
+        self.path = path
+        self.cache_path = cache_path
+        self.columns = list(CONTACT_HEADERS)
+        self.stamp = None               # workbook contents our base rows came from
+        self._pending = {}              # contact ID -> ContactChange
+        self._due = 0.0
+        self._writing = False
+        self._cond = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def set_base(self, columns, stamp):
+        """Record the workbook contents just loaded; ignored while our own writes are outstanding."""
+        with self._cond:
+            if not self._pending and not self._writing:
+                self.columns, self.stamp = list(columns), stamp
+
+    def busy(self):
+        with self._cond:
+            return bool(self._pending) or self._writing
+
+    # ===== Queueing =====
+    def add(self, contact_id, values):
+        self._queue(contact_id, ContactChange(None, list(values)))
+
+    def update(self, contact_id, base, values):
+        self._queue(contact_id, ContactChange(list(base), list(values)))
+
+    def delete(self, contact_id, base):
+        self._queue(contact_id, ContactChange(list(base), None))
+
+    def _queue(self, contact_id, change):
+        with self._cond:
+            merged = merge_change(self._pending.get(contact_id), change)
+            if merged is None:
+                self._pending.pop(contact_id, None)
+            else:
+                self._pending[contact_id] = merged
+            self._due = time.monotonic() + WRITE_DELAY
+            self._cond.notify_all()
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """Write pending changes now and wait for them (used at quit)."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._due = 0.0
+            self._cond.notify_all()
+            while (self._pending or self._writing) and time.monotonic() < deadline:
+                self._cond.wait(deadline - time.monotonic())
+
+    # ===== Writer thread =====
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending or time.monotonic() < self._due:
+                    self._cond.wait(None if not self._pending else self._due - time.monotonic())
+                changes, self._pending = self._pending, {}
+                columns, stamp = self.columns, self.stamp
+                self._writing = True
+
+            try:
+                external = stamp is not None and not same_file(self.path, stamp)
+                table, conflicts = apply_changes(self.path, columns, list(changes.values()))
+                new_stamp = stamp_file(self.path)
+            except Exception as e:
+                with self._cond:
+                    # Put them back ahead of anything queued meanwhile, and try again later
+                    for contact_id, change in changes.items():
+                        merged = merge_change(change, self._pending[contact_id]) \
+                            if contact_id in self._pending else change
+                        if merged is None:
+                            self._pending.pop(contact_id, None)
+                        else:
+                            self._pending[contact_id] = merged
+                    self._due = time.monotonic() + RETRY_DELAY
+                    self._writing = False
+                    self._cond.notify_all()
+                print(f"[CONTACTS] Write failed, retrying in {RETRY_DELAY:.0f}s: {e}")
+                self.failed.emit(str(e))
+                continue
+
+            try:
+                write_cache(self.cache_path, self.path, table, new_stamp)
+            except OSError as e:
+                print(f"[CONTACTS] Could not refresh cache: {e}")
+
+            with self._cond:
+                self.stamp = new_stamp
+                self._writing = False
+                self._cond.notify_all()
+            if conflicts:
+                self.conflicts_found.emit(conflicts)
+            self.saved.emit(external or bool(conflicts))
+
+
+# ===== Shared Instances =====
+_writers = {}
+_writers_lock = threading.Lock()
+
+def get_contact_writer(path):
+    """One writer per workbook, outliving any directory window so pending edits still land."""
+    key = os.path.abspath(path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = ContactWriter(path)
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(writer.flush)
+        return writer
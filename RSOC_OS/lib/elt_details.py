@@ -168,13 +168,16 @@ def _fallback_widget(pptx, msg):
     hb.addStretch()
     vb.addLayout(hb)
     w.setMinimumSize(QSize(600, 300))
+    w.setProperty("cacheable", False)   # retry the export next time the tool is opened
     return w
 
 # ---------- Final widget builder ----------
 def get_elt_details_widget(parent=None) -> QWidget:
     pptx = _ensure_pptx(parent)
     if not pptx:
-        return QLabel("No ELT PowerPoint selected.")
+        label = QLabel("No ELT PowerPoint selected.")
+        label.setProperty("cacheable", False)
+        return label
 
     tmp_dir = tempfile.mkdtemp(prefix="elt_slides_")
     pngs = export_slides_to_pngs(pptx, tmp_dir)
@@ -184,3 +184,6 @@ class FoldersWidget(QWidget):
     def show_main_folder_view(self):
         self.stacked_layout.setCurrentIndex(0)
 
+    def reset_state(self):
+        self.show_main_folder_view()
+
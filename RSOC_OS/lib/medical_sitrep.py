@@ -192,6 +192,13 @@ def get_medical_sitrep_widget(parent=None):
     patient_input.setPlaceholderText("e.g. Jane Doe (C1234567)")
     form_layout.addWidget(patient_input, row, 2, 1, 2)
 
+    # Suggest directory contacts by name or by the caller's number/email
+    from lib.contact_directory import attach_contact_completer
+    widget.contact_completers = [
+        attach_contact_completer(reporting_input, company_input),
+        attach_contact_completer(patient_input, patient_company_input),
+    ]
+
     row += 1
     form_layout.addWidget(QLabel("Describe Symptom(s):"), row, 0)
     symptom_input = QLineEdit()
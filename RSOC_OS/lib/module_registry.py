@@ -0,0 +1,231 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import sys
+import time
+import importlib
+from dataclasses import dataclass
+
+# ===== Tool Manifest =====
+# Every dashboard tool is declared here instead of being imported by RSOC_OS.py.
+# A tool's module is only imported the first time the operator opens it.
+#
+#   key         - action name used by the sidebar / grid buttons
+#   label       - button text (grid) or tooltip (sidebar)
+#   loader      - "package.module:callable" returning the tool widget
+#   icon        - sidebar icon in ./images (sidebar tools only)
+#   size        - preferred window (width, height) once the tool is shown
+#   placement   - "sidebar" or "grid"
+#   pass_parent - call the loader with the dashboard as its parent
+#   kind        - "view" (swapped into the content area) or "action" (e.g. a dialog)
+#   cache       - keep the view alive after navigating away (see lib/view_manager.py)
+#   memory_mb   - estimated resident cost of the cached view, None to estimate it
+#   reset_on_open - call the view's reset_state() when it is reopened from the cache
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    key: str
+    label: str
+    loader: str = ""
+    icon: str = ""
+    size: tuple = (800, 500)
+    placement: str = "grid"
+    pass_parent: bool = False
+    kind: str = "view"
+    cache: bool = True
+    memory_mb: float = None
+    reset_on_open: bool = False
+
+
+MODULE_MANIFEST = [
+    # ===== Sidebar =====
+    ModuleSpec("Home", "Dashboard", icon="home.png", placement="sidebar"),
+    ModuleSpec("Clipboard", "Clipboard", "lib.clipboard_manager:get_clipboard_widget",
+               icon="clipboard.png", size=(950, 600), placement="sidebar", pass_parent=True),
+    ModuleSpec("QuickNotes", "Quick Notes", "lib.quick_notes:get_quick_notes_widget",
+               icon="notes.png", size=(900, 600), placement="sidebar", pass_parent=True),
+    ModuleSpec("Alerts", "Alerts Center", "lib.alerts_center:get_alerts_widget",
+               icon="alert.png", size=(950, 600), placement="sidebar", pass_parent=True),
+    ModuleSpec("UserGuide", "User Guide", icon="question.png", placement="sidebar"),
+    ModuleSpec("Settings", "Settings", "lib.settings_window:open_settings",
+               icon="settings.png", placement="sidebar", pass_parent=True, kind="action"),
+
+    # ===== Dashboard Grid =====
+    ModuleSpec("OpenCameras", "Cameras", "lib.milestone_launcher:get_milestone_launcher_widget", size=(400, 400)),
+    ModuleSpec("OpenSitreps", "Sitreps", "lib.sitreps_menu:get_sitreps_menu_widget", size=(400, 400), pass_parent=True),
+    ModuleSpec("OpenBulletin", "Bulletin", "lib.bulletin_form:get_bulletin_form_widget", size=(400, 300)),
+    ModuleSpec("OpenBOLO", "BOLO", "lib.bolo_generator:get_bolo_generator_widget", size=(900, 500)),
+    ModuleSpec("OpenFolders", "Folders", "lib.folders_widget:FoldersWidget", size=(740, 500), reset_on_open=True),
+    ModuleSpec("OpenDocuments", "Documents", "lib.documents_widget:get_documents_widget", size=(600, 400)),
+    ModuleSpec("OpenContacts", "Contact Directory", "lib.contact_directory:get_contact_directory_widget", size=(1400, 500), memory_mb=60),
+    ModuleSpec("OpenEmailFormats", "Email Formats", "lib.email_formats_widget:EmailFormatsWidget", size=(400, 400)),
+    ModuleSpec("OpenWebsites", "Websites", "lib.websites:get_website_selector_widget", size=(400, 400), pass_parent=True),
+    ModuleSpec("OpenELTDetails", "ELT Details", "lib.elt_details:get_elt_details_widget", size=(1470, 800), pass_parent=True, memory_mb=120),
+]
+
+MODULES_BY_KEY = {spec.key: spec for spec in MODULE_MANIFEST}
+
+
+def sidebar_modules():
+    return [spec for spec in MODULE_MANIFEST if spec.placement == "sidebar"]
+
+
+def grid_modules():
+    return [spec for spec in MODULE_MANIFEST if spec.placement == "grid"]
+
+
+# ===== Lazy Loading =====
+_loaded_callables = {}
+import_timings = []   # (module name, milliseconds, modules pulled in, RSS delta MB)
+
+
+def resolve_loader(spec):
+    """Import the tool's module on first use and return its loader callable."""
+    if spec.loader in _loaded_callables:
+        return _loaded_callables[spec.loader]
+
+    module_name, attr = spec.loader.split(":")
+    already_loaded = module_name in sys.modules
+    modules_before = len(sys.modules)
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+
+    module = importlib.import_module(module_name)
+
+    if not already_loaded:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        rss_after = current_rss_mb()
+        rss_delta = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+        record_import(module_name, elapsed_ms, len(sys.modules) - modules_before, rss_delta)
+
+    loader = getattr(module, attr)
+    _loaded_callables[spec.loader] = loader
+    return loader
+
+
+def open_module(spec, parent=None):
+    loader = resolve_loader(spec)
+    if spec.pass_parent:
+        return loader(parent)
+    return loader()
+
+
+def is_loaded(spec):
+    return spec.loader.split(":")[0] in sys.modules
+
+
+# ===== Startup / Import Report =====
+def record_import(module_name, elapsed_ms, new_modules, rss_delta_mb=None):
+    # Reported by import_report() at shutdown, not printed per navigation
+    import_timings.append((module_name, elapsed_ms, new_modules, rss_delta_mb))
+
+
+def startup_report(startup_ms):
+    """Return the startup report lines: total cold start, RSS and which tools were deferred.
+
+    For a breakdown of the eager imports themselves run `python -X importtime RSOC_OS.py`.
+    """
+    rss = current_rss_mb()
+    lines = [f"[Startup] Dashboard ready in {startup_ms:.1f} ms, {len(sys.modules)} modules loaded"
+             + (f", {rss:.1f} MB resident" if rss is not None else "")]
+
+    deferred = [spec.loader.split(":")[0] for spec in MODULE_MANIFEST if spec.loader and not is_loaded(spec)]
+    if deferred:
+        lines.append(f"[Startup] Deferred until first open: {', '.join(sorted(set(deferred)))}")
+    return lines
+
+
+def import_report():
+    """Return the cost of every tool imported on first open this session, slowest first."""
+    if not import_timings:
+        return ["[Modules] No tools were opened this session"]
+    total_ms = sum(t[1] for t in import_timings)
+    lines = [f"[Modules] {len(import_timings)} tools imported on first open, {total_ms:.1f} ms in total"]
+    for module_name, elapsed_ms, new_modules, rss_delta in sorted(import_timings, key=lambda t: t[1], reverse=True):
+        rss_text = f", {rss_delta:+.1f} MB" if rss_delta is not None else ""
+        lines.append(f"[Modules]   {module_name:<32} {elapsed_ms:8.1f} ms  +{new_modules} modules{rss_text}")
+    return lines
+
+
+def current_rss_mb():
+    """Resident set size of this process in MB, or None if it can't be read."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / (1024 * 1024)
+            return None
+
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        import resource
+        return resident_pages * resource.getpagesize() / (1024 * 1024)
+    except Exception:
+        return None
@@ -0,0 +1,201 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import os
+import json
+import tempfile
+
+# Crash-safe persistence for a single text document (no Qt).
+#
+# Saves append a small delta (position, deleted length, inserted text) to a
+# journal instead of rewriting the whole note. Once the journal grows past
+# COMPACT_BYTES / COMPACT_ENTRIES it is folded into an atomically replaced
+# snapshot. Loading replays the journal over the snapshot, so a crash loses
+# at most the edits made since the last save.
+
+SAVE_DEBOUNCE_MS = 1000     # save once typing pauses this long...
+MAX_SAVE_DELAY_MS = 5000    # ...or at least this often while typing continues
+COMPACT_BYTES = 64 * 1024
+COMPACT_ENTRIES = 500
+
+
+def text_delta(old, new):
+    """(position, deleted length, inserted text) turning `old` into `new`."""
+    limit = min(len(old), len(new))
+    # Binary search on slice equality: compared in C, so a 200 KB note diffs in microseconds
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old[:mid] == new[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    start = low
+    low, high = 0, limit - start
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old[len(old) - mid:] == new[len(new) - mid:]:
+            low = mid
+        else:
+            high = mid - 1
+    end = low
+    return start, len(old) - start - end, new[start:len(new) - end]
+
+
+def apply_delta(text, position, deleted, inserted):
+    return text[:position] + inserted + text[position + deleted:]
+
+
+class NoteJournal:
+    def __init__(self, snapshot_path, journal_path):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.text = ""
+        self.seq = 0
+        self.meta = {}      # caller's bookkeeping, kept in the snapshot
+        self.journal_entries = 0
+        self.journal_bytes = 0
+        # I/O counters, reported by benchmarks/quick_notes_io_bench.py
+        self.writes = 0
+        self.bytes_written = 0
+
+    # ===== Loading =====
+    def load(self):
+        """Read the snapshot and replay the journal; returns the latest text."""
+        self.text, self.seq, self.meta = "", 0, {}
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, 'r') as file:
+                    data = json.load(file)
+                self.text = data.get("note", "")
+                self.seq = data.get("seq", 0)
+                self.meta = data.get("meta", {})
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"[NOTES] Could not read snapshot, using journal only: {e}")
+
+        replayed = 0
+        self.journal_entries = self.journal_bytes = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as journal:
+                for line in journal:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break   # torn final line from a crash mid-append
+                    self.journal_entries += 1
+                    self.journal_bytes += len(line.encode('utf-8'))
+                    # Entries already folded into the snapshot (crash during compaction)
+                    if entry["seq"] <= self.seq:
+                        continue
+                    self.text = apply_delta(self.text, entry["at"], entry["del"], entry["ins"])
+                    self.seq = entry["seq"]
+                    replayed += 1
+
+        if replayed:
+            print(f"[NOTES] Recovered {replayed} unsaved edits from the journal")
+            self.compact()
+        return self.text
+
+    # ===== Saving =====
+    def save(self, text):
+        """Journal the change from the last saved text; returns True if anything was written."""
+        if text == self.text:
+            return False
+        position, deleted, inserted = text_delta(self.text, text)
+        self.seq += 1
+        line = json.dumps({"seq": self.seq, "at": position, "del": deleted, "ins": inserted}) + "\n"
+        with open(self.journal_path, 'a', encoding='utf-8') as journal:
+            journal.write(line)
+            journal.flush()
+            os.fsync(journal.fileno())
+
+        self.text = text
+        size = len(line.encode('utf-8'))
+        self.journal_entries += 1
+        self.journal_bytes += size
+        self.writes += 1
+        self.bytes_written += size
+
+        if self.journal_bytes > COMPACT_BYTES or self.journal_entries > COMPACT_ENTRIES:
+            self.compact()
+        return True
+
+    def compact(self):
+        """Fold the journal into a fresh snapshot."""
+        payload = json.dumps({"note": self.text, "seq": self.seq, "meta": self.meta}).encode('utf-8')
+        # Same temp-file-and-swap as utils.atomic_write_json, kept local so
+        # this module stays importable without Qt.
+        folder = os.path.dirname(os.path.abspath(self.snapshot_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".json", dir=folder)
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        open(self.journal_path, 'w').close()
+        self.writes += 1
+        self.bytes_written += len(payload)
+        self.journal_entries = self.journal_bytes = 0
+
+    def clear(self):
+        self.text = ""
+        self.seq += 1
+        self.compact()
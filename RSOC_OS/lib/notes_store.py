@@ -0,0 +1,324 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import json
+import time
+import zlib
+import sqlite3
+import datetime
+import threading
+from collections import namedtuple
+
+from lib.notes_journal import text_delta
+
+# ===== Shared notes database =====
+NOTES_DB = './config/quick_notes.db'
+
+VERSION_INTERVAL = 10 * 60     # saves this soon after the newest version was cut amend it
+COMPRESS_THRESHOLD = 256       # deltas above this many bytes are zlib-compressed
+SNIPPET_WORDS = 12
+
+# Shift start hours, matching the First/Second/Third shift pass-downs
+SHIFT_STARTS = ((6, "First Shift"), (14, "Second Shift"), (22, "Third Shift"))
+
+NoteSummary = namedtuple("NoteSummary", "id title version created updated")
+NoteVersion = namedtuple("NoteVersion", "version saved added removed")
+NoteMatch = namedtuple("NoteMatch", "id title updated snippet")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS note_versions (
+    note_id INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    saved REAL NOT NULL,
+    delta BLOB NOT NULL,
+    compressed INTEGER NOT NULL,
+    PRIMARY KEY (note_id, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS notes_updated ON notes (updated);
+"""
+
+# External-content index over notes, kept in step by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+    title, body, content='notes', content_rowid='id', tokenize='unicode61 remove_diacritics 2');
+CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN
+    INSERT INTO notes_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+    INSERT INTO notes_fts (notes_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS notes_fts_update AFTER UPDATE OF title, body ON notes BEGIN
+    INSERT INTO notes_fts (notes_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    INSERT INTO notes_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+END;
+"""
+
+
+def shift_title(now=None):
+    """e.g. "Second Shift 10/17/2026"; Third Shift keeps its start date after midnight."""
+    now = now or datetime.datetime.now()
+    name, day = SHIFT_STARTS[-1][1], now - datetime.timedelta(days=1)
+    for hour, shift in SHIFT_STARTS:
+        if now.hour >= hour:
+            name, day = shift, now
+    return f"{name} {day.strftime('%m/%d/%Y')}"
+
+
+def fts_query(text):
+    """Turn free text into an FTS5 query: every word must match, as a prefix."""
+    words = "".join(ch if ch.isalnum() else " " for ch in text).split()
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def like_pattern(word):
+    return "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def pack_delta(position, removed, inserted):
+    data = json.dumps([position, removed, inserted]).encode("utf-8")
+    if len(data) > COMPRESS_THRESHOLD:
+        return zlib.compress(data, 6), 1
+    return data, 0
+
+
+def unpack_delta(payload, compressed):
+    return json.loads(zlib.decompress(payload) if compressed else payload)
+
+
+def undo_delta(text, position, removed, inserted):
+    """Text of the previous version, given a version's text and its delta."""
+    return text[:position] + removed + text[position + len(inserted):]
+
+
+class NotesStore:
+    """Named notes with delta-compressed version history and full-text search.
+
+    Each note keeps its current text in `notes.body`; every version row holds
+    only what changed from the version before it (position, removed text,
+    inserted text), so older versions are rebuilt by walking back from the
+    current text and storage grows with what was edited, not with how often
+    it was saved. Saves within VERSION_INTERVAL of when the newest version
+    was first saved amend it rather than adding another, so steady editing
+    still cuts a version every interval. Search uses SQLite FTS5 when the build has
+    it, falling back to LIKE. Used from the GUI thread only.
+    """
+
+    def __init__(self, path=NOTES_DB):
+        self.path = path
+        self._db = sqlite3.connect(path or ":memory:")
+        self._db.executescript(SCHEMA)
+        try:
+            self._db.executescript(FTS_SCHEMA)
+            self.full_text = True
+        except sqlite3.OperationalError as e:
+            print(f"[NOTES] FTS5 unavailable, search falls back to LIKE: {e}")
+            self.full_text = False
+
+    # ===== Notes =====
+    def create(self, title, text="", when=None):
+        when = when if when is not None else time.time()
+        with self._db:
+            note_id = self._db.execute(
+                "INSERT INTO notes (title, body, version, created, updated) VALUES (?, ?, 1, ?, ?)",
+                (title, text, when, when)).lastrowid
+            self._db.execute(
+                "INSERT INTO note_versions (note_id, version, saved, delta, compressed) VALUES (?, 1, ?, ?, ?)",
+                (note_id, when) + pack_delta(0, "", text))
+        return note_id
+
+    def notes(self):
+        """All notes, most recently edited first."""
+        rows = self._db.execute(
+            "SELECT id, title, version, created, updated FROM notes ORDER BY updated DESC").fetchall()
+        return [NoteSummary(*row) for row in rows]
+
+    def get(self, note_id):
+        row = self._db.execute(
+            "SELECT id, title, version, created, updated FROM notes WHERE id = ?", (note_id,)).fetchone()
+        return NoteSummary(*row) if row else None
+
+    def find_by_title(self, title):
+        row = self._db.execute(
+            "SELECT id FROM notes WHERE title = ? ORDER BY updated DESC LIMIT 1", (title,)).fetchone()
+        return row[0] if row else None
+
+    def body(self, note_id):
+        row = self._db.execute("SELECT body FROM notes WHERE id = ?", (note_id,)).fetchone()
+        return row[0] if row else None
+
+    def rename(self, note_id, title):
+        with self._db:
+            self._db.execute("UPDATE notes SET title = ? WHERE id = ?", (title, note_id))
+
+    # ===== Saving =====
+    def save(self, note_id, text, when=None, new_version=False):
+        """Record `text` as the note's current text; returns its version number."""
+        when = when if when is not None else time.time()
+        row = self._db.execute("SELECT body, version FROM notes WHERE id = ?", (note_id,)).fetchone()
+        if row is None:
+            raise KeyError(note_id)
+        body, version = row
+        if text == body:
+            return version
+
+        with self._db:
+            head = self._db.execute(
+                "SELECT saved, delta, compressed FROM note_versions WHERE note_id = ? AND version = ?",
+                (note_id, version)).fetchone()
+            amend = (not new_version and version > 1 and head is not None
+                     and when - head[0] < VERSION_INTERVAL)
+            if amend:
+                # Fold this save into the newest version: diff from the version before it,
+                # keeping the time it was cut so the interval doesn't slide with each save
+                base = undo_delta(body, *unpack_delta(head[1], head[2]))
+                saved = head[0]
+            else:
+                base, saved = body, when
+                version += 1
+
+            position, deleted, inserted = text_delta(base, text)
+            if amend and not deleted and not inserted:
+                # Edits since the last version were all undone
+                self._db.execute("DELETE FROM note_versions WHERE note_id = ? AND version = ?",
+                                 (note_id, version))
+                version -= 1
+            else:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO note_versions (note_id, version, saved, delta, compressed)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (note_id, version, saved) + pack_delta(position, base[position:position + deleted], inserted))
+            self._db.execute("UPDATE notes SET body = ?, version = ?, updated = ? WHERE id = ?",
+                             (text, version, when, note_id))
+        return version
+
+    # ===== History =====
+    def versions(self, note_id):
+        """Every version of a note, newest first, with characters added/removed."""
+        rows = self._db.execute(
+            "SELECT version, saved, delta, compressed FROM note_versions WHERE note_id = ? ORDER BY version DESC",
+            (note_id,)).fetchall()
+        history = []
+        for version, saved, payload, compressed in rows:
+            _, removed, inserted = unpack_delta(payload, compressed)
+            history.append(NoteVersion(version, saved, len(inserted), len(removed)))
+        return history
+
+    def text_at(self, note_id, version):
+        """Rebuild the note as it was at `version`."""
+        text = self.body(note_id)
+        if text is None:
+            raise KeyError(note_id)
+        rows = self._db.execute(
+            "SELECT delta, compressed FROM note_versions WHERE note_id = ? AND version > ? ORDER BY version DESC",
+            (note_id, version))
+        for payload, compressed in rows:
+            text = undo_delta(text, *unpack_delta(payload, compressed))
+        return text
+
+    def restore(self, note_id, version):
+        """Bring back an old version as a new version, keeping everything after it."""
+        return self.save(note_id, self.text_at(note_id, version), new_version=True)
+
+    def stored_bytes(self, note_id=None):
+        where, params = ("WHERE note_id = ?", (note_id,)) if note_id is not None else ("", ())
+        return self._db.execute(f"SELECT COALESCE(SUM(LENGTH(delta)), 0) FROM note_versions {where}",
+                                params).fetchone()[0]
+
+    # ===== Search =====
+    def search(self, query, since=None, limit=50):
+        """Notes matching every word of `query` (prefix match), best first."""
+        words = query.split()
+        if not words:
+            return []
+        since = since if since is not None else 0
+        if self.full_text:
+            match = fts_query(query)
+            if not match:
+                return []
+            rows = self._db.execute(
+                "SELECT notes.id, notes.title, notes.updated,"
+                f" snippet(notes_fts, 1, '[', ']', '…', {SNIPPET_WORDS})"
+                " FROM notes_fts JOIN notes ON notes.id = notes_fts.rowid"
+                " WHERE notes_fts MATCH ? AND notes.updated >= ?"
+                " ORDER BY bm25(notes_fts, 5.0, 1.0) LIMIT ?",
+                (match, since, limit)).fetchall()
+        else:
+            where = " AND ".join("(title || ' ' || body) LIKE ? ESCAPE '\\'" for _ in words)
+            rows = self._db.execute(
+                f"SELECT id, title, updated, substr(body, 1, 120) FROM notes"
+                f" WHERE {where} AND updated >= ? ORDER BY updated DESC LIMIT ?",
+                [like_pattern(word) for word in words] + [since, limit]).fetchall()
+        return [NoteMatch(*row) for row in rows]
+
+
+# ===== Shared Instance =====
+_store = None
+_store_lock = threading.Lock()
+
+def get_notes_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = NotesStore()
+        return _store
@@ -54,17 +54,142 @@
 # Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
 # ==============================================================================
 
-import os
-import json
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QPushButton
-from PySide6.QtCore import Qt
+import time
+import datetime
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton, QApplication, QComboBox, QLineEdit,
+    QListWidget, QListWidgetItem, QDialog, QMessageBox
+)
+from PySide6.QtCore import Qt, QObject, QTimer, QEvent, Signal
 
-# Path to save the notes JSON file
+from lib.notes_journal import NoteJournal, SAVE_DEBOUNCE_MS, MAX_SAVE_DELAY_MS
+from lib.notes_store import get_notes_store, shift_title
+
+# Working copy of the open note: snapshot plus the journal of edits since it was written
 NOTES_FILE = './config/quick_notes.json'
+NOTES_JOURNAL = './config/quick_notes.journal'
+
+COMMIT_INTERVAL_MS = 60000     # how often the working copy is versioned into the notes store
+SEARCH_SCOPES = (("Any time", None), ("Last 7 days", 7), ("Last 30 days", 30))
+
+class NotesAutosaver(QObject):
+    """Coalesces edits into one journal append per pause in typing.
+
+    Saves fire SAVE_DEBOUNCE_MS after the last keystroke, or after
+    MAX_SAVE_DELAY_MS of continuous typing. The working copy is committed to
+    the versioned notes store every COMMIT_INTERVAL_MS and whenever the
+    widget is hidden, another note is opened, or the app quits.
+    """
+
+    note_opened = Signal(int)
+
+    def __init__(self, text_edit, journal, store, parent=None):
+        super().__init__(parent)
+        self.text_edit = text_edit
+        self.journal = journal
+        self.store = store
+        self._pending_since = None
+        self._last_commit = time.monotonic()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.save)
+
+        text_edit.textChanged.connect(self.schedule)
+
+    @property
+    def note_id(self):
+        return self.journal.meta.get("note_id")
+
+    def schedule(self):
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        waited_ms = (now - self._pending_since) * 1000
+        self._timer.start(max(0, min(SAVE_DEBOUNCE_MS, MAX_SAVE_DELAY_MS - waited_ms)))
+
+    def save(self):
+        self._timer.stop()
+        self._pending_since = None
+        try:
+            self.journal.save(self.text_edit.toPlainText())
+        except OSError as e:
+            print(f"[NOTES] Autosave failed: {e}")
+        if (time.monotonic() - self._last_commit) * 1000 >= COMMIT_INTERVAL_MS:
+            self.commit()
+
+    def commit(self, new_version=False):
+        self._last_commit = time.monotonic()
+        if self.note_id is None:
+            return
+        self.store.save(self.note_id, self.journal.text, new_version=new_version)
+        if self.journal.journal_entries:
+            try:
+                self.journal.compact()
+            except OSError as e:
+                print(f"[NOTES] Compaction failed: {e}")
+
+    def flush(self):
+        self.save()
+        self.commit()
+
+    def resume(self):
+        """Reopen the note being edited last time, versioning any text recovered from the journal."""
+        text = self.journal.text
+        note_id = self.note_id
+        if note_id is None or self.store.get(note_id) is None:
+            # Working copy from before notes were versioned (or a lost database)
+            title = "Imported Notes" if text.strip() else shift_title()
+            note_id = self.store.find_by_title(title) if not text.strip() else None
+            if note_id is None:
+                note_id = self.store.create(title, text)
+            self.journal.meta = {"note_id": note_id}
+        self.commit()
+        self.load_note(note_id)
+
+    def open_note(self, note_id):
+        if note_id != self.note_id:
+            self.flush()
+            self.load_note(note_id)
+
+    def open_shift_note(self):
+        title = shift_title()
+        note_id = self.store.find_by_title(title)
+        if note_id is None:
+            self.flush()
+            note_id = self.store.create(title)
+        self.open_note(note_id)
+
+    def load_note(self, note_id):
+        """Make `note_id` the working copy, replacing whatever the editor holds."""
+        self._timer.stop()
+        self._pending_since = None
+        self.journal.text = self.store.body(note_id) or ""
+        self.journal.meta = {"note_id": note_id}
+        self.journal.compact()
+        self.text_edit.blockSignals(True)
+        self.text_edit.setPlainText(self.journal.text)
+        self.text_edit.blockSignals(False)
+        self.note_opened.emit(note_id)
+
+    def clear(self):
+        # Kept as a version of its own, so a clear can be undone from History
+        self.flush()
+        self.text_edit.blockSignals(True)
+        self.text_edit.clear()
+        self.text_edit.blockSignals(False)
+        self.journal.save("")
+        self.commit(new_version=True)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Hide:
+            self.flush()
+        return False
 
 def get_quick_notes_widget(parent=None):
     widget = QWidget()
     layout = QVBoxLayout()
+    store = get_notes_store()
 
     # Title Label
     title = QLabel("Notes")
@@ -72,6 +197,34 @@ def get_quick_notes_widget(parent=None):
     title.setObjectName("QuickNotesTitle")
     layout.addWidget(title)
 
+    # Note picker
+    note_bar = QHBoxLayout()
+    note_combo = QComboBox()
+    note_combo.setMinimumWidth(200)
+    shift_button = QPushButton("Current Shift")
+    history_button = QPushButton("History")
+    note_bar.addWidget(note_combo, 1)
+    note_bar.addWidget(shift_button)
+    note_bar.addWidget(history_button)
+    layout.addLayout(note_bar)
+
+    # Search
+    search_bar = QHBoxLayout()
+    search_input = QLineEdit()
+    search_input.setPlaceholderText("Search all notes...")
+    search_input.setClearButtonEnabled(True)
+    scope_combo = QComboBox()
+    for label, days in SEARCH_SCOPES:
+        scope_combo.addItem(label, days)
+    search_bar.addWidget(search_input, 1)
+    search_bar.addWidget(scope_combo)
+    layout.addLayout(search_bar)
+
+    results = QListWidget()
+    results.setWordWrap(True)
+    results.hide()
+    layout.addWidget(results)
+
     # Text Area
     text_edit = QTextEdit()
     text_edit.setPlaceholderText("Start typing your notes here...")
@@ -79,30 +232,125 @@ def get_quick_notes_widget(parent=None):
 
     # Clear Button
     clear_button = QPushButton("Clear Notes")
+    clear_button.setToolTip("Empties the note; the previous text stays in History")
     layout.addWidget(clear_button)
 
     widget.setLayout(layout)
 
-    # Load existing note if available
-    if os.path.exists(NOTES_FILE):
-        with open(NOTES_FILE, 'r') as file:
-            data = json.load(file)
-            text_edit.setPlainText(data.get("note", ""))
+    # Load the working copy, replaying any edits journaled before a crash
+    journal = NoteJournal(NOTES_FILE, NOTES_JOURNAL)
+    try:
+        journal.load()
+    except OSError as e:
+        print(f"[NOTES] Could not load notes: {e}")
+
+    # Debounced autosave, flushed on hide/quit
+    autosaver = NotesAutosaver(text_edit, journal, store, widget)
+    widget.installEventFilter(autosaver)
+    app = QApplication.instance()
+    if app is not None:
+        app.aboutToQuit.connect(autosaver.flush)
+
+    def populate_notes(note_id):
+        note_combo.blockSignals(True)
+        note_combo.clear()
+        for note in store.notes():
+            note_combo.addItem(note.title, note.id)
+        note_combo.setCurrentIndex(max(0, note_combo.findData(note_id)))
+        note_combo.blockSignals(False)
 
-    # Autosave on text change
-    text_edit.textChanged.connect(lambda: autosave_notes(text_edit.toPlainText()))
+    def run_search():
+        query = search_input.text().strip()
+        results.clear()
+        results.setVisible(bool(query))
+        if not query:
+            return
+        days = scope_combo.currentData()
+        since = time.time() - days * 86400 if days else None
+        for match in store.search(query, since=since):
+            updated = datetime.datetime.fromtimestamp(match.updated).strftime("%m/%d %H:%M")
+            snippet = " ".join(match.snippet.split())
+            item = QListWidgetItem(f"{match.title}  ({updated})\n{snippet}")
+            item.setData(Qt.UserRole, match.id)
+            results.addItem(item)
+        if not results.count():
+            results.addItem("No matching notes")
+
+    def open_result(item):
+        note_id = item.data(Qt.UserRole)
+        if note_id is not None:
+            search_input.clear()
+            autosaver.open_note(note_id)
+
+    autosaver.note_opened.connect(populate_notes)
+    note_combo.activated.connect(lambda index: autosaver.open_note(note_combo.itemData(index)))
+    shift_button.clicked.connect(autosaver.open_shift_note)
+    history_button.clicked.connect(lambda: open_history_dialog(widget, autosaver))
+    search_input.textChanged.connect(run_search)
+    scope_combo.currentIndexChanged.connect(run_search)
+    results.itemClicked.connect(open_result)
 
     # Clear button functionality
-    clear_button.clicked.connect(lambda: clear_notes(text_edit))
+    clear_button.clicked.connect(autosaver.clear)
 
+    autosaver.resume()
     return widget
 
-def autosave_notes(content):
-    data = {"note": content}
-    with open(NOTES_FILE, 'w') as file:
-        json.dump(data, file)
+def open_history_dialog(parent_widget, autosaver):
+    autosaver.flush()
+    store = autosaver.store
+    note_id = autosaver.note_id
+    note = store.get(note_id)
+    if note is None:
+        return
+
+    dialog = QDialog(parent_widget)
+    dialog.setWindowTitle(f"History - {note.title}")
+    dialog.resize(640, 480)
+    layout = QVBoxLayout(dialog)
+
+    versions = QListWidget()
+    for version in store.versions(note_id):
+        saved = datetime.datetime.fromtimestamp(version.saved).strftime("%m/%d/%Y %H:%M")
+        item = QListWidgetItem(f"Version {version.version}  {saved}  +{version.added} / -{version.removed} chars")
+        item.setData(Qt.UserRole, version.version)
+        versions.addItem(item)
+    layout.addWidget(versions, 1)
+
+    preview = QTextEdit()
+    preview.setReadOnly(True)
+    layout.addWidget(preview, 2)
+
+    buttons = QHBoxLayout()
+    restore_button = QPushButton("Restore This Version")
+    restore_button.setEnabled(False)
+    close_button = QPushButton("Close")
+    buttons.addStretch()
+    buttons.addWidget(restore_button)
+    buttons.addWidget(close_button)
+    layout.addLayout(buttons)
+
+    def show_version(row):
+        item = versions.item(row)
+        restore_button.setEnabled(row > 0)
+        preview.setPlainText(store.text_at(note_id, item.data(Qt.UserRole)) if item else "")
+
+    def restore():
+        item = versions.currentItem()
+        if item is None:
+            return
+        version = item.data(Qt.UserRole)
+        if QMessageBox.question(dialog, "Restore Version",
+                                f"Replace the current text with version {version}?\n"
+                                "The current text stays in History.") != QMessageBox.Yes:
+            return
+        store.restore(note_id, version)
+        autosaver.load_note(note_id)
+        dialog.accept()
 
-def clear_notes(text_edit):
-    text_edit.clear()
-    if os.path.exists(NOTES_FILE):
-        os.remove(NOTES_FILE)
+    versions.currentRowChanged.connect(show_version)
+    restore_button.clicked.connect(restore)
+    close_button.clicked.connect(dialog.reject)
+    if versions.count():
+        versions.setCurrentRow(0)
+    dialog.exec()
@@ -76,8 +76,18 @@ def open_settings(main_window):
     theme_toggle.setChecked(is_dark)
     theme_toggle.stateChanged.connect(lambda: toggle_theme(config, current_user, theme_toggle.isChecked(), main_window))
 
+    history_toggle = QCheckBox("Record Clipboard History")
+    history_toggle.setChecked(config.getboolean(current_user, 'clipboard_history', fallback=False))
+    history_toggle.stateChanged.connect(lambda: toggle_clipboard_history(config, current_user, history_toggle.isChecked(), main_window))
+
     layout.addWidget(QLabel(f"User: {current_user}"))
     layout.addWidget(theme_toggle)
+    layout.addWidget(history_toggle)
+
+    expansion_toggle = QCheckBox("Expand Snippet Triggers (e.g. ;ems)")
+    expansion_toggle.setChecked(config.getboolean(current_user, 'snippet_expansion', fallback=False))
+    expansion_toggle.stateChanged.connect(lambda: toggle_snippet_expansion(config, current_user, expansion_toggle.isChecked(), main_window))
+    layout.addWidget(expansion_toggle)
 
     dialog.setLayout(layout)
     dialog.exec()
@@ -96,4 +106,32 @@ def toggle_theme(config, user, dark_mode_enabled, main_window):
     main_window.config.read('./config/settings.ini')
     main_window.setStyleSheet("")
     main_window.load_theme()
-    main_window.refresh_icons()
\ No newline at end of file
+    main_window.refresh_icons()
+
+def toggle_clipboard_history(config, user, enabled, main_window):
+    from lib.clipboard_history import set_clipboard_history_enabled
+
+    if user not in config:
+        config[user] = {}
+
+    config[user]['clipboard_history'] = "true" if enabled else "false"
+
+    with open('./config/settings.ini', 'w') as configfile:
+        config.write(configfile)
+
+    main_window.config.read('./config/settings.ini')
+    set_clipboard_history_enabled(enabled)
+
+def toggle_snippet_expansion(config, user, enabled, main_window):
+    from lib.text_expansion import set_snippet_expansion_enabled
+
+    if user not in config:
+        config[user] = {}
+
+    config[user]['snippet_expansion'] = "true" if enabled else "false"
+
+    with open('./config/settings.ini', 'w') as configfile:
+        config.write(configfile)
+
+    main_window.config.read('./config/settings.ini')
+    set_snippet_expansion_enabled(enabled)
@@ -58,10 +58,6 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QSizePolicy
 )
 from PySide6.QtCore import Qt
-from lib import medical_sitrep # type: ignore
-from lib.navex_sitrep_updated import get_navex_sitrep_main_widget # type: ignore
-from lib.weather_advisory import get_weather_advisory_widget # type: ignore
-from lib.general_sitrep import get_general_sitrep_widget # type: ignore
 
 def get_sitreps_menu_widget(parent=None):
     widget = QWidget()
@@ -101,28 +97,21 @@ def get_sitreps_menu_widget(parent=None):
 
 
 def handle_sitrep_selection(action_type, parent):
+    # Sitrep forms are imported on selection so opening the menu stays cheap.
+    # They are not cached: each selection starts a fresh report.
     if action_type == "Medical":
-        parent.clear_content_area()
-        parent.dynamic_layout.addWidget(medical_sitrep.get_medical_sitrep_widget())
-        parent.resize_with_animation(1050, 620)
+        from lib import medical_sitrep # type: ignore
+        parent.show_view("Sitrep:Medical", medical_sitrep.get_medical_sitrep_widget, (1050, 620), cache=False)
     elif action_type == "NAVEX":
         from lib import navex_sitrep_updated
-        # Clear previous widgets
-        while parent.dynamic_layout.count():
-            item = parent.dynamic_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        # Add the full interactive region selector view
-        parent.dynamic_layout.addWidget(navex_sitrep_updated.get_navex_sitrep_main_widget())
-        parent.resize_with_animation(500, 400)
+        # Full interactive region selector view
+        parent.show_view("Sitrep:NAVEX", navex_sitrep_updated.get_navex_sitrep_main_widget, (500, 400), cache=False)
     elif action_type == "Weather":
-        parent.clear_content_area()
-        parent.dynamic_layout.addWidget(get_weather_advisory_widget()) # type: ignore
-        parent.resize_with_animation(1050, 720)
+        from lib.weather_advisory import get_weather_advisory_widget # type: ignore
+        parent.show_view("Sitrep:Weather", get_weather_advisory_widget, (1050, 720), cache=False)
     elif action_type == "General":
-        parent.clear_content_area()
-        parent.dynamic_layout.addWidget(get_general_sitrep_widget())
-        parent.resize_with_animation(1050, 520)
+        from lib.general_sitrep import get_general_sitrep_widget # type: ignore
+        parent.show_view("Sitrep:General", get_general_sitrep_widget, (1050, 520), cache=False)
     else:
         from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(parent, "SitRep Selected", f"You selected: {action_type} SitRep")
\ No newline at end of file
@@ -0,0 +1,196 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import threading
+
+from PySide6.QtCore import QMimeData, QObject, QTimer, Signal, Qt
+from PySide6.QtGui import QGuiApplication
+
+from lib.clipboard_store import get_clipboard_store
+from lib.trigger_matcher import TriggerAutomaton, TriggerMatcher
+
+# Keys that move the caret or submit, so whatever was typed before no longer
+# sits directly in front of the cursor
+RESET_KEYS = {
+    "enter", "tab", "esc", "up", "down", "left", "right", "home", "end",
+    "page up", "page down", "delete", "ctrl", "left ctrl", "right ctrl", "alt", "alt gr",
+    "left windows", "right windows",
+}
+KEY_CHARS = {"space": " "}
+
+RESTORE_CLIPBOARD_MS = 400   # time the target app gets to read the pasted snippet
+
+
+def copy_clipboard():
+    """A detached copy of every format on the system clipboard (text, HTML, images, files)."""
+    saved = QMimeData()
+    source = QGuiApplication.clipboard().mimeData()
+    if source is None:
+        return saved
+    for mime_format in source.formats():
+        saved.setData(mime_format, source.data(mime_format))
+    # Images are often offered only as a native format that data() can't read back
+    if source.hasImage():
+        saved.setImageData(source.imageData())
+    return saved
+
+
+class SnippetExpander(QObject):
+    """Expands clip triggers typed in any application.
+
+    The keyboard hook thread only advances a TriggerMatcher (one dict lookup
+    per key). When a trigger completes, the expansion itself runs on the GUI
+    thread: the trigger is erased with backspaces and the clip is pasted
+    through the clipboard, which is then restored. The automaton is rebuilt
+    only when the set of triggers changes; content edits need no rebuild
+    because the clip is looked up by trigger at expansion time.
+    """
+
+    _triggered = Signal(str)
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.matcher = TriggerMatcher()
+        self.hook = None
+        self.expanding = False
+
+        self._triggered.connect(self.expand, Qt.QueuedConnection)
+        store.triggers_changed.connect(self.rebuild)
+        store.store_reset.connect(self.rebuild)
+        self.rebuild()
+
+    def rebuild(self):
+        # Rebuilt whole rather than patched: a new trigger character changes
+        # every state's transition row, and adding or removing a trigger moves
+        # failure links throughout. A rebuild costs about 1 ms per 100 triggers
+        # (benchmarks/snippet_expansion_bench.py) and runs only when a trigger
+        # is added, renamed or removed, never per keystroke.
+        self.matcher.set_automaton(TriggerAutomaton(self.store.triggers()))
+
+    # ===== Keyboard Hook =====
+    def start(self):
+        import keyboard
+        if self.hook is None:
+            self.hook = keyboard.on_press(self.on_key)
+
+    def stop(self):
+        import keyboard
+        if self.hook is not None:
+            keyboard.unhook(self.hook)
+            self.hook = None
+        self.matcher.reset()
+
+    def on_key(self, event):
+        # Runs on the keyboard hook thread: keep it to a few dict lookups
+        if self.expanding:
+            return
+        name = event.name
+        if not name:
+            return
+        if len(name) == 1 or name in KEY_CHARS:
+            trigger = self.matcher.feed(KEY_CHARS.get(name, name).lower())
+            if trigger is not None:
+                self.expanding = True
+                self._triggered.emit(trigger)
+        elif name == "backspace":
+            self.matcher.backspace()
+        elif name in RESET_KEYS:
+            self.matcher.reset()
+
+    # ===== Expansion =====
+    def expand(self, trigger):
+        import keyboard
+
+        clip_id = self.store.find_by_trigger(trigger)
+        clip = self.store.get(clip_id) if clip_id else None
+        if clip is None:
+            self.expanding = False
+            return
+
+        print(f"[EXPAND] {trigger} -> {clip.title or clip.id}")
+        for _ in trigger:
+            keyboard.send("backspace")
+
+        previous = copy_clipboard()
+        self.store.copy_to_system_clipboard(clip_id)
+        keyboard.send("ctrl+v")
+        QTimer.singleShot(RESTORE_CLIPBOARD_MS, lambda: self.finish(previous))
+
+    def finish(self, previous):
+        QGuiApplication.clipboard().setMimeData(previous)
+        self.matcher.reset()
+        self.expanding = False
+
+
+# ===== Shared Instance =====
+_expander = None
+_expander_lock = threading.Lock()
+
+def get_snippet_expander():
+    global _expander
+    with _expander_lock:
+        if _expander is None:
+            _expander = SnippetExpander(get_clipboard_store())
+        return _expander
+
+def set_snippet_expansion_enabled(enabled):
+    expander = get_snippet_expander()
+    if enabled:
+        expander.start()
+    else:
+        expander.stop()
+    return expander
@@ -0,0 +1,245 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import re
+import sys
+import bisect
+import unicodedata
+
+# Incremental word/prefix index shared by the in-app search boxes, the
+# contact directory search and caller lookup (no Qt). Every query word is
+# treated as a prefix, and a document matches when it contains a word
+# starting with each of them: "acc bad" finds "Access badge denied".
+#
+# Postings record, per document, a bit mask of where the word occurs (the
+# columns of a contact row, say), so a lookup can be limited to some of
+# them with a mask test. Callers with keys of their own (phone digits,
+# email addresses) index those directly with set_words().
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def fold(text):
+    """Lowercase and strip accents: "José" -> "jose"."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def words(text):
+    # Interned: the same names and words recur across thousands of documents
+    return [sys.intern(word) for word in TOKEN_RE.findall(fold(text))]
+
+
+def tokenize(text):
+    return set(words(text))
+
+
+class PrefixIndex:
+    """Inverted index from words to {document key: mask}.
+
+    Words are also kept in a sorted list, so a prefix lookup is a bisect
+    followed by a walk over just the words sharing that prefix. With
+    `short_prefix`, every word is also filed under its first few characters,
+    so the one- and two-letter queries typed first don't walk thousands of
+    words. Documents are re-indexed one at a time with set() / set_words(),
+    touching only the words that changed; bulk loads pass bulk=True and the
+    sorted list is rebuilt once, by sort() or the next prefix lookup.
+    """
+
+    def __init__(self, short_prefix=0):
+        self.short_prefix = short_prefix
+        self._postings = {}     # word -> {key: mask}
+        self._short = {}        # word[:short_prefix] -> {key: mask}
+        self._words = []        # sorted list of every indexed word
+        self._unsorted = False  # words added in bulk, not yet in _words
+        self._documents = {}    # key -> tuple of its words
+        self._prefix_cache = {}
+
+    def __len__(self):
+        return len(self._documents)
+
+    def __contains__(self, key):
+        return key in self._documents
+
+    # ===== Maintenance =====
+    def set(self, key, text):
+        self.set_words(key, dict.fromkeys(tokenize(text), 1))
+
+    def set_words(self, key, words, bulk=False):
+        """Index `key` under {word: mask}, replacing whatever it was indexed under before."""
+        if not words:
+            self.remove(key)
+            return
+        old = self._documents.get(key, ())
+        for word in old:
+            if word not in words:
+                self._discard(word, key)
+        for word, mask in words.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                if bulk or self._unsorted:
+                    self._unsorted = True
+                else:
+                    bisect.insort(self._words, word)
+            postings[key] = mask
+
+        if self.short_prefix:
+            size = self.short_prefix
+            short = {}
+            for word, mask in words.items():
+                short[word[:size]] = short.get(word[:size], 0) | mask
+            for prefix in {word[:size] for word in old}.difference(short):
+                self._discard_short(prefix, key)
+            for prefix, mask in short.items():
+                self._short.setdefault(prefix, {})[key] = mask
+
+        self._documents[key] = tuple(words)
+        self._prefix_cache.clear()
+
+    def remove(self, key):
+        old = self._documents.pop(key, None)
+        if old is None:
+            return
+        for word in old:
+            self._discard(word, key)
+        if self.short_prefix:
+            for prefix in {word[:self.short_prefix] for word in old}:
+                self._discard_short(prefix, key)
+        self._prefix_cache.clear()
+
+    def clear(self):
+        self.__init__(self.short_prefix)
+
+    def sort(self):
+        """Sort in the words added in bulk."""
+        if self._unsorted:
+            self._words = sorted(self._postings)
+            self._unsorted = False
+
+    def _discard(self, word, key):
+        postings = self._postings.get(word)
+        if postings is None:
+            return
+        postings.pop(key, None)
+        if not postings:
+            del self._postings[word]
+            if not self._unsorted:
+                # Unsorted, the next sort() leaves it out anyway
+                del self._words[bisect.bisect_left(self._words, word)]
+
+    def _discard_short(self, prefix, key):
+        ids = self._short.get(prefix)
+        if ids is not None:
+            ids.pop(key, None)
+            if not ids:
+                del self._short[prefix]
+
+    # ===== Lookups =====
+    def get(self, word):
+        """{key: mask} of the documents containing exactly `word`."""
+        return self._postings.get(word, {})
+
+    def words_starting_with(self, prefix):
+        """(word, {key: mask}) for every indexed word starting with `prefix`, in order."""
+        self.sort()
+        words, postings = self._words, self._postings
+        index = bisect.bisect_left(words, prefix)
+        while index < len(words) and words[index].startswith(prefix):
+            yield words[index], postings[words[index]]
+            index += 1
+
+    def prefix_matches(self, prefix, mask=None):
+        """Keys of documents containing a word that starts with `prefix` (where `mask` allows)."""
+        cached = self._prefix_cache.get((prefix, mask))
+        if cached is not None:
+            return cached
+
+        size = self.short_prefix
+        if size and len(prefix) == size:
+            groups = [self._short.get(prefix, {})]
+        elif size and len(prefix) < size:
+            groups = [ids for short, ids in self._short.items() if short.startswith(prefix)]
+        else:
+            groups = [ids for _, ids in self.words_starting_with(prefix)]
+
+        if mask is not None:
+            matches = {key for ids in groups for key, where in ids.items() if where & mask}
+        elif len(groups) == 1:
+            matches = groups[0].keys()
+        else:
+            matches = set().union(*groups)
+
+        if len(self._prefix_cache) > 256:
+            self._prefix_cache.clear()
+        self._prefix_cache[(prefix, mask)] = matches
+        return matches
+
+    def search(self, query):
+        """Keys matching every word of `query`, or None for an empty query."""
+        query_words = words(query)
+        if not query_words:
+            return None
+        result = None
+        # Longest words first: they are the most selective
+        for word in sorted(set(query_words), key=len, reverse=True):
+            matches = self.prefix_matches(word)
+            result = set(matches) if result is None else result & matches
+            if not result:
+                break
+        return result
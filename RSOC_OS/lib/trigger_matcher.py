@@ -0,0 +1,179 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+from collections import deque
+
+# Pure matching logic for snippet expansion (no Qt, no keyboard hook).
+# lib/text_expansion.py feeds it keystrokes from the global hook.
+
+
+class TriggerAutomaton:
+    """Aho-Corasick automaton over a set of trigger strings, compiled to a DFA.
+
+    Every state has a transition for every character that appears in some
+    trigger, so consuming a key is one dict lookup whatever the number of
+    triggers; characters outside that alphabet always lead back to the root.
+    `matches[state]` is the longest trigger ending at that state, if any.
+    """
+
+    def __init__(self, triggers=()):
+        self.triggers = frozenset(t for t in triggers if t)
+        self.max_length = max((len(t) for t in self.triggers), default=0)
+        self.delta = [{}]
+        self.matches = [None]
+        self._build()
+
+    def _build(self):
+        goto = [{}]
+        for trigger in self.triggers:
+            state = 0
+            for ch in trigger:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    self.matches.append(None)
+                state = next_state
+            self.matches[state] = trigger
+
+        alphabet = {ch for trigger in self.triggers for ch in trigger}
+        fail = [0] * len(goto)
+        self.delta = [None] * len(goto)
+        self.delta[0] = {ch: goto[0].get(ch, 0) for ch in alphabet}
+
+        # Breadth-first, so every state's failure target is finished before it
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            if self.matches[state] is None:
+                self.matches[state] = self.matches[fail[state]]
+            row = dict(self.delta[fail[state]])
+            for ch, child in goto[state].items():
+                fail[child] = self.delta[fail[state]][ch]
+                row[ch] = child
+                queue.append(child)
+            self.delta[state] = row
+
+    def step(self, state, ch):
+        return self.delta[state].get(ch, 0)
+
+
+class _MatchCursor:
+    """An automaton together with the state and buffer that only make sense for it."""
+
+    __slots__ = ("automaton", "buffer", "state")
+
+    def __init__(self, automaton):
+        self.automaton = automaton
+        self.buffer = deque(maxlen=max(automaton.max_length, 1))
+        self.state = 0
+
+
+class TriggerMatcher:
+    """Feeds keystrokes through a TriggerAutomaton with a small rolling buffer.
+
+    The buffer holds at most the longest trigger's length of characters so
+    backspace can be undone by replaying it. The automaton, state and buffer
+    live together in one cursor object, and set_automaton() swaps in a fresh
+    cursor with a single reference assignment. The hook thread works on the
+    cursor it picked up for the whole keystroke, so it never steps one
+    automaton with another's state; a keystroke racing a swap lands on the
+    discarded cursor and is simply forgotten.
+    """
+
+    def __init__(self, automaton=None):
+        self._cursor = _MatchCursor(automaton or TriggerAutomaton())
+
+    @property
+    def automaton(self):
+        return self._cursor.automaton
+
+    @property
+    def state(self):
+        return self._cursor.state
+
+    def set_automaton(self, automaton):
+        self._cursor = _MatchCursor(automaton)
+
+    def reset(self):
+        # In place: replacing the cursor here could undo a concurrent set_automaton()
+        cursor = self._cursor
+        cursor.buffer.clear()
+        cursor.state = 0
+
+    def feed(self, ch):
+        """Consume one typed character; returns the trigger just completed, or None."""
+        cursor = self._cursor
+        automaton = cursor.automaton
+        cursor.buffer.append(ch)
+        state = cursor.state = automaton.delta[cursor.state].get(ch, 0)
+        trigger = automaton.matches[state]
+        if trigger is not None:
+            cursor.buffer.clear()
+            cursor.state = 0
+        return trigger
+
+    def backspace(self):
+        cursor = self._cursor
+        if not cursor.buffer:
+            return
+        cursor.buffer.pop()
+        state = 0
+        delta = cursor.automaton.delta
+        for ch in cursor.buffer:
+            state = delta[state].get(ch, 0)
+        cursor.state = state
@@ -55,6 +55,8 @@
 # ==============================================================================
 
 import os
+import json
+import tempfile
 from PySide6.QtGui import QPixmap, QIcon, QColor, QPainter
 from PySide6.QtCore import Qt
 
@@ -76,3 +78,22 @@ def tint_icon(icon_path, color_hex):
     painter.end()
 
     return QIcon(tinted_pixmap)
+
+
+def atomic_write_json(path, data, indent=4):
+    """Write JSON to a temp file in the same folder, then swap it into place.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".json", dir=folder)
+    try:
+        with os.fdopen(fd, 'w') as file:
+            json.dump(data, file, indent=indent)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
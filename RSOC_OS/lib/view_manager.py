@@ -0,0 +1,198 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+from collections import OrderedDict
+
+from PySide6.QtWidgets import QStackedWidget, QWidget, QSizePolicy
+from PySide6.QtCore import QObject, Signal
+
+# ===== Defaults (overridable per user in settings.ini) =====
+DEFAULT_MAX_VIEWS = 6
+DEFAULT_MAX_MEMORY_MB = 400
+WIDGET_COST_MB = 0.05   # rough per-widget cost when a view gives no estimate
+
+
+def estimate_view_mb(widget):
+    """Rough resident cost of a view, based on how many widgets it owns."""
+    return 1 + len(widget.findChildren(QWidget)) * WIDGET_COST_MB
+
+
+class ViewManager(QObject):
+    """Keeps recently used tool views alive inside a QStackedWidget.
+
+    Cached views are switched to instantly instead of being rebuilt. Once the
+    cache holds more than `max_views` views or more than `max_memory_mb` of
+    estimated memory, the least recently used views are removed and deleted.
+    Views marked as pinned (e.g. the dashboard grid) are never evicted.
+
+    A view may define a `reset_state()` method; it is called whenever the view
+    is shown again from the cache with `reset=True`. Views that set the Qt
+    property "cacheable" to False (e.g. error placeholders) are never cached.
+    """
+
+    view_evicted = Signal(str)
+
+    def __init__(self, stack: QStackedWidget, max_views=DEFAULT_MAX_VIEWS, max_memory_mb=DEFAULT_MAX_MEMORY_MB):
+        super().__init__(stack)
+        self.stack = stack
+        self.max_views = max_views
+        self.max_memory_mb = max_memory_mb
+
+        self._views = OrderedDict()   # key -> (widget, estimated MB), most recent last
+        self._pinned = set()
+        self._transient = None        # uncached view currently on screen
+        self._parked = {}             # hidden widget -> (minimum size, size policy)
+
+    # ===== Navigation =====
+    def show(self, key, factory, cache=True, memory_mb=None, reset=False, pinned=False):
+        """Switch to the view for `key`, building it with `factory()` only on a cache miss."""
+        if key in self._views:
+            widget, _ = self._views[key]
+            self._views.move_to_end(key)
+            if reset and hasattr(widget, "reset_state"):
+                widget.reset_state()
+            self._set_current(widget)
+            return widget
+
+        widget = factory()
+        self.stack.addWidget(widget)
+        self._set_current(widget)
+
+        if cache and widget.property("cacheable") is not False:
+            cost = memory_mb if memory_mb is not None else estimate_view_mb(widget)
+            self._views[key] = (widget, cost)
+            if pinned:
+                self._pinned.add(key)
+            self._enforce_limits()
+        else:
+            self._transient = widget
+
+        return widget
+
+    def current_key(self):
+        current = self.stack.currentWidget()
+        for key, (widget, _) in self._views.items():
+            if widget is current:
+                return key
+        return None
+
+    def _set_current(self, widget):
+        previous = self._transient
+        for i in range(self.stack.count()):
+            other = self.stack.widget(i)
+            if other is not widget:
+                self._park(other)
+        self._unpark(widget)
+        self.stack.setCurrentWidget(widget)
+
+        if previous is not None and previous is not widget:
+            self._transient = None
+            self._dispose(previous)
+
+    # Hidden views would otherwise keep the stack (and window) at their minimum size
+    def _park(self, widget):
+        if widget in self._parked:
+            return
+        self._parked[widget] = (widget.minimumSize(), widget.sizePolicy())
+        widget.setMinimumSize(0, 0)
+        widget.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+
+    def _unpark(self, widget):
+        saved = self._parked.pop(widget, None)
+        if saved:
+            widget.setMinimumSize(saved[0])
+            widget.setSizePolicy(saved[1])
+
+    # ===== Eviction =====
+    def evict(self, key):
+        entry = self._views.get(key)
+        if entry is None:
+            return
+        widget, _ = entry
+        if self.stack.currentWidget() is widget:
+            return   # never pull the visible view out from under the operator
+
+        del self._views[key]
+        self._pinned.discard(key)
+        self._dispose(widget)
+        self.view_evicted.emit(key)
+
+    def evict_all(self):
+        for key in list(self._views):
+            if key not in self._pinned:
+                self.evict(key)
+
+    def cached_memory_mb(self):
+        return sum(cost for _, cost in self._views.values())
+
+    def cached_keys(self):
+        return list(self._views)
+
+    def _enforce_limits(self):
+        current = self.stack.currentWidget()
+        for key in list(self._views):
+            if len(self._views) <= self.max_views and self.cached_memory_mb() <= self.max_memory_mb:
+                break
+            widget, _ = self._views[key]
+            if key in self._pinned or widget is current:
+                continue
+            self.evict(key)
+
+    def _dispose(self, widget):
+        self._parked.pop(widget, None)
+        self.stack.removeWidget(widget)
+        widget.hide()
+        widget.deleteLater()
@@ -0,0 +1,109 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import datetime
+
+from lib.alert_rules import MonthlyRule, compile_rule
+
+# 2025-01-06 is a Monday
+MONDAY = datetime.datetime(2025, 1, 6)
+
+
+def at(day, hhmm):
+    hours, minutes = map(int, hhmm.split(":"))
+    return MONDAY + datetime.timedelta(days=day, hours=hours, minutes=minutes)
+
+
+def test_weekly_rule_wraps_to_next_week():
+    rule = compile_rule({"time": "09:00", "rule": {"kind": "daily", "days": [0]}})
+    assert rule.next_after(at(0, "08:59")) == at(0, "09:00")
+    # A fire exactly at `after` is not strictly after it
+    assert rule.next_after(at(0, "09:00")) == at(7, "09:00")
+    assert rule.next_after(at(6, "23:59")) == at(7, "09:00")
+
+
+def test_weekly_rule_repeats_until_end_of_window():
+    rule = compile_rule({"time": "16:00", "rule": {"kind": "daily", "days": [4], "every": 45, "until": "18:00"}})
+    fires, after = [], at(4, "00:00")
+    for _ in range(4):
+        after = rule.next_after(after)
+        fires.append(after)
+    assert fires == [at(4, "16:00"), at(4, "16:45"), at(4, "17:30"), at(11, "16:00")]
+
+
+def test_shift_crossing_midnight_belongs_to_its_start_day():
+    # Third shift on Sundays runs into Monday, the start of the next week
+    rule = compile_rule({"rule": {"kind": "shift", "shift": "Third", "days": [6], "every": 120}})
+    fires, after = [], at(6, "12:00")
+    for _ in range(5):
+        after = rule.next_after(after)
+        fires.append(after)
+    assert fires == [at(6, "22:00"), at(7, "00:00"), at(7, "02:00"), at(7, "04:00"), at(13, "22:00")]
+    assert rule.next_after(at(0, "01:00")) == at(0, "02:00")
+
+
+def test_monthly_rule_last_weekday_of_month():
+    rule = compile_rule({"time": "08:00", "rule": {"kind": "monthly", "nth": -1, "weekday": 4}})
+    assert rule.next_after(datetime.datetime(2025, 1, 15)) == datetime.datetime(2025, 1, 31, 8, 0)
+    assert rule.next_after(datetime.datetime(2025, 1, 31, 8, 0)) == datetime.datetime(2025, 2, 28, 8, 0)
+    assert rule.next_after(datetime.datetime(2025, 12, 26, 9, 0)) == datetime.datetime(2026, 1, 30, 8, 0)
+
+
+def test_monthly_rule_skips_months_without_the_nth_weekday():
+    # Fifth Monday: none in February 2025
+    rule = MonthlyRule(5, 0, 9 * 60)
+    assert rule.occurrence(2025, 2) is None
+    assert rule.next_after(datetime.datetime(2025, 2, 1)) == datetime.datetime(2025, 3, 31, 9, 0)
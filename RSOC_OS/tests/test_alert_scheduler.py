@@ -0,0 +1,133 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import datetime
+
+from lib.alert_scheduler import AlertQueue, SchedulerCore
+from lib.alert_simulation import MemoryAlertStore, VirtualClock, random_alerts, simulate
+
+START = datetime.datetime(2025, 1, 6, 8, 0)
+
+
+def make_core(*alerts):
+    fired = []
+    clock = VirtualClock(START)
+    core = SchedulerCore(MemoryAlertStore(list(alerts)), lambda alert, fire_at, now: fired.append(fire_at), clock)
+    core.reload()
+    return core, clock, fired
+
+
+def half_hourly(**extra):
+    return dict({"id": "a", "title": "Rounds", "time": "09:00", "repeat_interval": 30}, **extra)
+
+
+def test_late_fires_are_caught_up_once():
+    core, clock, fired = make_core(half_hourly())
+    assert core.next_deadline() == datetime.datetime(2025, 1, 6, 9, 0)
+
+    # Woken 40 minutes late: 09:00 fires once and the missed 09:30 is folded into it
+    clock.now = datetime.datetime(2025, 1, 6, 9, 40)
+    assert [alert["id"] for alert in core.process_due()] == ["a"]
+    assert fired == [datetime.datetime(2025, 1, 6, 9, 0)]
+    assert core.store.get("a")["last_triggered"] == "2025-01-06 09:40"
+    assert core.next_deadline() == datetime.datetime(2025, 1, 6, 10, 0)
+
+
+def test_fires_older_than_catch_up_window_are_skipped():
+    core, clock, fired = make_core(half_hourly())
+    clock.now = datetime.datetime(2025, 1, 6, 11, 40)
+    assert core.process_due() == []
+    assert fired == []
+    assert "last_triggered" not in core.store.get("a")
+    assert core.next_deadline() == datetime.datetime(2025, 1, 6, 12, 0)
+
+
+def test_one_time_alert_disables_itself():
+    core, clock, fired = make_core({"id": "once", "time": "08:30"})
+    clock.now = datetime.datetime(2025, 1, 6, 8, 30)
+    core.process_due()
+    assert core.store.get("once")["enabled"] is False
+    assert core.next_deadline() is None
+
+
+def test_removed_and_rescheduled_entries_are_dropped_lazily():
+    queue = AlertQueue()
+    queue.schedule("a", START + datetime.timedelta(minutes=1))
+    queue.schedule("b", START + datetime.timedelta(minutes=2))
+    queue.schedule("a", START + datetime.timedelta(minutes=3))
+    queue.remove("b")
+    assert len(queue) == 1 and "b" not in queue
+    assert len(queue._heap) == 3
+    assert queue.peek() == START + datetime.timedelta(minutes=3)
+    assert queue.pop_due(START + datetime.timedelta(minutes=2)) == []
+    assert queue.pop_due(START + datetime.timedelta(minutes=3)) == [("a", START + datetime.timedelta(minutes=3))]
+    assert queue.peek() is None and not queue._heap
+
+
+def test_cancelled_alert_does_not_fire():
+    core, clock, fired = make_core(half_hourly(), half_hourly(id="b", time="09:15"))
+    core.remove("a")
+    core.schedule_alert(dict(core.store.get("b"), enabled=False))
+    clock.now = datetime.datetime(2025, 1, 6, 9, 30)
+    assert core.process_due() == [] and fired == []
+    assert core.next_deadline() is None
+
+
+def test_week_of_random_rules_has_no_duplicates_or_misses():
+    start = datetime.datetime(2025, 1, 27)
+    report = simulate(random_alerts(30, seed=7), start, start + datetime.timedelta(days=7), latency=20)
+    assert report.fires
+    assert (report.duplicates, report.misses, report.unexpected) == ([], [], [])
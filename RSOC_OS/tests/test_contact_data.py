@@ -0,0 +1,142 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import os
+
+from conftest import contact_row
+from lib.contact_data import (
+    CACHE_CHUNK_ROWS, CONTACT_HEADERS, ContactTable, contact_name, diff_contacts, open_cache, write_cache
+)
+
+
+def row(first, last, company=""):
+    return contact_row({"First Name": first, "Last Name": last, "Company": company})
+
+
+OLD = {1: row("Ann", "Lee", "Volt"), 2: row("Bo", "Diaz", "Arc"), 3: row("Cy", "Ng", "Volt")}
+
+
+def test_unchanged_rows_keep_their_ids_in_any_order():
+    diff, contacts = diff_contacts(OLD, [OLD[3], OLD[1], OLD[2]], next_id=4)
+    assert diff == ([], [], [])
+    assert list(contacts) == [3, 1, 2]
+
+
+def test_edited_row_keeps_its_id_by_name():
+    edited = row("ann", "LEE ", "Flex")
+    diff, contacts = diff_contacts(OLD, [edited, OLD[2], OLD[3]], next_id=4)
+    assert diff.updated == [(1, edited)]
+    assert diff.added == [] and diff.removed == []
+    assert contacts[1] == edited
+
+
+def test_new_rows_get_fresh_ids_and_missing_rows_are_removed():
+    new = row("Di", "Park")
+    diff, contacts = diff_contacts(OLD, [OLD[1], new], next_id=7)
+    assert diff.added == [(7, new)]
+    assert sorted(diff.removed) == [2, 3]
+    assert list(contacts) == [1, 7]
+
+
+def test_duplicate_rows_each_keep_an_id():
+    old = {1: row("Ann", "Lee"), 2: row("Ann", "Lee")}
+    diff, contacts = diff_contacts(old, [row("Ann", "Lee"), row("Ann", "Lee", "Volt")], next_id=3)
+    assert sorted(contacts) == [1, 2]
+    assert len(diff.updated) == 1 and diff.added == [] and diff.removed == []
+
+
+def test_names_are_found_by_header_in_reordered_workbooks():
+    columns = ["Company", "Last Name", "Work Email", "First Name"]
+
+    def reordered(first, last, company):
+        return contact_row({"First Name": first, "Last Name": last, "Company": company}, columns)
+
+    old = {1: reordered("Ann", "Lee", "Volt"), 2: reordered("Bo", "Lee", "Volt")}
+    edited = reordered("Ann", "Lee", "Flex")
+    diff, contacts = diff_contacts(old, [edited, old[2]], next_id=3, columns=columns)
+    assert diff.updated == [(1, edited)] and diff.added == [] and diff.removed == []
+    assert contact_name(edited, columns) == "Ann Lee"
+    assert contact_name(["Volt", "", ""], ["Company", "First Name", "Last Name"]) == ""
+
+
+def test_cache_round_trip_across_chunks(tmp_path):
+    source = tmp_path / "contacts.xlsx"
+    source.write_bytes(b"workbook")
+    cache = str(tmp_path / "cache.pickle")
+    rows = [row(f"F{i}", f"L{i}") for i in range(CACHE_CHUNK_ROWS * 2 + 3)]
+    write_cache(cache, str(source), ContactTable(CONTACT_HEADERS, rows))
+
+    columns, cached_rows, count, stamp = open_cache(cache, str(source))
+    assert columns == CONTACT_HEADERS and count == len(rows)
+    assert list(cached_rows) == rows
+
+
+def test_cache_is_revalidated_against_the_workbook(tmp_path):
+    source = tmp_path / "contacts.xlsx"
+    source.write_bytes(b"workbook")
+    cache = str(tmp_path / "cache.pickle")
+    write_cache(cache, str(source), ContactTable(CONTACT_HEADERS, [row("Ann", "Lee")]))
+
+    # Touched but unchanged: still used, and re-stamped once read
+    info = os.stat(source)
+    os.utime(source, ns=(info.st_atime_ns, info.st_mtime_ns + 10**9))
+    _, cached_rows, _, stamp = open_cache(cache, str(source))
+    assert list(cached_rows) == [row("Ann", "Lee")]
+    assert stamp.mtime_ns == os.stat(source).st_mtime_ns
+
+    source.write_bytes(b"workbook, edited")
+    assert open_cache(cache, str(source)) is None
+    assert open_cache(str(tmp_path / "missing.pickle"), str(source)) is None
@@ -0,0 +1,117 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+from conftest import contact_row
+from lib.contact_data import CONTACT_HEADERS
+from lib.contact_lookup import ContactLookup, phone_digits, phone_keys, to_e164
+
+
+def row(work_phone="", work_email="", personal_phone="", personal_email=""):
+    return contact_row({"Work Phone": work_phone, "Work Email": work_email,
+                        "Personal Phone": personal_phone, "Personal Email": personal_email})
+
+
+def ids(matches):
+    return [match.contact_id for match in matches]
+
+
+def test_numbers_normalize_to_e164():
+    assert to_e164("(555) 123-4567") == "+15551234567"
+    assert to_e164("1-555-123-4567 ext. 12") == "+15551234567"
+    assert to_e164("+44 20 7946 0958") == "+442079460958"
+    assert phone_keys("555.123.4567") == ["15551234567", "5551234567"]
+
+
+def test_extension_only_value_is_kept():
+    assert phone_digits("x4567") == "4567"
+    assert phone_digits("ext. 4567") == "4567"
+    assert phone_digits("555-123-4567 x89") == "5551234567"
+
+    lookup = ContactLookup(CONTACT_HEADERS)
+    lookup.add(1, row(work_phone="x4567"))
+    lookup.add(2, row(work_phone="(555) 123-4567"))
+    matches = lookup.identify("4567")
+    assert ids(matches)[0] == 1 and matches[0].kind == "exact"
+    assert set(ids(matches)) == {1, 2}
+
+
+def test_lookup_follows_add_update_remove():
+    lookup = ContactLookup(CONTACT_HEADERS)
+    lookup.add_many([
+        (1, row(work_phone="(555) 123-4567", work_email="ann@volt.example.com")),
+        (2, row(personal_phone="+1 555 987 6543", work_email="bo@volt.example.com")),
+    ])
+    assert [(m.contact_id, m.field, m.kind) for m in lookup.identify("555-123-4567")] == [(1, "Work Phone", "exact")]
+    assert ids(lookup.identify("6543")) == [2]
+    assert lookup.identify("6543")[0].field == "Personal Phone"
+    assert ids(lookup.identify("555")) == [1, 2]
+    assert sorted(ids(lookup.identify("@volt.example.com"))) == [1, 2]
+    assert sorted(ids(lookup.identify("example.com"))) == [1, 2]
+
+    lookup.update(1, row(work_phone="(555) 000-1111", work_email="ann@arc.example.org"))
+    assert lookup.identify("1234567") == []
+    assert ids(lookup.identify("0001111")) == [1]
+    assert ids(lookup.identify("@volt.example.com")) == [2]
+
+    lookup.remove(2)
+    assert lookup.identify("6543") == []
+    assert lookup.identify("bo@volt.example.com") == []
+    assert lookup.identify("volt.example.com") == []
+    assert ids(lookup.identify("555")) == [1]
+
+    # Re-adding under the same ID after a removal
+    lookup.add(2, row(work_phone="x4567"))
+    assert ids(lookup.identify("4567")) == [2]
@@ -0,0 +1,132 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+from conftest import contact_row
+from lib.contact_data import CONTACT_HEADERS
+from lib.contact_search import ContactSearchIndex
+
+
+def row(first, last, company="", site="", phone=""):
+    return contact_row({"First Name": first, "Last Name": last, "Company": company,
+                        "Location/Site": site, "Work Phone": phone})
+
+
+def build(rows, bulk=True):
+    index = ContactSearchIndex(CONTACT_HEADERS)
+    if bulk:
+        index.add_many(rows.items())
+    else:
+        for contact_id, values in rows.items():
+            index.add(contact_id, values)
+    return index
+
+
+ROWS = {
+    1: row("Volta", "Reyes", "Volt", "Austin"),
+    2: row("Volt", "Becker", "Voltage", "Memphis"),
+    3: row("José", "Zhu", "Volt", "Memphis", "(555) 123-4567"),
+}
+
+
+def test_prefix_accent_and_phone_matches():
+    index = build(ROWS)
+    assert set(index.search("vol")) == {1, 2, 3}
+    assert index.search("jose zh") == [3]
+    assert index.search("5551234") == [3]
+    assert index.search("   ") is None
+    assert index.search("zzz") == []
+
+
+def test_scope_limits_matches_and_ranking():
+    index = build(ROWS)
+    assert index.search("site:mem") == [2, 3]
+    # Contact 2 is named Volt but doesn't work there: a prefix match, ranked last
+    assert index.search("company:volt") == [1, 3, 2]
+    assert index.search("volt") == [2, 1, 3]
+
+
+def test_ties_follow_workbook_positions():
+    index = build(ROWS)
+    assert index.search("mem", positions={3: 0, 2: 1, 1: 2}) == [3, 2]
+    assert index.search("v", rank_limit=0, positions={3: 0, 2: 1, 1: 2}) == [3, 2, 1]
+
+
+def test_add_update_remove_sequence():
+    index = build(ROWS, bulk=False)
+    index.update(2, row("Ursula", "Becker", "Arc", "Memphis"))
+    assert set(index.search("vol")) == {1, 3}
+    assert index.search("urs") == [2]
+
+    # Removing the only contact with a token must not break prefix scans over it
+    index.remove(2)
+    assert index.search("urs") == []
+    assert index.search("u") == []
+    assert index.search("becker") == []
+    assert set(index.search("mem")) == {3}
+    assert len(index) == 2
+
+    index.add(4, row("Ulla", "Ng", "Arc"))
+    assert index.search("u") == [4]
+    assert index.search("company:arc") == [4]
+
+
+def test_bulk_adds_are_searchable_before_sorting():
+    index = ContactSearchIndex(CONTACT_HEADERS)
+    index.add_many(ROWS.items(), sort=False)
+    index.add(9, row("Victor", "Ames"), bulk=True)
+    assert index.search("vic") == [9]
+    index.remove(9)
+    assert index.search("vic") == []
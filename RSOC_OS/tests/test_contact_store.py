@@ -0,0 +1,124 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import pytest
+
+from conftest import contact_row
+from lib.contact_data import CONTACT_HEADERS, diff_contacts
+from lib.contact_store import ContactStore
+
+
+def row(first, company="", site=""):
+    return contact_row({"First Name": first, "Company": company, "Location/Site": site})
+
+
+def test_rows_round_trip():
+    store = ContactStore(CONTACT_HEADERS, [(1, row("Ann", "Volt", "Austin")), (2, row("Bo", "Volt"))])
+    assert store[1] == row("Ann", "Volt", "Austin")
+    assert store.cell(2, CONTACT_HEADERS.index("Company")) == "Volt"
+    assert list(store) == [1, 2] and len(store) == 2
+    # Reads are fresh lists
+    store[1][0] = "changed"
+    assert store[1][0] == "Ann"
+
+
+def test_gaps_from_skipped_and_removed_ids():
+    store = ContactStore(CONTACT_HEADERS)
+    store[3] = row("Cy")
+    assert len(store) == 1 and list(store) == [3]
+    for missing in (0, 1, 2, 4, -1, None, "3"):
+        assert missing not in store
+    with pytest.raises(KeyError):
+        store[2]
+    with pytest.raises(KeyError):
+        store.cell(1, 0)
+
+    store[1] = row("Ann")
+    assert list(store) == [1, 3] and len(store) == 2
+
+    del store[3]
+    assert list(store) == [1] and len(store) == 1
+    with pytest.raises(KeyError):
+        del store[3]
+    assert store.pop(1) == row("Ann")
+    assert len(store) == 0 and list(store) == []
+
+    store[3] = row("Back")
+    assert store[3] == row("Back") and len(store) == 1
+
+
+def test_updates_and_encoded_columns():
+    store = ContactStore(CONTACT_HEADERS, [(1, row("Ann", "Volt", "Austin"))])
+    store[1] = row("Ann", "Arc", "")
+    assert store[1] == row("Ann", "Arc", "")
+    assert len(store) == 1
+
+
+def test_copy_is_a_snapshot():
+    store = ContactStore(CONTACT_HEADERS, [(1, row("Ann", "Volt"))])
+    snapshot = store.copy()
+    store[1] = row("Ann", "Arc")
+    store[2] = row("Bo")
+    del store[1]
+    assert snapshot[1] == row("Ann", "Volt")
+    assert list(snapshot) == [1]
+
+
+def test_diff_contacts_reads_a_store():
+    store = ContactStore(CONTACT_HEADERS, [(1, row("Ann")), (2, row("Bo"))])
+    diff, contacts = diff_contacts(store, [row("Bo"), row("Cy")], next_id=3)
+    assert diff.added == [(3, row("Cy"))] and diff.removed == [1]
+    assert list(contacts) == [2, 3]
@@ -0,0 +1,105 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+pytest.importorskip("PySide6.QtCore")
+
+from lib.contact_writer import ContactChange, apply_changes, merge_change
+
+COLUMNS = ["First Name", "Last Name", "Company"]
+
+
+def workbook(path, rows):
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.append(COLUMNS)
+    for values in rows:
+        sheet.append(values)
+    book.save(path)
+    return str(path)
+
+
+def test_merge_change_coalesces_and_cancels():
+    first = ContactChange(["A", "B", ""], ["A", "B", "Volt"])
+    second = ContactChange(["A", "B", "Volt"], ["A", "B", "Arc"])
+    assert merge_change(None, first) == first
+    assert merge_change(first, second) == ContactChange(["A", "B", ""], ["A", "B", "Arc"])
+    added = ContactChange(None, ["C", "D", ""])
+    assert merge_change(added, ContactChange(["C", "D", ""], None)) is None
+
+
+def test_apply_changes_patches_rows_by_content(tmp_path):
+    path = workbook(tmp_path / "contacts.xlsx", [["Ann", "Lee", "Volt"], ["Bo", "Diaz", "Arc"]])
+    changes = [
+        ContactChange(["Bo", "Diaz", "Arc"], ["Bo", "Diaz", "Flex"]),
+        ContactChange(["Ann", "Lee", "Volt"], None),
+        ContactChange(None, ["Cy", "Ng", "Volt"]),
+    ]
+    table, conflicts = apply_changes(path, COLUMNS, changes)
+    assert conflicts == []
+    assert table.rows == [["Bo", "Diaz", "Flex"], ["Cy", "Ng", "Volt"]]
+
+
+def test_apply_changes_reports_conflicts_and_keeps_their_edits(tmp_path):
+    # Someone else already changed Bo's company and removed Ann
+    path = workbook(tmp_path / "contacts.xlsx", [["Bo", "Diaz", "Theirs"]])
+    stale_edit = ContactChange(["Bo", "Diaz", "Arc"], ["Bo", "Diaz", "Mine"])
+    stale_delete = ContactChange(["Ann", "Lee", "Volt"], None)
+    table, conflicts = apply_changes(path, COLUMNS, [stale_edit, stale_delete])
+    assert conflicts == [stale_edit, stale_delete]
+    assert table.rows == [["Bo", "Diaz", "Theirs"]]
@@ -0,0 +1,103 @@
+# ==============================================================================
+# RSOC_OS — Operational Support Suite for the Flex Regional Security Operations Center
+#
+# Copyright (c) 2025 Morgan Small
+# All rights reserved.
+#
+# Permission is granted to current Flex RSOC personnel to use this software
+# solely for official operational support and task automation.
+#
+# Use of this suite is implicitly permitted only while Morgan Small is employed
+# within the Flex RSOC organizational structure. Should he be demoted,
+# terminated, or otherwise removed from the RSOC hierarchy in any way,
+# this implicit permission is revoked. Continued use of RSOC_OS following such
+# circumstances is prohibited unless explicitly authorized by the original author.
+#
+# This program is intended to assist RSOC operators and supervisors in completing
+# repetitive daily tasks efficiently and consistently. It is not designed to
+# replace human oversight or operator judgment. RSOC personnel are still required
+# to provide appropriate input, review outputs, and confirm that all
+# generated content is accurate and appropriate for operational use.
+#
+# Redistribution:
+# Redistribution, reproduction, or reuse of this software or any of its components
+# outside the Flex RSOC environment is strictly prohibited without explicit,
+# written permission from the author, Morgan Small.
+#
+# Attribution:
+# Any derivative works, extensions, or adaptations of this software must
+# include clear attribution to the original author, Morgan Small.
+#
+# External Dependencies:
+# This software relies on third-party packages. Compatibility with future versions
+# of those libraries is not guaranteed. It is the user's responsibility to maintain
+# a stable environment for proper functionality.
+#
+# Disclaimer of Warranty:
+# This software is provided "as is" without warranty of any kind, express or implied.
+# In no event shall the author be held liable for any damages or losses arising
+# from the use, misuse, or inability to use this software.
+#
+# Confidentiality:
+# Portions of this software may contain proprietary logic or access confidential
+# systems and workflows. Users are expected to treat the internal logic, file paths,
+# and associated data structures as confidential and not disclose them outside of
+# authorized RSOC personnel.
+#
+# Version Integrity:
+# Modifications to this software should be version-controlled and approved by the
+# original author. Unauthorized edits or forks may compromise the tool's intended
+# functionality and are strongly discouraged.
+#
+# Contact:
+# For support, feedback, or licensing inquiries, contact:
+# Morgan Small — morgan.small@flex.com OR jamiesmall0718@gmail.com
+# ==============================================================================
+
+from lib.notes_store import VERSION_INTERVAL, NotesStore
+
+
+def history(store, note_id):
+    return [(version.version, version.saved) for version in store.versions(note_id)]
+
+
+def test_steady_editing_cuts_a_version_every_interval():
+    store = NotesStore(None)
+    note_id = store.create("First Shift", when=0.0)
+    # One save a minute for an eight-hour shift
+    for minute in range(1, 481):
+        store.save(note_id, f"entry {minute}", when=minute * 60.0)
+
+    saved = [when for _, when in history(store, note_id)]
+    assert len(saved) == 480 * 60 // VERSION_INTERVAL + 1
+    assert saved[-1] == 0.0 and saved[-2] == 60.0
+    assert all(newer - older == VERSION_INTERVAL for newer, older in zip(saved, saved[1:-1]))
+    assert store.get(note_id).updated == 480 * 60.0
+    assert store.text_at(note_id, 2) == "entry 10"
+
+
+def test_saves_within_the_interval_amend_the_newest_version():
+    store = NotesStore(None)
+    note_id = store.create("Note", "a", when=0.0)
+    assert store.save(note_id, "ab", when=100.0) == 2
+    assert store.save(note_id, "abc", when=100.0 + VERSION_INTERVAL - 1) == 2
+    assert store.save(note_id, "abcd", when=100.0 + VERSION_INTERVAL) == 3
+    assert history(store, note_id) == [(3, 100.0 + VERSION_INTERVAL), (2, 100.0), (1, 0.0)]
+    assert [store.text_at(note_id, v) for v in (1, 2, 3)] == ["a", "abc", "abcd"]
+
+
+def test_undoing_every_edit_drops_the_amended_version():
+    store = NotesStore(None)
+    note_id = store.create("Note", "a", when=0.0)
+    store.save(note_id, "ab", when=VERSION_INTERVAL)
+    assert store.save(note_id, "a", when=VERSION_INTERVAL + 5) == 1
+    assert history(store, note_id) == [(1, 0.0)]
+
+
+def test_new_version_is_forced_by_restore():
+    store = NotesStore(None)
+    note_id = store.create("Note", "a", when=0.0)
+    store.save(note_id, "b", when=VERSION_INTERVAL)
+    store.save(note_id, "c", when=VERSION_INTERVAL + 1)
+    assert store.restore(note_id, 1) == 3
+    assert store.body(note_id) == "a" and store.text_at(note_id, 2) == "c"